@@ -18,6 +18,8 @@
 from game_window.enums.Paths import Paths
 from game_window.enums.PiecesEnum import PiecesEnum
 from game_window.moving.generation.data.Move import Move
+from game_window.moving.generation.data.MoveList import MoveList
+from game_window.moving.generation.data.MoveUtil import MoveUtil
 from game_window.Promoter import Promoter
 
 
@@ -204,11 +206,9 @@ def __paint_possible_moves_for_frozen_piece(self, board: Board) -> None:
                 break
             for col in range(BoardEnum.BOARD_LENGTH.value):
                 current_square = BoardEnum.BOARD_LENGTH.value * row + col
-                legal_moves = board.legal_moves()
+                legal_moves: MoveList = board.legal_moves()
 
                 for legal_move in legal_moves:
-                    if legal_move is None:
-                        break
                     if self.__is_it_frozen_piece_target_square(legal_move, current_square):
                         rectangle = QRect(current_x, current_y, self.__rect_width, self.__rect_height)
                         self.fillRect(rectangle, QColor(ColorManager.get_legal_move_color(row, col)))
@@ -227,16 +227,17 @@ def __is_it_frozen_piece(self) -> bool:
         """
         return self.__frozen_start != -1 and self.__frozen_end != -1
 
-    def __is_it_frozen_piece_target_square(self, legal_move: Move, current_square: int) -> bool:
+    def __is_it_frozen_piece_target_square(self, legal_move: int, current_square: int) -> bool:
         """
         Methods checks if current end_square is a valid move for a frozen piece_square
-        :param legal_move: current legal move instance
+        :param legal_move: current legal move encoded as int
         :param current_square: int index of current end_square
         :return: bool value
         """
-        if legal_move.get_end_square() != current_square or legal_move.get_moving_piece() != self.__frozen_piece:
+        if MoveUtil.get_end_square(legal_move) != current_square or \
+                MoveUtil.get_moving_piece(legal_move) != self.__frozen_piece:
             return False
-        return legal_move.get_start_square() == self.__frozen_start
+        return MoveUtil.get_start_square(legal_move) == self.__frozen_start
 
     def copy_current_move(self, move: Move) -> None:
         """
@@ -0,0 +1,89 @@
+from copy import deepcopy
+from typing import Optional
+
+from numpy import array
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import QThread
+
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.board.Board import Board
+from game_window.engine.Engine import Engine
+
+
+class EngineWorker(QThread):
+    """
+    Thread used to search engine moves outside of gui thread. Found move is posted back with move_found signal
+    together with id of the search, so results of cancelled searches can be ignored.
+    """
+
+    __slots__ = array(["__engine", "__board", "__search_id"], dtype=str)
+
+    move_found = pyqtSignal(int, int)
+
+    def __init__(self, engine: Engine) -> None:
+        super(EngineWorker, self).__init__()
+
+        if engine is None:
+            raise NullArgumentException("ENGINE CANNOT BE NULL!")
+        self.__engine: Engine = engine
+        self.__board: Optional[Board] = None
+        self.__search_id: int = 0
+
+    def start_search(self, board: Board) -> int:
+        """
+        Method used to start searching engine move on given board. Search works on a copy of the board, so gui can
+        still read and paint the board. If thread of previous search is still posting its result it is waited for.
+        :param board: Board instance
+        :return: int id of started search
+        """
+        if board is None:
+            raise NullArgumentException("BOARD CANNOT BE NULL!")
+        self.wait()
+        self.__board = deepcopy(board)
+        self.__search_id += 1
+        self.start()
+
+        return self.__search_id
+
+    def run(self) -> None:
+        """
+        Override method executed in the worker thread
+        :return: None
+        """
+        search_id: int = self.__search_id
+        board: Optional[Board] = self.__board
+
+        if board is None:
+            raise NullArgumentException("SEARCH HAS TO BE STARTED WITH BOARD!")
+        computer_move: int = self.__engine.get_computer_move(board)
+
+        self.move_found.emit(search_id, computer_move)
+
+    def cancel(self) -> None:
+        """
+        Method used to stop running search and wait for the thread to finish. Result of cancelled search
+        is marked as outdated.
+        :return: None
+        """
+        while self.isRunning():
+            self.__engine.stop_search()
+            self.wait(CANCEL_WAIT_MS)
+        self.__search_id += 1
+
+    def is_searching(self) -> bool:
+        """
+        Method used to check if engine is searching now
+        :return: bool
+        """
+        return self.isRunning()
+
+    def is_current_search(self, search_id: int) -> bool:
+        """
+        Method used to check if given search id belongs to the latest not cancelled search
+        :param search_id: int id of search
+        :return: bool
+        """
+        return search_id == self.__search_id
+
+
+CANCEL_WAIT_MS: int = 10
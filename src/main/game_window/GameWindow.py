@@ -4,6 +4,7 @@
 from playsound import playsound
 from PyQt5 import QtCore
 from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QCloseEvent
 from PyQt5.QtGui import QCursor
 from PyQt5.QtGui import QKeyEvent
 from PyQt5.QtGui import QMouseEvent
@@ -19,6 +20,7 @@
 from game_window.ColorManager import ColorManager
 from game_window.engine.Engine import Engine
 from game_window.engine.Evaluator import Evaluator
+from game_window.EngineWorker import EngineWorker
 from game_window.enums.CanvasEnum import CanvasEnum
 from game_window.enums.MoveEnum import MoveEnum
 from game_window.enums.Paths import Paths
@@ -28,6 +30,8 @@
 from game_window.init_factory.GameWindowFactory import GameWindowFactory
 from game_window.moving.EngineMover import EngineMover
 from game_window.moving.generation.data.Move import Move
+from game_window.moving.generation.data.MoveUtil import MoveUtil
+from game_window.moving.generation.data.MoveUtil import NO_MOVE
 from game_window.moving.generation.king_and_knights.KingUtil import KingUtil
 from game_window.moving.generation.MoveGenerator import MoveGenerator
 from game_window.moving.generation.pawns.PawnUtil import PawnUtil
@@ -41,7 +45,7 @@ class GameWindow(QWidget):
     """
 
     __slots__ = array(["__ui", "__canvas", "__moving_piece", "__current_move", "__promotion_util", "__board",
-                       "__engine"], dtype=str)
+                       "__engine", "__engine_worker"], dtype=str)
 
     keyPressed = QtCore.pyqtSignal(int)
 
@@ -54,6 +58,8 @@ def __init__(self, factory: GameWindowFactory) -> None:
         self.__moving_piece: int = MoveEnum.NONE.value
         self.__current_move: Move = factory.create_non_move()
         self.__promotion_util: Promoter = factory.create_promoter()
+        self.__engine_worker: EngineWorker = factory.create_engine_worker(self.__engine)
+        self.__engine_worker.move_found.connect(self.__make_engine_move)
 
         with open(Paths.GAME_WINDOW_CSS.value, "r", encoding="utf-8") as style:
             self.__ui: GameWindowUi = GameWindowUi(self)
@@ -76,6 +82,15 @@ def keyPressEvent(self, event: QKeyEvent) -> None:
         if event.key() == 16777220:
             print(self.__board.fen_string())
 
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """
+        Override method which stops engine search before window is closed
+        :param event: event of closing QWidget
+        :return: None
+        """
+        self.__engine_worker.cancel()
+        super(GameWindow, self).closeEvent(event)
+
     def paintEvent(self, event: QPaintEvent) -> None:
         """
         Override paintEvent method to paint on canvas.
@@ -97,7 +112,8 @@ def mousePressEvent(self, mouse_press_event: QMouseEvent) -> None:
         """
         row, col = self.__start_mouse_events(mouse_press_event)
 
-        if not self.__board.legal_moves() or self.__promotion_util.is_this_pawn_promoting():
+        if not self.__board.legal_moves() or self.__promotion_util.is_this_pawn_promoting() or \
+                self.__engine_worker.is_searching():
             return
 
         if MoveEnum.NONE.value in (row, col) or not self.__board.should_this_piece_move(row, col):
@@ -120,6 +136,8 @@ def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         :param event: event of mouse released on QWidget
         :return: None
         """
+        if self.__engine_worker.is_searching():
+            return
         row, col = self.__start_mouse_events(event)
         start_square: int = self.__current_move.get_start_square()
         end_square: int = self.__current_move.get_end_square()
@@ -155,9 +173,19 @@ def __update_board_data(self) -> None:
 
         if self.__promotion_util.is_this_pawn_promoting():
             return
-        computer_move: Move = self.__engine.get_computer_move(self.__board)
+        self.__engine_worker.start_search(self.__board)
 
-        if computer_move == Move(MoveEnum.NONE.value, MoveEnum.NONE.value, MoveEnum.NONE.value, MoveEnum.NONE.value):
+    def __make_engine_move(self, search_id: int, computer_move: int) -> None:
+        """
+        Slot receiving engine move found by EngineWorker. Moves of cancelled searches are ignored.
+        :param search_id: int id of search which found the move
+        :param computer_move: int encoded engine move
+        :return: None
+        """
+        if not self.__engine_worker.is_current_search(search_id):
+            return
+
+        if computer_move == NO_MOVE:
             QMessageBox.about(self, "GAME IS OVER!", "CHECK MATE!")
             return
         deleted_piece: int = EngineMover.update_board_with_engine_move(self.__board, computer_move)
@@ -166,7 +194,7 @@ def __update_board_data(self) -> None:
         self.__board.update_legal_moves(self.__board.player_color())
         self.__board.update_fen()
 
-        self.__current_move = computer_move
+        self.__current_move = MoveUtil.create_move(computer_move)
         self.update()
 
     def __start_mouse_events(self, mouse_event: QMouseEvent) -> Tuple[int, int]:
@@ -209,7 +237,7 @@ def __handle_pawn_special_events(self, color: int, piece_index: int, deleted_pie
         if PawnUtil.was_it_en_passant_move(self.__current_move, self.__board):
             MoveMakingUtil.make_en_passant_capture(self.__moving_piece, self.__board)
             deleted_piece = 1
-        self.__board.update_fen_data_with_double_pawn_movement(self.__current_move)
+        self.__board.update_fen_data_with_double_pawn_movement(self.__encode_current_move(SpecialFlags.NONE.value))
 
         return deleted_piece
 
@@ -227,7 +255,8 @@ def __handle_castling_event(self, final_piece_index: int, color: int) -> None:
 
         if KingUtil.is_it_castling(self.__current_move):
             self.__current_move.set_special_flag(SpecialFlags.CASTLING.value)
-            MoveMakingUtil.castle_king(self.__moving_piece, self.__current_move, self.__board)
+            MoveMakingUtil.castle_king(self.__moving_piece, self.__encode_current_move(SpecialFlags.CASTLING.value),
+                                       self.__board)
 
         elif piece == PiecesEnum.KING.value:
             self.__board.set_castling_king_side(False, color)
@@ -236,6 +265,15 @@ def __handle_castling_event(self, final_piece_index: int, color: int) -> None:
         else:
             self.__board.add_piece_to_the_board(self.__moving_piece, final_piece_index)
 
+    def __encode_current_move(self, special_flag: int) -> int:
+        """
+        Method used to encode current move of the player, so it can be passed to the move making methods
+        :param special_flag: int value of special flag of the move
+        :return: int encoded move
+        """
+        return MoveUtil.encode_move(self.__current_move.get_start_square(), self.__current_move.get_end_square(),
+                                    self.__current_move.get_moving_piece(), special_flag)
+
     def __check_quit_release_event_functions(self, start_square: int, row: int, col: int, end_square: int, x: int,
                                              y: int) -> bool:
         """
@@ -277,6 +315,7 @@ def __reset_game(self) -> None:
         Method used to reset the game state to the standard one
         :return: None
         """
+        self.__engine_worker.cancel()
         self.__board = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
         self.__current_move.set_start_square(MoveEnum.NONE.value, MoveEnum.NONE.value)
         self.__current_move.set_end_square(MoveEnum.NONE.value, MoveEnum.NONE.value)
@@ -287,6 +326,7 @@ def __switch_sides(self) -> None:
         Method used to switch sides of player and engine (colors)
         :return: None
         """
+        self.__engine_worker.cancel()
         self.__board.switch_sides()
         self.update()
         self.__update_board_data()
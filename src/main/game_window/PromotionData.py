@@ -55,7 +55,7 @@ def check_user_choice(self, rect_size: int, board: Board, x: int, y: int) -> Non
             return
         pieces = array([PiecesEnum.QUEEN.value, PiecesEnum.BISHOP.value, PiecesEnum.KNIGHT.value,
                         PiecesEnum.ROOK.value], dtype=int8)
-        board.board_array()[self.__square] = self.__piece_color | pieces[self.__get_rect_index(y, rect_size)]
+        board.set_piece_on_square(self.__square, self.__piece_color | pieces[self.__get_rect_index(y, rect_size)])
         board.update_fen()
         self.__is_promoting = False
 
@@ -0,0 +1,93 @@
+from typing import List
+
+from game_window.board.BitBoardUtil import BitBoardUtil
+from game_window.board.fen.FenFactory import FenFactory
+from game_window.board.GameBoard import GameBoard
+from game_window.ColorManager import ColorManager
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.moving.generation.Generator import Generator
+
+
+class BitBoard(GameBoard):
+    """
+    GameBoard which additionally keeps twelve 64-bit piece bitboards and occupancy masks of both colors. Bitboards are
+    updated on every square change and rebuilt from board array when whole position is replaced.
+    """
+    __slots__ = ("__pieces_bitboards", "__color_occupancies")
+
+    def __init__(self, fen_factory: FenFactory, generator: Generator) -> None:
+        self.__pieces_bitboards: List[int] = [0] * BITBOARDS_SIZE
+        self.__color_occupancies: List[int] = [0] * (PiecesEnum.BLACK.value + 1)
+        super(BitBoard, self).__init__(fen_factory, generator)
+        self.__update_bitboards()
+
+    def set_piece_on_square(self, square: int, piece: int) -> None:
+        """
+        Puts piece on given square without any validation or fen update. Used by move making and unmaking.
+        :param square: int index of square
+        :param piece: int value of piece (0 clears the square)
+        :return: None
+        """
+        square = int(square)
+        piece = int(piece)
+        removed_piece: int = int(self.board_array()[square])
+        square_mask: int = 1 << square
+
+        if removed_piece != PiecesEnum.NONE.value:
+            self.__pieces_bitboards[removed_piece] &= ~square_mask
+            self.__color_occupancies[ColorManager.get_piece_color(removed_piece)] &= ~square_mask
+        if piece != PiecesEnum.NONE.value:
+            self.__pieces_bitboards[piece] |= square_mask
+            self.__color_occupancies[ColorManager.get_piece_color(piece)] |= square_mask
+        super(BitBoard, self).set_piece_on_square(square, piece)
+
+    def switch_sides(self) -> None:
+        """
+        Method used to switch sides of board
+        :return: None
+        """
+        super(BitBoard, self).switch_sides()
+        self.__update_bitboards()
+
+    def load_fen(self, fen: str, engine_color: int) -> None:
+        """
+        Method used to set up position given as fen string
+        :param fen: str fen string
+        :param engine_color: int value of engine color which decides board orientation
+        :return: None
+        """
+        super(BitBoard, self).load_fen(fen, engine_color)
+        self.__update_bitboards()
+
+    def piece_bitboard(self, piece: int) -> int:
+        """
+        Gives access to bitboard of given colored piece
+        :param piece: int value of piece with color (color | piece)
+        :return: int bitboard
+        """
+        return self.__pieces_bitboards[piece]
+
+    def color_occupancy(self, color: int) -> int:
+        """
+        Gives access to occupancy bitboard of pieces of given color
+        :param color: int value of color
+        :return: int bitboard
+        """
+        return self.__color_occupancies[color]
+
+    def __update_bitboards(self) -> None:
+        """
+        Method used to recalculate pieces and color occupancy bitboards from board array
+        :return: None
+        """
+        self.__pieces_bitboards = BitBoardUtil.create_pieces_bitboards(self.board_array())
+
+        for color in (PiecesEnum.WHITE.value, PiecesEnum.BLACK.value):
+            occupancy: int = 0
+
+            for piece in PiecesEnum.PIECES_TUPLE.value[1:]:
+                occupancy |= self.__pieces_bitboards[color | piece]
+            self.__color_occupancies[color] = occupancy
+
+
+BITBOARDS_SIZE: int = PiecesEnum.BLACK.value + PiecesEnum.QUEEN.value + 1
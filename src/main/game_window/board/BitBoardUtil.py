@@ -0,0 +1,122 @@
+from typing import List
+
+from numpy import dtype
+from numpy import int8
+from numpy import ndarray
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.enums.BoardEnum import BoardEnum
+from game_window.enums.PiecesEnum import PiecesEnum
+
+
+class BitBoardUtil:
+    """
+    Util class containing methods to work on 64-bit integer bitboards
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def square_mask(square: int) -> int:
+        """
+        Method used to get a bitboard with only given square set
+        :param square: int index of square
+        :return: int bitboard
+        """
+        if square is None:
+            raise NullArgumentException("SQUARE CANNOT BE NULL!")
+        if square < 0 or square > 63:
+            raise IllegalArgumentException("SQUARE IS NOT WITHIN BOARD BOUNDS!")
+        return 1 << square
+
+    @staticmethod
+    def count_bits(bitboard: int) -> int:
+        """
+        Method used to count set bits of a bitboard
+        :param bitboard: int bitboard
+        :return: int number of set bits
+        """
+        return bitboard.bit_count()
+
+    @staticmethod
+    def get_least_significant_square(bitboard: int) -> int:
+        """
+        Method used to get index of the least significant set bit
+        :param bitboard: int bitboard
+        :return: int index of square or -1 if bitboard is empty
+        """
+        return (bitboard & -bitboard).bit_length() - 1
+
+    @staticmethod
+    def get_most_significant_square(bitboard: int) -> int:
+        """
+        Method used to get index of the most significant set bit
+        :param bitboard: int bitboard
+        :return: int index of square or -1 if bitboard is empty
+        """
+        return bitboard.bit_length() - 1
+
+    @staticmethod
+    def get_squares(bitboard: int) -> List[int]:
+        """
+        Method used to convert bitboard into a list of set squares indexes
+        :param bitboard: int bitboard
+        :return: list of square indexes in ascending order
+        """
+        squares: List[int] = []
+
+        while bitboard:
+            least_bit: int = bitboard & -bitboard
+            squares.append(least_bit.bit_length() - 1)
+            bitboard ^= least_bit
+        return squares
+
+    @staticmethod
+    def create_pieces_bitboards(board_array: ndarray[int, dtype[int8]]) -> List[int]:
+        """
+        Method used to create list of bitboards indexed by colored piece value
+        :param board_array: ndarray of board 1D
+        :return: list of bitboards where index is a piece value (color | piece)
+        """
+        if board_array is None:
+            raise NullArgumentException("BOARD ARRAY CANNOT BE NULL!")
+        bitboards: List[int] = [0] * (PiecesEnum.BLACK.value + PiecesEnum.QUEEN.value + 1)
+
+        for square in range(BoardEnum.BOARD_SIZE.value):
+            piece: int = int(board_array[square])
+
+            if piece != PiecesEnum.NONE.value:
+                bitboards[piece] |= 1 << square
+        return bitboards
+
+    @staticmethod
+    def count_pieces(board_array: ndarray[int, dtype[int8]]) -> List[int]:
+        """
+        Method used to count pieces of board array
+        :param board_array: ndarray of board 1D
+        :return: list of counts where index is a piece value (color | piece), index 0 counts empty squares
+        """
+        if board_array is None:
+            raise NullArgumentException("BOARD ARRAY CANNOT BE NULL!")
+        counts: List[int] = [0] * (PiecesEnum.BLACK.value + PiecesEnum.QUEEN.value + 1)
+
+        for square in range(BoardEnum.BOARD_SIZE.value):
+            counts[int(board_array[square])] += 1
+        return counts
+
+    @staticmethod
+    def create_occupancy_bitboard(board_array: ndarray[int, dtype[int8]]) -> int:
+        """
+        Method used to create occupancy bitboard of every piece on board array
+        :param board_array: ndarray of board 1D
+        :return: int bitboard
+        """
+        if board_array is None:
+            raise NullArgumentException("BOARD ARRAY CANNOT BE NULL!")
+        occupancy: int = 0
+
+        for square in range(BoardEnum.BOARD_SIZE.value):
+            if board_array[square] != PiecesEnum.NONE.value:
+                occupancy |= 1 << square
+        return occupancy
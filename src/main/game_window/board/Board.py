@@ -4,7 +4,9 @@
 
 from numpy import dtype
 from numpy import int8
+from numpy import int16
 from numpy import ndarray
+from numpy.typing import NDArray
 
 from game_window.moving.generation.data.Move import Move
 from game_window.moving.generation.data.MoveData import MoveData
@@ -21,7 +23,7 @@ class Board(ABC):
     @abstractmethod
     def delete_piece_from_board_square(self, square: int) -> int:
         """
-        Deletes piece_square from board and updates fen string.
+        Deletes piece_square from board.
         :param square:
         :return: deleted piece_square value
         """
@@ -30,13 +32,40 @@ def delete_piece_from_board_square(self, square: int) -> int:
     @abstractmethod
     def add_piece_to_the_board(self, piece: int, square: int) -> None:
         """
-        Adds piece_square to board array and updates fen string.
+        Adds piece_square to board array.
         :param piece: int value of piece_square
         :param square: int index of where to add a piece_square
         :return: None
         """
         pass
 
+    @abstractmethod
+    def set_piece_on_square(self, square: int, piece: int) -> None:
+        """
+        Puts piece on given square without any validation or fen update. Used by move making and unmaking.
+        :param square: int index of square
+        :param piece: int value of piece (0 clears the square)
+        :return: None
+        """
+        pass
+
+    @abstractmethod
+    def make_null_move(self) -> MoveData:
+        """
+        Passes the turn to the opponent without moving any piece. En passant possibility is removed.
+        :return: MoveData instance containing fen data before the null move
+        """
+        pass
+
+    @abstractmethod
+    def un_make_null_move(self, move_data: MoveData) -> None:
+        """
+        Takes back null move and restores fen data from before it
+        :param move_data: MoveData instance returned by make_null_move
+        :return: None
+        """
+        pass
+
     @abstractmethod
     def should_this_piece_move(self, row: int, col: int) -> bool:
         """
@@ -88,10 +117,27 @@ def board_array(self) -> ndarray[int, dtype[int8]]:
         """
         pass
 
+    @abstractmethod
+    def occupancy(self) -> int:
+        """
+        Gives access to occupancy bitboard of every piece on board
+        :return: int bitboard
+        """
+        pass
+
+    @abstractmethod
+    def piece_count(self, piece: int) -> int:
+        """
+        Gives access to number of given pieces on board. It is updated on every square change.
+        :param piece: int value of piece with color (color | piece)
+        :return: int count
+        """
+        pass
+
     @abstractmethod
     def fen_string(self) -> str:
         """
-        Gives access to the fen string.
+        Gives access to the fen string. It is built lazily, only if board changed since the last call.
         :return: fen string
         """
         pass
@@ -116,7 +162,7 @@ def is_it_legal_move(self, move: Move) -> bool:
     @abstractmethod
     def update_fen(self) -> None:
         """
-        Method used to update fen string with current board state
+        Method used to mark fen string as outdated. It is rebuilt with current board state on next access
         :return: None
         """
         pass
@@ -140,6 +186,16 @@ def switch_sides(self) -> None:
         """
         pass
 
+    @abstractmethod
+    def load_fen(self, fen: str, engine_color: int) -> None:
+        """
+        Method used to set up position given as fen string
+        :param fen: str fen string
+        :param engine_color: int value of engine color which decides board orientation
+        :return: None
+        """
+        pass
+
     @abstractmethod
     def engine_color(self) -> int:
         """
@@ -157,10 +213,10 @@ def player_color(self) -> int:
         pass
 
     @abstractmethod
-    def update_fen_data_with_double_pawn_movement(self, move: Move) -> None:
+    def update_fen_data_with_double_pawn_movement(self, move: int) -> None:
         """
         Method used to validate double pawn movement in terms of fen data
-        :param move: Move instance
+        :param move: int encoded move
         :return None
         """
         pass
@@ -281,3 +337,34 @@ def disable_castling_on_side(self, color: int, target_square: int) -> None:
         """
         pass
 
+    @abstractmethod
+    def zobrist_key(self) -> int:
+        """
+        Gives access to 64-bit Zobrist key of position (pieces, color to move, castling rights and en passant file)
+        :return: int 64-bit key
+        """
+        pass
+
+    @abstractmethod
+    def pawn_key(self) -> int:
+        """
+        Gives access to 64-bit Zobrist key of pawns placed on board
+        :return: int 64-bit key
+        """
+        pass
+
+    @abstractmethod
+    def material_score(self) -> int:
+        """
+        Gives access to running total of material and piece square points of engine pieces minus player pieces
+        :return: int score
+        """
+        pass
+
+    @abstractmethod
+    def piece_square_table(self) -> NDArray[int16]:
+        """
+        Gives access to piece square table of current board orientation
+        :return: int16 array indexed by color, piece value and square
+        """
+        pass
@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.enums.BoardEnum import BoardEnum
+from game_window.enums.MoveEnum import MoveEnum
+from game_window.moving.generation.data.MoveData import MoveData
+
+if TYPE_CHECKING:
+    from game_window.board.Board import Board
+
+
+@dataclass(slots=True, frozen=True)
+class BoardSnapshot:
+    """
+    Compact, picklable copy of board state: raw squares, orientation, color to move and special fen data. It is sent to
+    engine processes instead of the whole board with its generator and caches.
+    """
+    pieces: bytes
+    engine_color: int
+    color_to_move: int
+    special_move_data: Tuple[bool, bool, bool, bool, int, int, int, int]
+
+    @staticmethod
+    def create(board: 'Board') -> 'BoardSnapshot':
+        """
+        Method used to take snapshot of given board
+        :param board: Board instance
+        :return: BoardSnapshot instance
+        """
+        if board is None:
+            raise NullArgumentException("BOARD CANNOT BE NULL!")
+        pieces: bytes = bytes(int(piece) for piece in board.board_array())
+
+        return BoardSnapshot(pieces, board.engine_color(), board.color_to_move(), board.get_special_move_data())
+
+    def restore(self, board: 'Board') -> None:
+        """
+        Method used to set up position of snapshot on given board
+        :param board: Board instance
+        :return: None
+        """
+        if board is None:
+            raise NullArgumentException("BOARD CANNOT BE NULL!")
+        board.load_fen(BoardEnum.STARTING_POSITION.value, self.engine_color)
+
+        for square, piece in enumerate(self.pieces):
+            if board.board_array()[square] != piece:
+                board.set_piece_on_square(square, piece)
+        board.update_fen_data(MoveData(MoveEnum.NONE.value, *self.special_move_data))
+
+        if board.color_to_move() != self.color_to_move:
+            board.set_opposite_move_color()
+        board.update_legal_moves(self.color_to_move)
+
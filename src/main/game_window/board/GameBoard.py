@@ -1,24 +1,37 @@
+from typing import List
 from typing import Tuple
 
 from numpy import array
 from numpy import dtype
 from numpy import int8
+from numpy import int16
 from numpy import ndarray
+from numpy.typing import NDArray
 
 from exceptions.IllegalArgumentException import IllegalArgumentException
 from exceptions.NullArgumentException import NullArgumentException
+from game_window.board.BitBoardUtil import BitBoardUtil
 from game_window.board.Board import Board
 from game_window.board.BoardInitializer import BoardInitializer
 from game_window.board.BoardUtil import BoardUtil
 from game_window.board.fen.FenData import FenData
 from game_window.board.fen.FenFactory import FenFactory
+from game_window.board.fen.FenLoader import FenLoader
 from game_window.board.fen.FenMaker import FenMaker
+from game_window.board.ZobristUtil import COLOR_TO_MOVE_KEY
+from game_window.board.ZobristUtil import PAWNS_KEYS
+from game_window.board.ZobristUtil import PIECES_KEYS
+from game_window.board.ZobristUtil import ZobristUtil
 from game_window.ColorManager import ColorManager
+from game_window.engine.static_eval.MaterialEval import MaterialEval
+from game_window.engine.static_eval.PieceSquareTables import PieceSquareTables
 from game_window.enums.BoardEnum import BoardEnum
+from game_window.enums.MoveEnum import MoveEnum
 from game_window.enums.PiecesEnum import PiecesEnum
 from game_window.moving.generation.data.Move import Move
 from game_window.moving.generation.data.MoveData import MoveData
 from game_window.moving.generation.data.MoveList import MoveList
+from game_window.moving.generation.data.MoveUtil import MoveUtil
 from game_window.moving.generation.Generator import Generator
 
 
@@ -27,24 +40,37 @@ class GameBoard(Board):
     Class to hold and manage board representation.
     """
     __slots__ = array(["__board_array", "__fen_string", "__color_to_move", "__legal_moves", "__distances_to_borders",
-                       "__engine_color", "__player_color", "__fen_factory", "__generator"], dtype=str)
+                       "__engine_color", "__player_color", "__fen_factory", "__generator", "__occupancy",
+                       "__zobrist_key", "__pawn_key", "__piece_square_table", "__material_score", "__fen_dirty",
+                       "__piece_counts"], dtype=str)
 
     def __init__(self, fen_factory: FenFactory, generator: Generator) -> None:
         self.__engine_color: int = PiecesEnum.BLACK.value
         self.__player_color: int = PiecesEnum.WHITE.value
-        self.__fen_string: str = BoardEnum.STARTING_POSITION.value
+        self.__fen_string: str = ""
+        self.__fen_dirty: bool = True
         self.__fen_factory: FenFactory = fen_factory
         self.__color_to_move: int = PiecesEnum.WHITE.value
 
         self.__generator: Generator = generator
         self.__board_array: ndarray[int, dtype[int8]] = BoardInitializer.init_starting_board(self.__engine_color,
                                                                                              self.__player_color)
+        self.__occupancy: int = BitBoardUtil.create_occupancy_bitboard(self.__board_array)
+        self.__piece_counts: List[int] = BitBoardUtil.count_pieces(self.__board_array)
+        self.__zobrist_key: int = ZobristUtil.calculate_pieces_key(self.__board_array) ^ \
+            ZobristUtil.get_color_to_move_key(self.__color_to_move)
+        self.__pawn_key: int = ZobristUtil.calculate_pawns_key(self.__board_array)
+        self.__piece_square_table: NDArray[int16] = \
+            PieceSquareTables.create_piece_square_table(self.__engine_color)
+        self.__material_score: int = MaterialEval.calculate_material_score(self.__board_array,
+                                                                           self.__piece_square_table,
+                                                                           self.__engine_color)
         self.__distances_to_borders: ndarray[int, dtype[int8]] = BoardUtil.calculate_distance_to_borders()
         self.__legal_moves: MoveList = self.__generator.generate_legal_moves(self.__color_to_move, self)
 
     def delete_piece_from_board_square(self, square: int) -> int:
         """
-        Deletes piece_square from board and updates fen string.
+        Deletes piece_square from board.
         :param square:
         :return: deleted piece_square value
         """
@@ -54,14 +80,13 @@ def delete_piece_from_board_square(self, square: int) -> int:
             raise IllegalArgumentException("SQUARE CANNOT BE OVER THE BOUNDS OF BOARD!")
 
         piece: int = self.__board_array[square]
-        self.__board_array[square] = 0
-        self.update_fen()
+        self.set_piece_on_square(square, PiecesEnum.NONE.value)
 
         return piece
 
     def add_piece_to_the_board(self, piece: int, square: int) -> None:
         """
-        Adds piece_square to board array and updates fen string.
+        Adds piece_square to board array.
         :param piece: int value of piece_square
         :param square: int index of where to add a piece_square
         :return: None
@@ -75,8 +100,55 @@ def add_piece_to_the_board(self, piece: int, square: int) -> None:
         if piece_value not in PiecesEnum.PIECES_TUPLE.value:
             raise IllegalArgumentException("SUCH PIECE DOES NOT EXIST")
 
+        self.set_piece_on_square(square, piece)
+
+    def set_piece_on_square(self, square: int, piece: int) -> None:
+        """
+        Puts piece on given square without any validation or fen update. Used by move making and unmaking.
+        :param square: int index of square
+        :param piece: int value of piece (0 clears the square)
+        :return: None
+        """
+        square = int(square)
+        piece = int(piece)
+        square_mask: int = 1 << square
+
+        if piece == PiecesEnum.NONE.value:
+            self.__occupancy &= ~square_mask
+        else:
+            self.__occupancy |= square_mask
+        removed_piece: int = int(self.__board_array[square])
+        self.__piece_counts[removed_piece] -= 1
+        self.__piece_counts[piece] += 1
+        self.__zobrist_key ^= PIECES_KEYS[removed_piece][square] ^ PIECES_KEYS[piece][square]
+        self.__pawn_key ^= PAWNS_KEYS[removed_piece][square] ^ PAWNS_KEYS[piece][square]
+        self.__material_score += \
+            MaterialEval.get_piece_points(piece, square, self.__piece_square_table, self.__engine_color) - \
+            MaterialEval.get_piece_points(removed_piece, square, self.__piece_square_table, self.__engine_color)
         self.__board_array[square] = piece
-        self.update_fen()
+        self.__fen_dirty = True
+
+    def make_null_move(self) -> MoveData:
+        """
+        Passes the turn to the opponent without moving any piece. En passant possibility is removed.
+        :return: MoveData instance containing fen data before the null move
+        """
+        move_data: MoveData = MoveData(MoveEnum.NONE.value, *self.__fen_factory.get_special_move_data())
+        self.__fen_factory.clear_en_passant()
+        self.set_opposite_move_color()
+
+        return move_data
+
+    def un_make_null_move(self, move_data: MoveData) -> None:
+        """
+        Takes back null move and restores fen data from before it
+        :param move_data: MoveData instance returned by make_null_move
+        :return: None
+        """
+        if move_data is None:
+            raise NullArgumentException("MOVE DATA CANNOT BE NULL!")
+        self.__fen_factory.update_fen_data(move_data)
+        self.set_opposite_move_color()
 
     def should_this_piece_move(self, row: int, col: int) -> bool:
         """
@@ -109,6 +181,8 @@ def set_opposite_move_color(self) -> None:
         """
         self.__color_to_move = PiecesEnum.WHITE.value if self.__color_to_move == PiecesEnum.BLACK.value else\
             PiecesEnum.BLACK.value
+        self.__zobrist_key ^= COLOR_TO_MOVE_KEY
+        self.__fen_dirty = True
 
     def legal_moves(self) -> MoveList:
         """
@@ -131,11 +205,36 @@ def board_array(self) -> ndarray[int, dtype[int8]]:
         """
         return self.__board_array
 
+    def occupancy(self) -> int:
+        """
+        Gives access to occupancy bitboard of every piece on board
+        :return: int bitboard
+        """
+        return self.__occupancy
+
+    def piece_count(self, piece: int) -> int:
+        """
+        Gives access to number of given pieces on board. It is updated on every square change.
+        :param piece: int value of piece with color (color | piece)
+        :return: int count
+        """
+        return self.__piece_counts[piece]
+
+    def zobrist_key(self) -> int:
+        """
+        Gives access to 64-bit Zobrist key of position (pieces, color to move, castling rights and en passant file)
+        :return: int 64-bit key
+        """
+        return self.__zobrist_key ^ self.__fen_factory.zobrist_key()
+
     def fen_string(self) -> str:
         """
         Gives access to the fen string.
         :return: fen string
         """
+        if self.__fen_dirty:
+            self.__fen_string = self.__fen_factory.convert_board_array_to_fen(self)
+            self.__fen_dirty = False
         return self.__fen_string
 
     def color_to_move(self) -> int:
@@ -151,14 +250,17 @@ def is_it_legal_move(self, move: Move) -> bool:
         :param move: current move player wants to play
         :return: bool value whether move is legal or not
         """
-        return move in self.__legal_moves
+        for index in range(self.__legal_moves.size()):
+            if MoveUtil.is_the_same_move(self.__legal_moves[index], move):
+                return True
+        return False
 
     def update_fen(self) -> None:
         """
-        Method used to update fen string with current board state
+        Method used to mark fen string as outdated. It is rebuilt with current board state on next access
         :return: None
         """
-        self.__fen_string = self.__fen_factory.convert_board_array_to_fen(self)
+        self.__fen_dirty = True
 
     def disable_castling_if_captured_rook(self, deleted_piece: int, color: int, square: int) -> None:
         """
@@ -168,6 +270,7 @@ def disable_castling_if_captured_rook(self, deleted_piece: int, color: int, squa
         :param square: int index of rook square
         :return: None
         """
+        self.__fen_dirty = True
         self.__fen_factory.disable_castling_if_captured_rook(deleted_piece, color, square, self)
 
     def switch_sides(self) -> None:
@@ -178,8 +281,41 @@ def switch_sides(self) -> None:
         self.__engine_color = ColorManager.get_opposite_piece_color(self.__engine_color)
         self.__player_color = ColorManager.get_opposite_piece_color(self.__player_color)
         self.__board_array = BoardInitializer.init_starting_board(self.__engine_color, self.__player_color)
+        self.__occupancy = BitBoardUtil.create_occupancy_bitboard(self.__board_array)
+        self.__piece_counts = BitBoardUtil.count_pieces(self.__board_array)
         self.__fen_factory = FenMaker(FenData(self.__player_color))
         self.__color_to_move = PiecesEnum.WHITE.value
+        self.__zobrist_key = ZobristUtil.calculate_pieces_key(self.__board_array) ^ \
+            ZobristUtil.get_color_to_move_key(self.__color_to_move)
+        self.__pawn_key = ZobristUtil.calculate_pawns_key(self.__board_array)
+        self.__piece_square_table = PieceSquareTables.create_piece_square_table(self.__engine_color)
+        self.__material_score = MaterialEval.calculate_material_score(self.__board_array, self.__piece_square_table,
+                                                                      self.__engine_color)
+        self.update_fen()
+        self.update_legal_moves(self.__color_to_move)
+
+    def load_fen(self, fen: str, engine_color: int) -> None:
+        """
+        Method used to set up position given as fen string
+        :param fen: str fen string
+        :param engine_color: int value of engine color which decides board orientation
+        :return: None
+        """
+        board_array, color_to_move, fen_data = FenLoader.parse_fen(fen, engine_color)
+        self.__engine_color = engine_color
+        self.__player_color = ColorManager.get_opposite_piece_color(engine_color)
+        self.__board_array = board_array
+        self.__occupancy = BitBoardUtil.create_occupancy_bitboard(self.__board_array)
+        self.__piece_counts = BitBoardUtil.count_pieces(self.__board_array)
+        self.__fen_factory = FenMaker(FenData(self.__player_color))
+        self.__fen_factory.update_fen_data(fen_data)
+        self.__color_to_move = color_to_move
+        self.__zobrist_key = ZobristUtil.calculate_pieces_key(self.__board_array) ^ \
+            ZobristUtil.get_color_to_move_key(self.__color_to_move)
+        self.__pawn_key = ZobristUtil.calculate_pawns_key(self.__board_array)
+        self.__piece_square_table = PieceSquareTables.create_piece_square_table(self.__engine_color)
+        self.__material_score = MaterialEval.calculate_material_score(self.__board_array, self.__piece_square_table,
+                                                                      self.__engine_color)
         self.update_fen()
         self.update_legal_moves(self.__color_to_move)
 
@@ -197,12 +333,13 @@ def player_color(self) -> int:
         """
         return self.__player_color
 
-    def update_fen_data_with_double_pawn_movement(self, move: Move) -> None:
+    def update_fen_data_with_double_pawn_movement(self, move: int) -> None:
         """
         Method used to validate double pawn movement in terms of fen data
-        :param move: Move instance
+        :param move: int encoded move
         :return None
         """
+        self.__fen_dirty = True
         self.__fen_factory.update_fen_data_with_double_pawn_movement(move)
 
     def set_castling_king_side(self, can_castle: bool, color: int) -> None:
@@ -212,6 +349,7 @@ def set_castling_king_side(self, can_castle: bool, color: int) -> None:
         :param color: int value of color
         :return: None
         """
+        self.__fen_dirty = True
         self.__fen_factory.set_castling_king_side(can_castle, color)
 
     def set_castling_queen_side(self, can_castle: bool, color: int) -> None:
@@ -221,6 +359,7 @@ def set_castling_queen_side(self, can_castle: bool, color: int) -> None:
         :param color: int value of color
         :return: None
         """
+        self.__fen_dirty = True
         self.__fen_factory.set_castling_queen_side(can_castle, color)
 
     def en_passant_square(self) -> int:
@@ -242,6 +381,7 @@ def set_en_passant_piece_square(self, piece_square: int) -> None:
         Gives access to an en passant piece end_square value
         :return: int value of an en passant target square
         """
+        self.__fen_dirty = True
         self.__fen_factory.set_en_passant_piece_square(piece_square)
 
     def set_en_passant_square(self, square: int) -> None:
@@ -250,6 +390,7 @@ def set_en_passant_square(self, square: int) -> None:
         :param square: int value of end_square
         :return: None
         """
+        self.__fen_dirty = True
         self.__fen_factory.set_en_passant_square(square)
 
     def update_move_counter(self) -> None:
@@ -257,6 +398,7 @@ def update_move_counter(self) -> None:
         Increments move counter by 1
         :return: None
         """
+        self.__fen_dirty = True
         self.__fen_factory.update_move_counter()
 
     def can_king_castle_king_side(self, color: int) -> bool:
@@ -288,6 +430,7 @@ def update_fen_data(self, prev_fen_data: MoveData) -> None:
         :param prev_fen_data: MoveData instance
         :return: None
         """
+        self.__fen_dirty = True
         self.__fen_factory.update_fen_data(prev_fen_data)
 
     def update_no_sack_and_pawn_counter(self, deleted_piece: int, moving_piece: int) -> None:
@@ -297,6 +440,7 @@ def update_no_sack_and_pawn_counter(self, deleted_piece: int, moving_piece: int)
         :param moving_piece: int value of a moving piece
         :return: None
         """
+        self.__fen_dirty = True
         self.__fen_factory.update_no_sack_and_pawn_counter(deleted_piece, moving_piece)
 
     def disable_castling_on_side(self, color: int, target_square: int) -> None:
@@ -306,4 +450,26 @@ def disable_castling_on_side(self, color: int, target_square: int) -> None:
         :param color: int value of color
         :return: None
         """
+        self.__fen_dirty = True
         self.__fen_factory.disable_castling_on_side(color, target_square, self)
+
+    def pawn_key(self) -> int:
+        """
+        Gives access to 64-bit Zobrist key of pawns placed on board
+        :return: int 64-bit key
+        """
+        return self.__pawn_key
+
+    def material_score(self) -> int:
+        """
+        Gives access to running total of material and piece square points of engine pieces minus player pieces
+        :return: int score
+        """
+        return self.__material_score
+
+    def piece_square_table(self) -> NDArray[int16]:
+        """
+        Gives access to piece square table of current board orientation
+        :return: int16 array indexed by color, piece value and square
+        """
+        return self.__piece_square_table
@@ -0,0 +1,155 @@
+from random import Random
+from typing import List
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from numpy import dtype
+from numpy import int8
+from numpy import ndarray
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.enums.BoardEnum import BoardEnum
+from game_window.enums.MoveEnum import MoveEnum
+from game_window.enums.PiecesEnum import PiecesEnum
+
+if TYPE_CHECKING:
+    from game_window.board.Board import Board
+
+
+class ZobristUtil:
+    """
+    Util class containing 64-bit Zobrist keys of pieces, side to move, castling rights and en passant files.
+    Keys are generated from a fixed seed so hashes are the same between runs.
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def generate_pieces_keys(generator: Random) -> Tuple[Tuple[int, ...], ...]:
+        """
+        Generates random keys of every colored piece on every square
+        :param generator: Random instance
+        :return: tuple indexed by piece value (color | piece) of tuples indexed by square. Empty square keys are 0
+        """
+        if generator is None:
+            raise NullArgumentException("GENERATOR CANNOT BE NULL!")
+        pieces_keys: List[Tuple[int, ...]] = []
+
+        for piece in range(PiecesEnum.BLACK.value + PiecesEnum.QUEEN.value + 1):
+            if piece & (PiecesEnum.WHITE.value | PiecesEnum.BLACK.value) == 0:
+                pieces_keys.append((0,) * BoardEnum.BOARD_SIZE.value)
+                continue
+            pieces_keys.append(tuple(generator.getrandbits(64) for _ in range(BoardEnum.BOARD_SIZE.value)))
+        return tuple(pieces_keys)
+
+    @staticmethod
+    def calculate_pieces_key(board_array: ndarray[int, dtype[int8]]) -> int:
+        """
+        Calculates from scratch key of every piece placed on board
+        :param board_array: ndarray of board 1D
+        :return: int 64-bit key
+        """
+        if board_array is None:
+            raise NullArgumentException("BOARD ARRAY CANNOT BE NULL!")
+        key: int = 0
+
+        for square in range(BoardEnum.BOARD_SIZE.value):
+            key ^= PIECES_KEYS[int(board_array[square])][square]
+        return key
+
+    @staticmethod
+    def calculate_pawns_key(board_array: ndarray[int, dtype[int8]]) -> int:
+        """
+        Calculates from scratch key of pawns placed on board. Used by pawn hash table.
+        :param board_array: ndarray of board 1D
+        :return: int 64-bit key
+        """
+        if board_array is None:
+            raise NullArgumentException("BOARD ARRAY CANNOT BE NULL!")
+        key: int = 0
+
+        for square in range(BoardEnum.BOARD_SIZE.value):
+            key ^= PAWNS_KEYS[int(board_array[square])][square]
+        return key
+
+    @staticmethod
+    def calculate_castling_key(castling_rights: Tuple[bool, bool, bool, bool]) -> int:
+        """
+        Calculates key of castling rights
+        :param castling_rights: tuple of white king, white queen, black king and black queen side castling rights
+        :return: int 64-bit key
+        """
+        if castling_rights is None:
+            raise NullArgumentException("CASTLING RIGHTS CANNOT BE NULL!")
+        key: int = 0
+
+        for castling_key, can_castle in zip(CASTLING_KEYS, castling_rights):
+            if can_castle:
+                key ^= castling_key
+        return key
+
+    @staticmethod
+    def get_en_passant_key(en_passant_square: int) -> int:
+        """
+        Returns key of en passant file of given en passant square
+        :param en_passant_square: int index of en passant square or -1 if there is none
+        :return: int 64-bit key (0 if there is no en passant square)
+        """
+        if en_passant_square is None:
+            raise NullArgumentException("EN PASSANT SQUARE CANNOT BE NULL!")
+        if en_passant_square < MoveEnum.NONE_EN_PASSANT_SQUARE.value or en_passant_square > 63:
+            raise IllegalArgumentException("EN PASSANT SQUARE IS NOT WITHIN BOARD BOUNDS!")
+
+        if en_passant_square == MoveEnum.NONE_EN_PASSANT_SQUARE.value:
+            return 0
+        return EN_PASSANT_FILES_KEYS[en_passant_square % BoardEnum.BOARD_LENGTH.value]
+
+    @staticmethod
+    def get_color_to_move_key(color_to_move: int) -> int:
+        """
+        Returns key of side to move. Only black to move changes the hash
+        :param color_to_move: int value of color
+        :return: int 64-bit key
+        """
+        return COLOR_TO_MOVE_KEY if color_to_move == PiecesEnum.BLACK.value else 0
+
+    @staticmethod
+    def get_orientation_key(engine_color: int) -> int:
+        """
+        Returns key of board orientation. The same board array describes different positions in both orientations,
+        so caches of values depending on position, like static evaluations, add it to the board key.
+        :param engine_color: int value of engine color
+        :return: int 64-bit key (0 if engine plays black pieces)
+        """
+        return INVERTED_BOARD_KEY if engine_color == PiecesEnum.WHITE.value else 0
+
+    @staticmethod
+    def calculate_zobrist_key(board: 'Board') -> int:
+        """
+        Calculates from scratch Zobrist key of whole position. Board keeps its key updated incrementally,
+        so this method is meant for validation and positions set up outside of move making.
+        :param board: Board instance
+        :return: int 64-bit key
+        """
+        if board is None:
+            raise NullArgumentException("BOARD CANNOT BE NULL!")
+        castling_rights: Tuple[bool, bool, bool, bool] = board.get_special_move_data()[:4]
+
+        return ZobristUtil.calculate_pieces_key(board.board_array()) ^ \
+            ZobristUtil.get_color_to_move_key(board.color_to_move()) ^ \
+            ZobristUtil.calculate_castling_key(castling_rights) ^ \
+            ZobristUtil.get_en_passant_key(board.en_passant_square())
+
+
+ZOBRIST_SEED: int = 0x5EED_C4E5
+ZOBRIST_GENERATOR: Random = Random(ZOBRIST_SEED)
+PIECES_KEYS: Tuple[Tuple[int, ...], ...] = ZobristUtil.generate_pieces_keys(ZOBRIST_GENERATOR)
+PAWNS_KEYS: Tuple[Tuple[int, ...], ...] = tuple(
+    keys if piece & 0b111 == PiecesEnum.PAWN.value else (0,) * BoardEnum.BOARD_SIZE.value
+    for piece, keys in enumerate(PIECES_KEYS))
+COLOR_TO_MOVE_KEY: int = ZOBRIST_GENERATOR.getrandbits(64)
+CASTLING_KEYS: Tuple[int, ...] = tuple(ZOBRIST_GENERATOR.getrandbits(64) for _ in range(4))
+EN_PASSANT_FILES_KEYS: Tuple[int, ...] = tuple(ZOBRIST_GENERATOR.getrandbits(64)
+                                               for _ in range(BoardEnum.BOARD_LENGTH.value))
+INVERTED_BOARD_KEY: int = ZOBRIST_GENERATOR.getrandbits(64)
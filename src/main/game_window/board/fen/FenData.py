@@ -4,7 +4,10 @@
 
 from exceptions.IllegalArgumentException import IllegalArgumentException
 from exceptions.NullArgumentException import NullArgumentException
+from game_window.board.ZobristUtil import CASTLING_KEYS
+from game_window.board.ZobristUtil import ZobristUtil
 from game_window.ColorManager import ColorManager
+from game_window.enums.MoveEnum import MoveEnum
 from game_window.moving.generation.data.MoveData import MoveData
 
 
@@ -15,7 +18,7 @@ class FenData:
 
     __slots__ = array(["__white_castle_king", "__white_castle_queen", "__black_castle_king", "__black_castle_queen",
                        "__en_passant_square", "__en_passant_piece_square", "__move_counter",
-                       "__no_sack_and_pawn_count", "__player_color"], dtype=str)
+                       "__no_sack_and_pawn_count", "__player_color", "__zobrist_key"], dtype=str)
 
     def __init__(self, player_color: int):
         self.__white_castle_king: bool = True
@@ -27,6 +30,7 @@ def __init__(self, player_color: int):
         self.__move_counter: int = 0
         self.__no_sack_and_pawn_count: int = 0
         self.__player_color: int = player_color
+        self.__zobrist_key: int = self.__calculate_zobrist_key()
 
     def can_king_castle_king_side(self, color: int) -> bool:
         """
@@ -65,8 +69,12 @@ def set_castling_king_side(self, can_castle: bool, color: int) -> None:
             raise IllegalArgumentException("WRONG COLOR ARGUMENT!")
 
         if color == self.__player_color:
+            if self.__white_castle_king != can_castle:
+                self.__zobrist_key ^= CASTLING_KEYS[0]
             self.__white_castle_king = can_castle
         else:
+            if self.__black_castle_king != can_castle:
+                self.__zobrist_key ^= CASTLING_KEYS[2]
             self.__black_castle_king = can_castle
 
     def update_move_counter(self) -> None:
@@ -117,8 +125,12 @@ def set_castling_queen_side(self, can_castle: bool, color: int) -> None:
             raise IllegalArgumentException("WRONG COLOR ARGUMENT!")
 
         if color == self.__player_color:
+            if self.__white_castle_queen != can_castle:
+                self.__zobrist_key ^= CASTLING_KEYS[1]
             self.__white_castle_queen = can_castle
         else:
+            if self.__black_castle_queen != can_castle:
+                self.__zobrist_key ^= CASTLING_KEYS[3]
             self.__black_castle_queen = can_castle
 
     def set_en_passant_square(self, square: int) -> None:
@@ -136,6 +148,8 @@ def set_en_passant_square(self, square: int) -> None:
 
         if square not in proper_squares:
             raise IllegalArgumentException("SUCH SQUARE CANNOT BE EN PASSANT SQUARE!")
+        self.__zobrist_key ^= ZobristUtil.get_en_passant_key(self.__en_passant_square) ^ \
+            ZobristUtil.get_en_passant_key(square)
         self.__en_passant_square = square
 
     def set_en_passant_piece_square(self, piece_square: int) -> None:
@@ -150,6 +164,16 @@ def set_en_passant_piece_square(self, piece_square: int) -> None:
             raise IllegalArgumentException("SUCH SQUARE CANNOT BE EN PASSANT PIECE SQUARE!")
         self.__en_passant_piece_square = piece_square
 
+    def clear_en_passant(self) -> None:
+        """
+        Method used to remove en passant possibility, so en passant square and its piece square are unset
+        :return: None
+        """
+        self.__zobrist_key ^= ZobristUtil.get_en_passant_key(self.__en_passant_square) ^ \
+            ZobristUtil.get_en_passant_key(MoveEnum.NONE_EN_PASSANT_SQUARE.value)
+        self.__en_passant_square = MoveEnum.NONE_EN_PASSANT_SQUARE.value
+        self.__en_passant_piece_square = MoveEnum.NONE_EN_PASSANT_SQUARE.value
+
     def en_passant_square(self) -> int:
         """
         Gives access to an en passant end_square value
@@ -190,6 +214,23 @@ def update_fen_data(self, prev_fen_data: MoveData) -> None:
         self.__en_passant_piece_square = prev_fen_data.en_passant_piece_square
         self.__move_counter = prev_fen_data.move_counter
         self.__no_sack_and_pawn_count = prev_fen_data.no_sack_and_pawn_count
+        self.__zobrist_key = self.__calculate_zobrist_key()
+
+    def zobrist_key(self) -> int:
+        """
+        Gives access to Zobrist key of castling rights and en passant file
+        :return: int 64-bit key
+        """
+        return self.__zobrist_key
+
+    def __calculate_zobrist_key(self) -> int:
+        """
+        Calculates from scratch Zobrist key of castling rights and en passant file
+        :return: int 64-bit key
+        """
+        castling_key: int = ZobristUtil.calculate_castling_key((self.__white_castle_king, self.__white_castle_queen,
+                                                                self.__black_castle_king, self.__black_castle_queen))
+        return castling_key ^ ZobristUtil.get_en_passant_key(self.__en_passant_square)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, FenData):
@@ -209,3 +250,4 @@ def __hash__(self) -> int:
             (self.__black_castle_king, self.__black_castle_queen, self.__white_castle_queen, self.__white_castle_king,
              self.__move_counter, self.__no_sack_and_pawn_count, self.__en_passant_piece_square,
              self.__en_passant_square, self.__player_color))
+
@@ -7,7 +7,6 @@
 from typing import Tuple
 from typing import TYPE_CHECKING
 
-from game_window.moving.generation.data.Move import Move
 from game_window.moving.generation.data.MoveData import MoveData
 
 if TYPE_CHECKING:
@@ -62,10 +61,10 @@ def disable_castling_if_captured_rook(self, deleted_piece: int, color: int, squa
         pass
 
     @abstractmethod
-    def update_fen_data_with_double_pawn_movement(self, move: Move) -> None:
+    def update_fen_data_with_double_pawn_movement(self, move: int) -> None:
         """
         Method used to validate double pawn movement in terms of fen data
-        :param move: Move instance
+        :param move: int encoded move
         :return None
         """
         pass
@@ -124,6 +123,14 @@ def set_en_passant_piece_square(self, piece_square: int) -> None:
         """
         pass
 
+    @abstractmethod
+    def clear_en_passant(self) -> None:
+        """
+        Method used to remove en passant possibility
+        :return: None
+        """
+        pass
+
     @abstractmethod
     def update_move_counter(self) -> None:
         """
@@ -166,3 +173,11 @@ def update_fen_data(self, prev_fen_data: MoveData) -> None:
         :return: None
         """
         pass
+
+    @abstractmethod
+    def zobrist_key(self) -> int:
+        """
+        Gives access to Zobrist key of castling rights and en passant file
+        :return: int 64-bit key
+        """
+        pass
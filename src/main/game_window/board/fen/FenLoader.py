@@ -0,0 +1,189 @@
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from numpy import dtype
+from numpy import int8
+from numpy import ndarray
+from numpy import zeros
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.ColorManager import ColorManager
+from game_window.enums.BoardEnum import BoardEnum
+from game_window.enums.MoveEnum import MoveEnum
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.moving.generation.data.MoveData import MoveData
+
+
+class FenLoader:
+    """
+    Class containing methods to read fen strings into board data. Fen squares are given from white point of view,
+    so when engine plays white pieces (board is inverted) every square index is rotated.
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def parse_fen(fen: str, engine_color: int) -> Tuple[ndarray[int, dtype[int8]], int, MoveData]:
+        """
+        Method used to read whole fen string
+        :param fen: str fen string (move counters are optional)
+        :param engine_color: int value of color of upper pieces
+        :return: tuple of board array, color to move and MoveData with castling, en passant and counters values
+        """
+        if fen is None or engine_color is None:
+            raise NullArgumentException("FEN AND ENGINE COLOR CANNOT BE NULLS!")
+        if not ColorManager.is_it_valid_color(engine_color):
+            raise IllegalArgumentException("WRONG COLOR ARGUMENT!")
+        fields: List[str] = fen.split()
+
+        if len(fields) not in (4, 6):
+            raise IllegalArgumentException("FEN HAS TO CONTAIN 4 OR 6 FIELDS!")
+        is_inverted: bool = engine_color == PiecesEnum.WHITE.value
+        board_array: ndarray[int, dtype[int8]] = FenLoader.create_board_array(fields[0], is_inverted)
+        color_to_move: int = FenLoader.get_color_to_move(fields[1])
+        castling: Tuple[bool, bool, bool, bool] = FenLoader.get_castling_rights(fields[2], board_array, is_inverted)
+        en_passant_square, en_passant_piece_square = FenLoader.get_en_passant_squares(fields[3], is_inverted)
+        no_sack_and_pawn_count, move_number = FenLoader.get_counters(fields[4:])
+        move_counter: int = 2 * (move_number - 1) + (color_to_move == PiecesEnum.BLACK.value)
+
+        if is_inverted:
+            castling = castling[2], castling[3], castling[0], castling[1]
+        return board_array, color_to_move, MoveData(PiecesEnum.NONE.value, *castling, en_passant_square,
+                                                    en_passant_piece_square, move_counter, no_sack_and_pawn_count)
+
+    @staticmethod
+    def create_board_array(placement: str, is_inverted: bool) -> ndarray[int, dtype[int8]]:
+        """
+        Method used to fill board array with pieces placement field of fen
+        :param placement: str first field of fen
+        :param is_inverted: bool if engine plays white pieces
+        :return: board int array
+        """
+        if placement is None or is_inverted is None:
+            raise NullArgumentException("PLACEMENT AND ORIENTATION CANNOT BE NULLS!")
+        rows: List[str] = placement.split("/")
+
+        if len(rows) != BOARD_LENGTH:
+            raise IllegalArgumentException("FEN HAS TO CONTAIN 8 ROWS!")
+        board_array: ndarray[int, dtype[int8]] = zeros(BoardEnum.BOARD_SIZE.value, dtype=int8)
+        kings: List[int] = [0, 0]
+
+        for row, row_placement in enumerate(rows):
+            square: int = row * BOARD_LENGTH
+            row_end: int = square + BOARD_LENGTH
+
+            for letter in row_placement:
+                if letter in EMPTY_SQUARES_LETTERS:
+                    square += int(letter)
+                    continue
+                piece: int = FEN_PIECES.get(letter, PiecesEnum.NONE.value)
+
+                if piece == PiecesEnum.NONE.value or square >= row_end:
+                    raise IllegalArgumentException("WRONG PIECES PLACEMENT IN FEN!")
+                if piece & PIECE_MASK == PiecesEnum.KING.value:
+                    kings[piece == PiecesEnum.BLACK.value | PiecesEnum.KING.value] += 1
+                board_array[LAST_SQUARE - square if is_inverted else square] = piece
+                square += 1
+
+            if square != row_end:
+                raise IllegalArgumentException("WRONG PIECES PLACEMENT IN FEN!")
+        if kings != [1, 1]:
+            raise IllegalArgumentException("FEN HAS TO CONTAIN ONE KING OF EACH COLOR!")
+        return board_array
+
+    @staticmethod
+    def get_color_to_move(letter: str) -> int:
+        """
+        Method used to read color to move field of fen
+        :param letter: str second field of fen
+        :return: int value of color
+        """
+        if letter is None:
+            raise NullArgumentException("COLOR LETTER CANNOT BE NULL!")
+        if letter not in ("w", "b"):
+            raise IllegalArgumentException("SUCH COLOR DOES NOT EXIST!")
+        return PiecesEnum.WHITE.value if letter == "w" else PiecesEnum.BLACK.value
+
+    @staticmethod
+    def get_castling_rights(castling: str, board_array: ndarray[int, dtype[int8]], is_inverted: bool) \
+            -> Tuple[bool, bool, bool, bool]:
+        """
+        Method used to read castling field of fen. Right is kept only if king and rook stand on their starting squares,
+        so move generator never castles with a missing rook.
+        :param castling: str third field of fen
+        :param board_array: board int array filled with pieces
+        :param is_inverted: bool if engine plays white pieces
+        :return: tuple of white king side, white queen side, black king side and black queen side rights
+        """
+        if castling is None or board_array is None or is_inverted is None:
+            raise NullArgumentException("CASTLING, BOARD ARRAY AND ORIENTATION CANNOT BE NULLS!")
+        if castling != "-" and (not castling or any(letter not in CASTLING_LETTERS for letter in castling)):
+            raise IllegalArgumentException("WRONG CASTLING RIGHTS IN FEN!")
+        rights: List[bool] = []
+
+        for letter, king, king_square, rook_square in CASTLING_SQUARES:
+            if is_inverted:
+                king_square, rook_square = LAST_SQUARE - king_square, LAST_SQUARE - rook_square
+            rook: int = king - PiecesEnum.KING.value + PiecesEnum.ROOK.value
+            is_on_place: bool = board_array[king_square] == king and board_array[rook_square] == rook
+
+            rights.append(bool(letter in castling and is_on_place))
+        return rights[0], rights[1], rights[2], rights[3]
+
+    @staticmethod
+    def get_en_passant_squares(square_name: str, is_inverted: bool) -> Tuple[int, int]:
+        """
+        Method used to read en passant field of fen
+        :param square_name: str fourth field of fen
+        :param is_inverted: bool if engine plays white pieces
+        :return: tuple of en passant square and square of pawn which can be captured
+        """
+        if square_name is None or is_inverted is None:
+            raise NullArgumentException("SQUARE NAME AND ORIENTATION CANNOT BE NULLS!")
+        if square_name == "-":
+            return MoveEnum.NONE_EN_PASSANT_SQUARE.value, MoveEnum.NONE_EN_PASSANT_SQUARE.value
+        if len(square_name) != 2 or square_name[0] not in FILES or square_name[1] not in ("3", "6"):
+            raise IllegalArgumentException("WRONG EN PASSANT SQUARE IN FEN!")
+        square: int = (BOARD_LENGTH - int(square_name[1])) * BOARD_LENGTH + FILES.index(square_name[0])
+        piece_square: int = square - BOARD_LENGTH if square_name[1] == "3" else square + BOARD_LENGTH
+
+        if is_inverted:
+            return LAST_SQUARE - square, LAST_SQUARE - piece_square
+        return square, piece_square
+
+    @staticmethod
+    def get_counters(counters: List[str]) -> Tuple[int, int]:
+        """
+        Method used to read halfmove clock and fullmove number fields of fen
+        :param counters: list of last two fen fields (can be empty)
+        :return: tuple of halfmove clock and fullmove number
+        """
+        if counters is None:
+            raise NullArgumentException("COUNTERS CANNOT BE NULL!")
+        if not counters:
+            return 0, 1
+        if not all(counter.isdigit() for counter in counters) or int(counters[1]) < 1:
+            raise IllegalArgumentException("WRONG MOVE COUNTERS IN FEN!")
+        return int(counters[0]), int(counters[1])
+
+
+BOARD_LENGTH: int = BoardEnum.BOARD_LENGTH.value
+LAST_SQUARE: int = BoardEnum.BOARD_SIZE.value - 1
+PIECE_MASK: int = 0b111
+FILES: str = "abcdefgh"
+EMPTY_SQUARES_LETTERS: str = "12345678"
+CASTLING_LETTERS: str = "KQkq"
+FEN_PIECES: Dict[str, int] = {
+    letter.upper() if color == PiecesEnum.WHITE.value else letter: color | piece
+    for color in (PiecesEnum.WHITE.value, PiecesEnum.BLACK.value)
+    for letter, piece in (("k", PiecesEnum.KING.value), ("p", PiecesEnum.PAWN.value), ("n", PiecesEnum.KNIGHT.value),
+                          ("b", PiecesEnum.BISHOP.value), ("r", PiecesEnum.ROOK.value), ("q", PiecesEnum.QUEEN.value))
+}
+CASTLING_SQUARES: Tuple[Tuple[str, int, int, int], ...] = (
+    ("K", PiecesEnum.WHITE.value | PiecesEnum.KING.value, 60, 63),
+    ("Q", PiecesEnum.WHITE.value | PiecesEnum.KING.value, 60, 56),
+    ("k", PiecesEnum.BLACK.value | PiecesEnum.KING.value, 4, 7),
+    ("q", PiecesEnum.BLACK.value | PiecesEnum.KING.value, 4, 0)
+)
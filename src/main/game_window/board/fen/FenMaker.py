@@ -9,6 +9,7 @@
 
 from exceptions.IllegalArgumentException import IllegalArgumentException
 from exceptions.NullArgumentException import NullArgumentException
+from game_window.board.BoardUtil import BoardUtil
 from game_window.board.fen.FenData import FenData
 from game_window.board.fen.FenFactory import FenFactory
 from game_window.board.fen.FenUtil import FenUtil
@@ -16,8 +17,9 @@
 from game_window.enums.BoardEnum import BoardEnum
 from game_window.enums.MoveEnum import MoveEnum
 from game_window.enums.PiecesEnum import PiecesEnum
-from game_window.moving.generation.data.Move import Move
+from game_window.enums.SpecialFlags import SpecialFlags
 from game_window.moving.generation.data.MoveData import MoveData
+from game_window.moving.generation.data.MoveUtil import MoveUtil
 
 if TYPE_CHECKING:
     from game_window.board.Board import Board
@@ -39,35 +41,34 @@ def convert_board_array_to_fen(self, board: 'Board') -> str:
         :param board: Board instance
         :return: fen string
         """
-        fen = ""
-        current_element = 0
-        board_array = board.board_array()
+        fen_parts: List[str] = []
+        board_array: ndarray[int, dtype[int8]] = board.board_array()
 
         for row in range(BoardEnum.BOARD_LENGTH.value):
-            none_counter = 0
+            none_counter: int = 0
 
             for col in range(BoardEnum.BOARD_LENGTH.value):
-                index = current_element + col
-                color_value = ColorManager.get_piece_color(board_array[index])
+                index: int = row * BoardEnum.BOARD_LENGTH.value + col
+                piece: int = board_array[index]
 
-                if board_array[index] == PiecesEnum.NONE.value:
+                if piece == PiecesEnum.NONE.value:
                     none_counter += 1
                     continue
                 if none_counter > 0:
-                    fen = f"{fen}{none_counter}"
+                    fen_parts.append(str(none_counter))
                     none_counter = 0
-                fen = f"{fen}{FenUtil.get_proper_piece_for_fen(board_array, index, color_value)}"
+                fen_parts.append(FenUtil.get_proper_piece_for_fen(board_array, index,
+                                                                  ColorManager.get_piece_color(piece)))
             if none_counter > 0:
-                fen = f"{fen}{none_counter}"
-            if row != 7:
-                fen = f"{fen}/"
-            current_element += BoardEnum.BOARD_LENGTH.value
-        fen = f"{fen}{FenUtil.get_color_to_move_fen_letter(board.color_to_move())}"
-        fen = f"{fen}{FenUtil.get_castling_letters_to_fen(self.__fen_data)}"
-        fen = f"{fen}{FenUtil.convert_square_into_board_double_index(self.__fen_data.en_passant_square())}"
-        fen = f"{fen} {self.__fen_data.get_no_sack_and_pawn_count()} {self.__fen_data.get_move_counter()}"
+                fen_parts.append(str(none_counter))
+            if row != BoardEnum.BOARD_LENGTH.value - 1:
+                fen_parts.append("/")
+        fen_parts.append(FenUtil.get_color_to_move_fen_letter(board.color_to_move()))
+        fen_parts.append(FenUtil.get_castling_letters_to_fen(self.__fen_data))
+        fen_parts.append(FenUtil.convert_square_into_board_double_index(self.__fen_data.en_passant_square()))
+        fen_parts.append(f" {self.__fen_data.get_no_sack_and_pawn_count()} {self.__fen_data.get_move_counter()}")
 
-        return fen
+        return "".join(fen_parts)
 
     def update_no_sack_and_pawn_counter(self, deleted_piece: int, moving_piece: int) -> None:
         """
@@ -88,8 +89,9 @@ def update_no_sack_and_pawn_counter(self, deleted_piece: int, moving_piece: int)
 
     def disable_castling_on_side(self, color: int, target_square: int, board: 'Board') -> None:
         """
-        Disable castling for king on given side
-        :param target_square:
+        Disable castling for king on given side. Nothing changes if target square is not a starting square of given
+        color rook. On inverted board the left rook is the king side one.
+        :param target_square: int index of rook starting square
         :param color: int value of color
         :param board: Board instance
         :return: None
@@ -99,9 +101,13 @@ def disable_castling_on_side(self, color: int, target_square: int, board: 'Board
         if target_square < 0 or target_square > 63 or not ColorManager.is_it_valid_color(color):
             raise IllegalArgumentException("ARGUMENTS ARE NOT WITHIN ACCEPTABLE BONDS!")
 
-        if target_square in (MoveEnum.TOP_ROOK_QUEEN.value, MoveEnum.BOTTOM_ROOK_QUEEN.value):
+        home_color: int = board.player_color() if target_square in BOTTOM_ROOK_SQUARES else board.engine_color()
+
+        if target_square not in ROOK_SQUARES or color != home_color:
+            return
+        if (target_square in LEFT_ROOK_SQUARES) != BoardUtil.is_board_inverted(board):
             self.__fen_data.set_castling_queen_side(False, color)
-        elif target_square in (MoveEnum.TOP_ROOK_KING.value, MoveEnum.BOTTOM_ROOK_KING.value):
+        else:
             self.__fen_data.set_castling_king_side(False, color)
 
     def disable_castling_if_captured_rook(self, deleted_piece: int, color: int, square: int, board: 'Board') -> None:
@@ -122,15 +128,16 @@ def disable_castling_if_captured_rook(self, deleted_piece: int, color: int, squa
         if deleted_piece == enemy_color | PiecesEnum.ROOK.value:
             self.disable_castling_on_side(enemy_color, square, board)
 
-    def update_fen_data_with_double_pawn_movement(self, move: Move) -> None:
+    def update_fen_data_with_double_pawn_movement(self, move: int) -> None:
         """
-        Method used to validate double pawn movement in terms of fen data
-        :param move: Move instance
+        Method used to validate double pawn movement in terms of fen data. En passant square lasts only one move, so
+        it is cleared by every other move except en passant capture, which clears it itself.
+        :param move: int encoded move
         :return None
         """
-        end_square: int = move.get_end_square()
-        moving_piece: int = move.get_moving_piece()
-        move_length: int = end_square - move.get_start_square()
+        end_square: int = MoveUtil.get_end_square(move)
+        moving_piece: int = MoveUtil.get_moving_piece(move)
+        move_length: int = end_square - MoveUtil.get_start_square(move)
 
         if move_length == MoveEnum.PAWN_UP_DOUBLE_MOVE.value and moving_piece == PiecesEnum.PAWN.value:
             self.__fen_data.set_en_passant_square(end_square - MoveEnum.PAWN_UP_SINGLE_MOVE.value)
@@ -140,7 +147,7 @@ def update_fen_data_with_double_pawn_movement(self, move: Move) -> None:
             self.__fen_data.set_en_passant_square(end_square - MoveEnum.PAWN_DOWN_SINGLE_MOVE.value)
             self.__fen_data.set_en_passant_piece_square(end_square)
 
-        elif moving_piece != PiecesEnum.PAWN.value and self.__fen_data.en_passant_square() != -1:
+        elif MoveUtil.get_special_flag(move) != SpecialFlags.EN_PASSANT.value:
             self.__fen_data.set_en_passant_square(MoveEnum.NONE_EN_PASSANT_SQUARE.value)
             self.__fen_data.set_en_passant_piece_square(MoveEnum.NONE_EN_PASSANT_SQUARE.value)
 
@@ -191,6 +198,13 @@ def set_en_passant_square(self, square: int) -> None:
         """
         self.__fen_data.set_en_passant_square(square)
 
+    def clear_en_passant(self) -> None:
+        """
+        Method used to remove en passant possibility
+        :return: None
+        """
+        self.__fen_data.clear_en_passant()
+
     def update_move_counter(self) -> None:
         """
         Increments move counter by 1
@@ -228,3 +242,16 @@ def update_fen_data(self, prev_fen_data: MoveData) -> None:
         :return: None
         """
         self.__fen_data.update_fen_data(prev_fen_data)
+
+    def zobrist_key(self) -> int:
+        """
+        Gives access to Zobrist key of castling rights and en passant file
+        :return: int 64-bit key
+        """
+        return self.__fen_data.zobrist_key()
+
+
+LEFT_ROOK_SQUARES: Tuple[int, ...] = (MoveEnum.TOP_ROOK_QUEEN.value, MoveEnum.BOTTOM_ROOK_QUEEN.value)
+BOTTOM_ROOK_SQUARES: Tuple[int, ...] = (MoveEnum.BOTTOM_ROOK_QUEEN.value, MoveEnum.BOTTOM_ROOK_KING.value)
+ROOK_SQUARES: Tuple[int, ...] = (MoveEnum.TOP_ROOK_QUEEN.value, MoveEnum.TOP_ROOK_KING.value,
+                                 MoveEnum.BOTTOM_ROOK_QUEEN.value, MoveEnum.BOTTOM_ROOK_KING.value)
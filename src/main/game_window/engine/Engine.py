@@ -2,8 +2,6 @@
 from abc import abstractmethod
 from typing import TYPE_CHECKING
 
-from game_window.moving.generation.data.Move import Move
-
 if TYPE_CHECKING:
     from game_window.board.Board import Board
 
@@ -16,10 +14,18 @@ class Engine(ABC):
     __slots__ = ()
 
     @abstractmethod
-    def get_computer_move(self, board: 'Board') -> Move:
+    def get_computer_move(self, board: 'Board') -> int:
         """
         Method used to return best computer move possible
         :param board: Board instance
-        :return: the best computer Move instance
+        :return: the best computer move encoded as int
+        """
+        pass
+
+    @abstractmethod
+    def stop_search(self) -> None:
+        """
+        Method used to request stop of running search. Can be called from another thread.
+        :return: None
         """
         pass
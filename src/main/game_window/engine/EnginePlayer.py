@@ -1,16 +1,36 @@
+from math import isfinite
+from time import perf_counter
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import TYPE_CHECKING
 
 from numpy import inf
 
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
 from game_window.ColorManager import ColorManager
 from game_window.engine.Engine import Engine
 from game_window.engine.Evaluation import Evaluation
+from game_window.engine.MoveHistory import MoveHistory
+from game_window.engine.TranspositionTable import EXACT_BOUND
+from game_window.engine.TranspositionTable import LOWER_BOUND
+from game_window.engine.TranspositionTable import NO_ENTRY
+from game_window.engine.TranspositionTable import TranspositionTable
+from game_window.engine.TranspositionTable import UPPER_BOUND
 from game_window.enums.MoveEnum import MoveEnum
-from game_window.moving.generation.data.Move import Move
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.enums.SearchEnum import SearchEnum
 from game_window.moving.generation.data.MoveData import MoveData
 from game_window.moving.generation.data.MoveList import MoveList
+from game_window.moving.generation.data.MoveListPool import MoveListPool
+from game_window.moving.generation.data.MoveUtil import MoveUtil
+from game_window.moving.generation.data.MoveUtil import NO_MOVE
+from game_window.moving.generation.AttackUtil import AttackUtil
 from game_window.moving.generation.Generator import Generator
 from game_window.moving.MoveMaker import MoveMaker
+from game_window.moving.MoveSortUtil import MoveSortUtil
 
 if TYPE_CHECKING:
     from game_window.board.Board import Board
@@ -21,48 +41,340 @@ class EnginePlayer(Engine):
     Class containing methods to pick best __moves for computer
     """
 
-    __slots__ = ("__generator", "__evaluator")
+    __slots__ = ("__generator", "__evaluator", "__move_lists", "__transposition_table", "__max_depth", "__time_limit",
+                 "__node_limit", "__nodes", "__deadline", "__stopped", "__completed_depth", "__quiescence_depth",
+                 "__quiescence_nodes", "__stop_requested", "__move_history", "__pv_table",
+                 "__principal_variation", "__null_move_pruning", "__late_move_reductions", "__null_move_cutoffs",
+                 "__reduced_moves", "__reduction_researches", "__stop_condition", "__verbose")
 
-    def __init__(self, generator: Generator, evaluator: Evaluation) -> None:
+    def __init__(self, generator: Generator, evaluator: Evaluation,
+                 transposition_table: Optional[TranspositionTable] = None,
+                 max_depth: int = SearchEnum.MAX_DEPTH.value, time_limit: float = SearchEnum.TIME_LIMIT.value,
+                 node_limit: int = SearchEnum.NO_NODE_LIMIT.value,
+                 quiescence_depth: int = SearchEnum.QUIESCENCE_DEPTH.value, null_move_pruning: bool = True,
+                 late_move_reductions: bool = True, stop_condition: Optional[Callable[[], bool]] = None,
+                 verbose: bool = True) -> None:
+        if None in (max_depth, time_limit, node_limit, quiescence_depth, null_move_pruning, late_move_reductions,
+                    verbose):
+            raise NullArgumentException("SEARCH LIMITS CANNOT BE NULLS!")
+        if max_depth < 1 or max_depth > MoveEnum.MAX_SEARCH_PLY.value:
+            raise IllegalArgumentException("MAX DEPTH IS NOT WITHIN ACCEPTABLE BOUNDS!")
+        if time_limit <= 0 or node_limit < 0:
+            raise IllegalArgumentException("TIME LIMIT HAS TO BE POSITIVE AND NODE LIMIT CANNOT BE NEGATIVE!")
+        if quiescence_depth < 0:
+            raise IllegalArgumentException("QUIESCENCE DEPTH CANNOT BE NEGATIVE!")
         self.__generator: Generator = generator
         self.__evaluator: Evaluation = evaluator
+        self.__move_lists: MoveListPool = MoveListPool()
+        self.__transposition_table: TranspositionTable = TranspositionTable() if transposition_table is None \
+            else transposition_table
+        self.__max_depth: int = max_depth
+        self.__time_limit: float = time_limit
+        self.__node_limit: int = node_limit
+        self.__nodes: int = 0
+        self.__deadline: float = 0.0
+        self.__stopped: bool = False
+        self.__completed_depth: int = 0
+        self.__quiescence_depth: int = quiescence_depth
+        self.__quiescence_nodes: int = 0
+        self.__stop_requested: bool = False
+        self.__move_history: MoveHistory = MoveHistory()
+        self.__pv_table: List[List[int]] = [[] for _ in range(MoveEnum.MAX_SEARCH_PLY.value + 1)]
+        self.__principal_variation: List[int] = []
+        self.__null_move_pruning: bool = null_move_pruning
+        self.__late_move_reductions: bool = late_move_reductions
+        self.__null_move_cutoffs: int = 0
+        self.__reduced_moves: int = 0
+        self.__reduction_researches: int = 0
+        self.__stop_condition: Optional[Callable[[], bool]] = stop_condition
+        self.__verbose: bool = verbose
 
-    def get_computer_move(self, board: 'Board') -> Move:
+    def get_computer_move(self, board: 'Board') -> int:
         """
-        Method used to return best computer move possible
+        Method used to return best computer move possible. Search is iteratively deepened from depth 1 up to max depth
+        until time or node budget runs out and the best move of the last completed iteration is returned. Every
+        iteration is searched within aspiration window around evaluation of the previous one.
         :param board: Board instance
-        :return: the best computer Move instance
+        :return: the best computer move encoded as int
         """
-        moves_list: MoveList = self.__generator.generate_legal_moves(board.engine_color(), board)
+        moves_list: MoveList = self.__generator.generate_legal_moves(board.engine_color(), board,
+                                                                     moves_list=self.__move_lists.get_move_list(0))
+        best_move: int = NO_MOVE
         best_eval: float = -inf
-        alpha: float = -inf
-        beta: float = inf
-        best_move: Move = Move(MoveEnum.NONE.value, MoveEnum.NONE.value, MoveEnum.NONE.value, MoveEnum.NONE.value)
-        moves_list.sort(board)
+        self.__start_search(self.__time_limit)
+        self.__completed_depth = 0
+        self.__principal_variation = []
+        self.__transposition_table.new_search()
+        self.__move_history.new_search()
+
+        if moves_list.is_empty():
+            return NO_MOVE
+
+        for depth in range(1, self.__max_depth + 1):
+            iteration_move, iteration_eval = self.__search_with_aspiration_window(board, moves_list, depth, best_move,
+                                                                                  best_eval)
+
+            if self.__stopped:
+                break
+            best_move = iteration_move
+            best_eval = iteration_eval
+            self.__completed_depth = depth
+            self.__principal_variation = self.__pv_table[0][:]
+
+            if self.__verbose:
+                print("-----------------------------------------------------------------")
+                print(f"Evaluation : {best_eval}\n")
+                print(f"Current Move : \n{MoveUtil.to_string(best_move)}")
+                print("-----------------------------------------------------------------")
+
+        if best_move == NO_MOVE:
+            moves_list.score_moves(board)
+            best_move = moves_list.pick_best_move(0)
+
+        if self.__verbose:
+            print("-----------------------------------------------------------------")
+            print(f"Best Eval : {best_eval}\nBest Move : \n{MoveUtil.to_string(best_move)}\n")
+            print("-----------------------------------------------------------------")
+
+        return best_move
+
+    def search_root_move(self, board: 'Board', move: int, depth: int, alpha: float = -inf, beta: float = inf,
+                         time_limit: Optional[float] = None) -> float:
+        """
+        Method used to search single engine move of the root to given depth within window. It is used by engines which
+        split root moves between workers, so transposition table and move history of previous searches are kept. Move
+        is searched with null window first if alpha is already known.
+        :param board: Board instance
+        :param move: int encoded legal engine move
+        :param depth: int depth counted from the root
+        :param alpha: float value of alpha
+        :param beta: float value of beta
+        :param time_limit: float seconds search can take, engine time limit if not given
+        :return: float evaluation of move (not valid if search was stopped)
+        """
+        if board is None or move is None or depth is None:
+            raise NullArgumentException("BOARD, MOVE AND DEPTH CANNOT BE NULLS!")
+        if depth < 1 or depth > MoveEnum.MAX_SEARCH_PLY.value:
+            raise IllegalArgumentException("DEPTH IS NOT WITHIN ACCEPTABLE BOUNDS!")
+        self.__start_search(self.__time_limit if time_limit is None else time_limit)
+
+        deleted_data: MoveData = MoveMaker.make_move(move, board.engine_color(), board)
+        evaluation: float = self.__search_principal_variation(board, depth - 1, alpha, beta, board.player_color(), 1,
+                                                              False)
+        MoveMaker.un_make_move(move, deleted_data, board)
+
+        return evaluation
+
+    def stop_search(self) -> None:
+        """
+        Method used to request stop of running search. Can be called from another thread, search finishes on the next
+        visited node and returns the best move of the last completed iteration.
+        :return: None
+        """
+        self.__stop_requested = True
+
+    def is_search_stopped(self) -> bool:
+        """
+        Gives access to information if the last search was stopped before it finished
+        :return: bool
+        """
+        return self.__stopped
+
+    def get_searched_nodes(self) -> int:
+        """
+        Gives access to number of main search nodes visited by the last search
+        :return: int number of nodes
+        """
+        return self.__nodes
+
+    def get_quiescence_nodes(self) -> int:
+        """
+        Gives access to number of quiescence nodes visited by the last search
+        :return: int number of nodes
+        """
+        return self.__quiescence_nodes
+
+    def get_null_move_cutoffs(self) -> int:
+        """
+        Gives access to number of nodes pruned by null move in the last search
+        :return: int number of cutoffs
+        """
+        return self.__null_move_cutoffs
+
+    def get_reduced_moves(self) -> int:
+        """
+        Gives access to number of late moves searched with reduced depth in the last search
+        :return: int number of moves
+        """
+        return self.__reduced_moves
+
+    def get_reduction_researches(self) -> int:
+        """
+        Gives access to number of reduced moves which failed high and were searched again to full depth
+        :return: int number of moves
+        """
+        return self.__reduction_researches
+
+    def get_principal_variation(self) -> List[int]:
+        """
+        Gives access to principal variation of the last completed iteration of the last search. Variation can be
+        shorter than searched depth if it was cut by transposition table.
+        :return: list of int encoded moves starting with the best move
+        """
+        return self.__principal_variation[:]
+
+    def get_completed_depth(self) -> int:
+        """
+        Gives access to depth of the last fully completed iteration of the last search
+        :return: int depth
+        """
+        return self.__completed_depth
+
+    def __search_with_aspiration_window(self, board: 'Board', moves_list: MoveList, depth: int,
+                                        previous_best_move: int, previous_eval: float) -> Tuple[int, float]:
+        """
+        Method used to search root within window around evaluation of previous iteration. If the result falls outside
+        the window, the failed side is widened and root is searched again until the window contains the result.
+        :param board: Board instance
+        :param moves_list: MoveList instance of engine legal moves
+        :param depth: int depth of iteration counted from the root
+        :param previous_best_move: int encoded best move of previous iteration or NO_MOVE
+        :param previous_eval: float evaluation of previous iteration
+        :return: tuple of the best move and its evaluation (not valid if search was stopped)
+        """
+        if depth < SearchEnum.ASPIRATION_MIN_DEPTH.value or not isfinite(previous_eval):
+            return self.__search_root(board, moves_list, depth, previous_best_move, -inf, inf)
+        window: float = SearchEnum.ASPIRATION_WINDOW.value
+        alpha: float = previous_eval - window
+        beta: float = previous_eval + window
+
+        while True:
+            best_move, best_eval = self.__search_root(board, moves_list, depth, previous_best_move, alpha, beta)
+
+            if self.__stopped:
+                return best_move, best_eval
+            window *= 2
+
+            if best_eval <= alpha and alpha != -inf:
+                alpha = previous_eval - window if window <= SearchEnum.MAX_ASPIRATION_WINDOW.value else -inf
+            elif best_eval >= beta and beta != inf:
+                beta = previous_eval + window if window <= SearchEnum.MAX_ASPIRATION_WINDOW.value else inf
+                previous_best_move = best_move
+            else:
+                return best_move, best_eval
+
+    def __search_root(self, board: 'Board', moves_list: MoveList, depth: int, previous_best_move: int, alpha: float,
+                      beta: float) -> Tuple[int, float]:
+        """
+        Method used to search every root move to given depth. Best move of previous iteration is searched first with
+        full window and the rest with null window, they are searched again only if they can raise alpha.
+        :param board: Board instance
+        :param moves_list: MoveList instance of engine legal moves
+        :param depth: int depth of iteration counted from the root
+        :param previous_best_move: int encoded best move of previous iteration or NO_MOVE
+        :param alpha: float value of alpha
+        :param beta: float value of beta
+        :return: tuple of the best move and its evaluation (not valid if search was stopped)
+        """
+        best_eval: float = -inf
+        best_move: int = NO_MOVE
+        moves_list.score_moves(board, previous_best_move, self.__move_history, 0)
 
         for index in range(moves_list.size()):
-            depth: int = 2
-            move: Move = moves_list[index]
+            move: int = moves_list.pick_best_move(index)
 
             deleted_data: MoveData = MoveMaker.make_move(move, board.engine_color(), board)
-            evaluation: float = -self.__negamax_search(board, depth, -beta, -alpha, board.player_color())
+            evaluation: float = self.__search_principal_variation(board, depth - 1, alpha, beta, board.player_color(),
+                                                                  1, index == 0)
             MoveMaker.un_make_move(move, deleted_data, board)
 
-            print("-----------------------------------------------------------------")
-            print(f"BestEval : {best_eval}\nEvaluation : {evaluation}\n")
-            print(f"Current Move : \n{move}")
-            print("-----------------------------------------------------------------")
+            if self.__stopped:
+                break
 
-            if evaluation > best_eval:
+            if evaluation > best_eval or best_move == NO_MOVE:
                 best_move = move
                 best_eval = evaluation
-        print("-----------------------------------------------------------------")
-        print(f"Best Eval : {best_eval}\nBest Move : \n{best_move}\n")
-        print("-----------------------------------------------------------------")
+                self.__update_principal_variation(move, 0)
+            alpha = max(alpha, best_eval)
 
-        return best_move
+            if alpha >= beta:
+                break
+        return best_move, best_eval
+
+    def __search_principal_variation(self, board: 'Board', depth: int, alpha: float, beta: float, favor_color: int,
+                                     ply: int, is_first_move: bool, reduction: int = 0) -> float:
+        """
+        Method used to search position after a move from the point of view of side which made it. The first move of a
+        node is searched with full window, others with null window and again with full window if they raise alpha.
+        Reduced move is first searched with null window to lower depth and to full depth only if it raises alpha.
+        :param board: Board instance with the move already made
+        :param depth: int remaining depth after the move
+        :param alpha: float value of alpha of the side which made the move
+        :param beta: float value of beta of the side which made the move
+        :param favor_color: int value of color which turn is after the move
+        :param ply: int distance from the root after the move
+        :param is_first_move: bool whether it is the first searched move of the node
+        :param reduction: int number of plies the move is reduced by
+        :return: float evaluation of the move
+        """
+        if is_first_move or alpha == -inf:
+            return -self.__negamax_search(board, depth, -beta, -alpha, favor_color, ply)
+        if reduction > 0:
+            self.__reduced_moves += 1
+            reduced_evaluation: float = -self.__negamax_search(board, depth - reduction,
+                                                               -alpha - SearchEnum.NULL_WINDOW.value, -alpha,
+                                                               favor_color, ply)
 
-    def __negamax_search(self, board: 'Board', depth: int, alpha: float, beta: float, favor_color: int) -> float:
+            if reduced_evaluation <= alpha or self.__stopped:
+                return reduced_evaluation
+            self.__reduction_researches += 1
+        evaluation: float = -self.__negamax_search(board, depth, -alpha - SearchEnum.NULL_WINDOW.value, -alpha,
+                                                   favor_color, ply)
+
+        if alpha < evaluation < beta and not self.__stopped:
+            evaluation = -self.__negamax_search(board, depth, -beta, -alpha, favor_color, ply)
+        return evaluation
+
+    def __update_principal_variation(self, move: int, ply: int) -> None:
+        """
+        Method used to set principal variation of ply as move followed by principal variation of the next ply
+        :param move: int encoded move which raised alpha
+        :param ply: int distance of node from the root
+        :return: None
+        """
+        self.__pv_table[ply][:] = [move]
+        self.__pv_table[ply].extend(self.__pv_table[ply + 1])
+
+    def __start_search(self, time_limit: float) -> None:
+        """
+        Method used to reset counters and stop state and to set deadline of new search
+        :param time_limit: float seconds search can take
+        :return: None
+        """
+        self.__nodes = 0
+        self.__quiescence_nodes = 0
+        self.__null_move_cutoffs = 0
+        self.__reduced_moves = 0
+        self.__reduction_researches = 0
+        self.__deadline = perf_counter() + time_limit
+        self.__stopped = False
+        self.__stop_requested = False
+
+    def __is_budget_exceeded(self) -> bool:
+        """
+        Method used to check if search ran out of time or nodes or its stop was requested directly or by stop condition.
+        Once exceeded search stays stopped.
+        :return: bool
+        """
+        if not self.__stopped:
+            self.__stopped = self.__stop_requested or perf_counter() >= self.__deadline or \
+                self.__stop_condition is not None and self.__stop_condition() or \
+                self.__node_limit != SearchEnum.NO_NODE_LIMIT.value and \
+                self.__nodes + self.__quiescence_nodes >= self.__node_limit
+        return self.__stopped
+
+    def __negamax_search(self, board: 'Board', depth: int, alpha: float, beta: float, favor_color: int,
+                         ply: int, allow_null_move: bool = True) -> float:
         """
         Method used to evaluate positions and find possibly best move for engine
         :param board: Board instance
@@ -70,62 +382,170 @@ def __negamax_search(self, board: 'Board', depth: int, alpha: float, beta: float
         :param alpha: int value of alpha
         :param beta: int value of beta
         :param favor_color: int value of color which turn is now searched for
+        :param ply: int distance from the root used to pick move list from the pool
+        :param allow_null_move: bool whether null move can be tried, it is not tried right after another null move
         :return: int value of best move evaluation
         """
+        self.__nodes += 1
+        self.__pv_table[ply].clear()
+
+        if self.__is_budget_exceeded():
+            return 0.0
+        original_alpha: float = alpha
+        zobrist_key: int = board.zobrist_key()
+        entry: int = self.__transposition_table.probe(zobrist_key)
+        hash_move: int = NO_MOVE
+
+        if entry != NO_ENTRY:
+            hash_move = self.__transposition_table.get_move(entry)
+
+            if self.__transposition_table.get_depth(entry) >= depth:
+                bound: int = self.__transposition_table.get_bound(entry)
+                stored_score: float = self.__transposition_table.get_score(entry)
+
+                if bound == EXACT_BOUND or (bound == LOWER_BOUND and stored_score >= beta) or \
+                        (bound == UPPER_BOUND and stored_score <= alpha):
+                    return stored_score
+
         if depth == 0:
-            return self.__evaluator.evaluate_position(board, favor_color)
-        moves_list: MoveList = self.__generator.generate_legal_moves(color_to_move=favor_color, board=board)
+            evaluation: float = self.__search_only_capture_moves(board, favor_color, alpha, beta, ply,
+                                                                 self.__quiescence_depth)
+
+            if not self.__stopped:
+                self.__transposition_table.store(zobrist_key, depth, self.__get_bound(evaluation, original_alpha, beta),
+                                                 evaluation, NO_MOVE)
+            return evaluation
+        enemy_color: int = ColorManager.get_opposite_piece_color(favor_color)
+        in_check: bool = AttackUtil.is_king_in_check(board, favor_color)
+
+        if allow_null_move and not in_check and self.__null_move_pruning and \
+                depth >= SearchEnum.NULL_MOVE_MIN_DEPTH.value and beta != inf and \
+                EnginePlayer.__has_non_pawn_material(board, favor_color):
+            null_move_data: MoveData = board.make_null_move()
+            null_move_score: float = -self.__negamax_search(board, depth - 1 - SearchEnum.NULL_MOVE_REDUCTION.value,
+                                                            -beta, -beta + SearchEnum.NULL_WINDOW.value, enemy_color,
+                                                            ply + 1, False)
+            board.un_make_null_move(null_move_data)
+
+            if self.__stopped:
+                return 0.0
+            if null_move_score >= beta:
+                self.__null_move_cutoffs += 1
+                return beta
+        moves_list: MoveList = self.__generator.generate_legal_moves(color_to_move=favor_color, board=board,
+                                                                     moves_list=self.__move_lists.get_move_list(ply))
 
         if moves_list.is_empty():
+            self.__transposition_table.store(zobrist_key, depth, EXACT_BOUND, -inf, NO_MOVE)
             return -inf
-        evaluation: float = -inf
-        moves_list.sort(board)
+        evaluation = -inf
+        best_move: int = NO_MOVE
+        moves_list.score_moves(board, hash_move, self.__move_history, ply)
 
         for index in range(moves_list.size()):
-            move: Move = moves_list[index]
-            enemy_color: int = ColorManager.get_opposite_piece_color(favor_color)
+            move: int = moves_list.pick_best_move(index)
             new_depth: int = depth - 1
+            can_be_reduced: bool = self.__late_move_reductions and not in_check and \
+                depth >= SearchEnum.LATE_MOVE_MIN_DEPTH.value and index >= SearchEnum.LATE_MOVE_MIN_INDEX.value and \
+                MoveSortUtil.is_quiet_move(move, board)
 
             deleted_data: MoveData = MoveMaker.make_move(move=move, color=favor_color, board=board)
-            evaluation = max(evaluation, -self.__negamax_search(board=board, depth=new_depth, alpha=-beta, beta=-alpha,
-                                                                favor_color=enemy_color))
+            reduction: int = SearchEnum.LATE_MOVE_REDUCTION.value if can_be_reduced and \
+                not AttackUtil.is_king_in_check(board, enemy_color) else 0
+            score: float = self.__search_principal_variation(board=board, depth=new_depth, alpha=alpha, beta=beta,
+                                                             favor_color=enemy_color, ply=ply + 1,
+                                                             is_first_move=index == 0, reduction=reduction)
             MoveMaker.un_make_move(move=move, deleted_data=deleted_data, board=board)
 
-            alpha = max(alpha, evaluation)
+            if self.__stopped:
+                return 0.0
+            if score > evaluation:
+                evaluation = score
+                best_move = move
+            if score > alpha:
+                alpha = score
+                self.__update_principal_variation(move, ply)
 
             if alpha >= beta:
+                if MoveSortUtil.is_quiet_move(move, board):
+                    self.__move_history.store_cutoff(move, favor_color, depth, ply)
                 break
+        self.__transposition_table.store(zobrist_key, depth, self.__get_bound(evaluation, original_alpha, beta),
+                                         evaluation, best_move)
         return evaluation
 
-    def __search_only_capture_moves(self, board: 'Board', color: int, alpha: float, beta: float) -> float:
+    @staticmethod
+    def __has_non_pawn_material(board: 'Board', color: int) -> bool:
         """
-
-        :param board:
-        :param color:
-        :param alpha:
-        :param beta:
-        :return:
+        Method used to check if side has any piece other than king and pawns. Null move is not tried without them,
+        because such positions are often zugzwang.
+        :param board: Board instance
+        :param color: int value of color
+        :return: bool
         """
-        evaluation: float = self.__evaluator.evaluate_position(board, color)
+        return board.piece_count(color | PiecesEnum.KNIGHT.value) + board.piece_count(color | PiecesEnum.BISHOP.value) + \
+            board.piece_count(color | PiecesEnum.ROOK.value) + board.piece_count(color | PiecesEnum.QUEEN.value) > 0
 
+    @staticmethod
+    def __get_bound(evaluation: float, original_alpha: float, beta: float) -> int:
+        """
+        Method used to get transposition table bound type of searched node score
+        :param evaluation: float score of node
+        :param original_alpha: float value of alpha node was entered with
+        :param beta: float value of beta
+        :return: int bound type
+        """
+        if evaluation <= original_alpha:
+            return UPPER_BOUND
         if evaluation >= beta:
-            return beta
-        alpha = max(alpha, evaluation)
+            return LOWER_BOUND
+        return EXACT_BOUND
+
+    def __search_only_capture_moves(self, board: 'Board', color: int, alpha: float, beta: float, ply: int,
+                                    depth: int) -> float:
+        """
+        Quiescence search used at the main search leaves. Only captures are searched until position is quiet, static
+        evaluation is a stand pat lower bound and captures which cannot raise alpha even with a margin are pruned.
+        :param board: Board instance
+        :param color: int value of color which turn is now searched for
+        :param alpha: float value of alpha
+        :param beta: float value of beta
+        :param ply: int distance from the root used to pick move list from the pool
+        :param depth: int number of captures which can still be searched
+        :return: float value of position evaluation
+        """
+        self.__quiescence_nodes += 1
+
+        if self.__is_budget_exceeded():
+            return 0.0
+        stand_pat: float = self.__evaluator.evaluate_position(board, color)
+
+        if stand_pat >= beta or depth == 0:
+            return stand_pat
+        alpha = max(alpha, stand_pat)
+        best_evaluation: float = stand_pat
         capture_moves: MoveList = self.__generator.generate_legal_moves(color_to_move=color, board=board,
-                                                                        captures_only=True)
-        if capture_moves.is_empty():
-            return evaluation
-        capture_moves.sort(board)
+                                                                        captures_only=True,
+                                                                        moves_list=self.__move_lists.get_move_list(ply))
+        capture_moves.score_captures(board)
+        opposite_color: int = ColorManager.get_opposite_piece_color(color)
 
         for index in range(capture_moves.size()):
-            move: Move = capture_moves[index]
-            opposite_color: int = ColorManager.get_opposite_piece_color(color)
+            move: int = capture_moves.pick_best_move(index)
 
+            if stand_pat + MoveSortUtil.count_capture_gain(move, board) + SearchEnum.DELTA_MARGIN.value <= alpha:
+                continue
             deleted_data: MoveData = MoveMaker.make_move(move, color, board)
-            evaluation = -self.__search_only_capture_moves(board=board, color=opposite_color, alpha=-beta, beta=-alpha)
+            evaluation: float = -self.__search_only_capture_moves(board=board, color=opposite_color, alpha=-beta,
+                                                                  beta=-alpha, ply=ply + 1, depth=depth - 1)
             MoveMaker.un_make_move(move, deleted_data, board)
 
-            if evaluation >= beta:
-                return beta
-            alpha = max(alpha, evaluation)
-        return alpha
+            if self.__stopped:
+                return 0.0
+            if evaluation > best_evaluation:
+                best_evaluation = evaluation
+                alpha = max(alpha, evaluation)
+
+                if alpha >= beta:
+                    break
+        return best_evaluation
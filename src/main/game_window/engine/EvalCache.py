@@ -0,0 +1,108 @@
+from array import array
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.enums.EvalCacheEnum import EvalCacheEnum
+from game_window.enums.PiecesEnum import PiecesEnum
+
+
+class EvalCache:
+    """
+    Fixed size, lossy cache of static evaluations keyed by Zobrist key of position and favor color. Entries are
+    stored in parallel typed arrays and every slot is always replaced.
+    """
+
+    __slots__ = ("__keys", "__colors", "__scores", "__mask", "__hits", "__misses")
+
+    def __init__(self, entries: int = EvalCacheEnum.DEFAULT_ENTRIES.value) -> None:
+        if entries is None:
+            raise NullArgumentException("ENTRIES CANNOT BE NULL!")
+        if entries <= 0:
+            raise IllegalArgumentException("EVALUATION CACHE SIZE HAS TO BE POSITIVE!")
+        entries = 1 << (entries.bit_length() - 1)
+
+        self.__mask: int = entries - 1
+        self.__keys: array = array("Q", bytes(8 * entries))
+        self.__colors: array = array("B", bytes(entries))
+        self.__scores: array = array("d", bytes(8 * entries))
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+    def probe(self, key: int, favor_color: int) -> int:
+        """
+        Looks for an evaluation of given position
+        :param key: int 64-bit Zobrist key of position
+        :param favor_color: int value of color in favor of which position was evaluated
+        :return: int index of entry to be read with get_score or NO_ENTRY if evaluation is not stored
+        """
+        slot: int = self.__get_slot(key, favor_color)
+
+        if self.__colors[slot] == favor_color and self.__keys[slot] == key:
+            self.__hits += 1
+            return slot
+        self.__misses += 1
+        return NO_ENTRY
+
+    def store(self, key: int, favor_color: int, score: float) -> None:
+        """
+        Stores evaluation of position
+        :param key: int 64-bit Zobrist key of position
+        :param favor_color: int value of color in favor of which position was evaluated
+        :param score: float evaluation
+        :return: None
+        """
+        slot: int = self.__get_slot(key, favor_color)
+
+        self.__keys[slot] = key
+        self.__colors[slot] = favor_color
+        self.__scores[slot] = score
+
+    def __get_slot(self, key: int, favor_color: int) -> int:
+        """
+        Finds slot of position. Evaluations of both colors of the same position land in neighbouring slots.
+        :param key: int 64-bit Zobrist key of position
+        :param favor_color: int value of color
+        :return: int index of slot
+        """
+        return (key ^ (favor_color == PiecesEnum.BLACK.value)) & self.__mask
+
+    def get_score(self, entry: int) -> float:
+        """
+        Gives access to evaluation of probed entry
+        :param entry: int index returned by probe
+        :return: float evaluation
+        """
+        return self.__scores[entry]
+
+    def clear(self) -> None:
+        """
+        Removes every entry and resets counters
+        :return: None
+        """
+        self.__colors[:] = array("B", bytes(len(self.__colors)))
+        self.__hits = 0
+        self.__misses = 0
+
+    def size(self) -> int:
+        """
+        Returns number of entries cache can hold
+        :return: int
+        """
+        return len(self.__keys)
+
+    def hits(self) -> int:
+        """
+        Returns number of probes which found stored evaluation since last clear
+        :return: int
+        """
+        return self.__hits
+
+    def misses(self) -> int:
+        """
+        Returns number of probes which did not find stored evaluation since last clear
+        :return: int
+        """
+        return self.__misses
+
+
+NO_ENTRY: int = EvalCacheEnum.NO_ENTRY.value
@@ -1,5 +1,9 @@
+from typing import Optional
 from typing import TYPE_CHECKING
 
+from game_window.board.ZobristUtil import ZobristUtil
+from game_window.engine.EvalCache import EvalCache
+from game_window.engine.EvalCache import NO_ENTRY
 from game_window.engine.Evaluation import Evaluation
 from game_window.engine.static_eval.KingPressure import KingPressure
 from game_window.engine.static_eval.LightPiecesEval import LightPiecesEval
@@ -17,10 +21,11 @@ class Evaluator(Evaluation):
     Class containing methods to evaluate position
     """
 
-    __slots__ = "__static_evaluator"
+    __slots__ = ("__static_evaluator", "__eval_cache")
 
-    def __init__(self) -> None:
+    def __init__(self, eval_cache: Optional[EvalCache] = None) -> None:
         self.__static_evaluator: StaticEvaluation = StaticEvaluator()
+        self.__eval_cache: EvalCache = EvalCache() if eval_cache is None else eval_cache
 
     @staticmethod
     def debug_evaluate_position(board: 'Board', favor_color: int) -> float:
@@ -61,6 +66,19 @@ def evaluate_position(self, board: 'Board', favor_color: int) -> float:
         :param favor_color: int value of favor_color in favor of which we evaluate position
         :return: float evaluation
         """
+        key: int = board.zobrist_key() ^ ZobristUtil.get_orientation_key(board.engine_color())
+        entry: int = self.__eval_cache.probe(key, favor_color)
+
+        if entry != NO_ENTRY:
+            return self.__eval_cache.get_score(entry)
         total_eval: float = self.__static_evaluator.evaluate_static_position(board, favor_color)
+        self.__eval_cache.store(key, favor_color, total_eval)
 
         return total_eval
+
+    def eval_cache(self) -> EvalCache:
+        """
+        Gives access to cache of static evaluations
+        :return: EvalCache instance
+        """
+        return self.__eval_cache
@@ -0,0 +1,111 @@
+from array import array
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.enums.BoardEnum import BoardEnum
+from game_window.enums.MoveEnum import MoveEnum
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.moving.generation.data.MoveUtil import MoveUtil
+from game_window.moving.generation.data.MoveUtil import NO_MOVE
+
+
+class MoveHistory:
+    """
+    Class containing killer moves of every search ply and history scores of quiet moves indexed by side, start and end
+    square. Both are updated on beta cutoffs and used to order quiet moves after hash move and captures.
+    """
+
+    __slots__ = ("__killers", "__history", "__max_ply")
+
+    def __init__(self, max_ply: int = MoveEnum.MAX_SEARCH_PLY.value) -> None:
+        if max_ply is None:
+            raise NullArgumentException("MAX PLY CANNOT BE NULL!")
+        if max_ply <= 0:
+            raise IllegalArgumentException("MAX PLY HAS TO BE POSITIVE!")
+        self.__max_ply: int = max_ply
+        self.__killers: array = array("H", bytes(2 * KILLERS_PER_PLY * max_ply))
+        self.__history: array = array("i", bytes(4 * HISTORY_SIZE))
+
+    def store_cutoff(self, move: int, color: int, depth: int, ply: int) -> None:
+        """
+        Stores quiet move which caused beta cutoff as killer of given ply and raises its history score by depth squared.
+        History scores are halved once any of them exceeds the limit.
+        :param move: int encoded quiet move
+        :param color: int value of moving color
+        :param depth: int remaining depth of node the cutoff happened in
+        :param ply: int distance of node from the root
+        :return: None
+        """
+        if ply < self.__max_ply:
+            first_slot: int = ply * KILLERS_PER_PLY
+
+            if self.__killers[first_slot] != move:
+                self.__killers[first_slot + 1:first_slot + KILLERS_PER_PLY] = \
+                    self.__killers[first_slot:first_slot + KILLERS_PER_PLY - 1]
+                self.__killers[first_slot] = move
+        index: int = MoveHistory.__get_history_index(move, color)
+        self.__history[index] += depth * depth
+
+        if self.__history[index] > MoveEnum.MAX_HISTORY_SCORE.value:
+            self.__age_history()
+
+    def get_killer(self, ply: int, slot: int) -> int:
+        """
+        Gives access to killer move of given ply
+        :param ply: int distance of node from the root
+        :param slot: int index of killer, 0 is the most recent one
+        :return: int encoded move or NO_MOVE
+        """
+        if ply >= self.__max_ply:
+            return NO_MOVE
+        return self.__killers[ply * KILLERS_PER_PLY + slot]
+
+    def get_history_score(self, move: int, color: int) -> int:
+        """
+        Gives access to history score of move
+        :param move: int encoded move
+        :param color: int value of moving color
+        :return: int score
+        """
+        return self.__history[MoveHistory.__get_history_index(move, color)]
+
+    def new_search(self) -> None:
+        """
+        Method used to prepare tables for next search. Killers are cleared and history scores are halved, so older
+        searches matter less.
+        :return: None
+        """
+        self.__killers[:] = array("H", bytes(len(self.__killers) * 2))
+        self.__age_history()
+
+    def clear(self) -> None:
+        """
+        Method used to clear killers and history scores
+        :return: None
+        """
+        self.__killers[:] = array("H", bytes(len(self.__killers) * 2))
+        self.__history[:] = array("i", bytes(4 * HISTORY_SIZE))
+
+    def __age_history(self) -> None:
+        """
+        Method used to halve every history score
+        :return: None
+        """
+        self.__history[:] = array("i", [score >> 1 for score in self.__history])
+
+    @staticmethod
+    def __get_history_index(move: int, color: int) -> int:
+        """
+        Method used to get index of move in history table
+        :param move: int encoded move
+        :param color: int value of moving color
+        :return: int index
+        """
+        side: int = 1 if color == PiecesEnum.BLACK.value else 0
+
+        return (side * BOARD_SIZE + MoveUtil.get_start_square(move)) * BOARD_SIZE + MoveUtil.get_end_square(move)
+
+
+KILLERS_PER_PLY: int = MoveEnum.KILLERS_PER_PLY.value
+BOARD_SIZE: int = BoardEnum.BOARD_SIZE.value
+HISTORY_SIZE: int = 2 * BOARD_SIZE * BOARD_SIZE
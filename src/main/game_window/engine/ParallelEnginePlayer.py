@@ -0,0 +1,165 @@
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from math import inf
+from multiprocessing import Event
+from multiprocessing.synchronize import Event as StopEvent
+from os import cpu_count
+from time import perf_counter
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.board.BoardSnapshot import BoardSnapshot
+from game_window.engine.Engine import Engine
+from game_window.engine.RootSearchWorker import RootSearchWorker
+from game_window.enums.MoveEnum import MoveEnum
+from game_window.enums.SearchEnum import SearchEnum
+from game_window.moving.generation.data.MoveList import MoveList
+from game_window.moving.generation.data.MoveUtil import NO_MOVE
+from game_window.moving.generation.Generator import Generator
+
+if TYPE_CHECKING:
+    from game_window.board.Board import Board
+
+
+class ParallelEnginePlayer(Engine):
+    """
+    Engine splitting root moves between processes of persistent pool. Every iteration of deepening searches root moves
+    in batches of worker count size, moves of later batches are searched with alpha of the best evaluation found by
+    earlier ones. Workers keep their transposition tables between iterations and searches.
+    """
+
+    __slots__ = ("__generator", "__workers", "__max_depth", "__time_limit", "__stop_event", "__executor", "__nodes",
+                 "__completed_depth")
+
+    def __init__(self, generator: Generator, workers: Optional[int] = None,
+                 max_depth: int = SearchEnum.MAX_DEPTH.value, time_limit: float = SearchEnum.TIME_LIMIT.value,
+                 transposition_size_mb: int = SearchEnum.WORKER_TRANSPOSITION_SIZE_MB.value,
+                 quiescence_depth: int = SearchEnum.QUIESCENCE_DEPTH.value) -> None:
+        if None in (generator, max_depth, time_limit, transposition_size_mb, quiescence_depth):
+            raise NullArgumentException("GENERATOR AND SEARCH LIMITS CANNOT BE NULLS!")
+        if workers is not None and workers < 1:
+            raise IllegalArgumentException("NUMBER OF WORKERS HAS TO BE POSITIVE!")
+        if max_depth < 1 or max_depth > MoveEnum.MAX_SEARCH_PLY.value:
+            raise IllegalArgumentException("MAX DEPTH IS NOT WITHIN ACCEPTABLE BOUNDS!")
+        if time_limit <= 0 or transposition_size_mb <= 0:
+            raise IllegalArgumentException("TIME LIMIT AND TRANSPOSITION TABLE SIZE HAVE TO BE POSITIVE!")
+        if quiescence_depth < 0:
+            raise IllegalArgumentException("QUIESCENCE DEPTH CANNOT BE NEGATIVE!")
+        self.__generator: Generator = generator
+        self.__workers: int = (cpu_count() or 1) if workers is None else workers
+        self.__max_depth: int = max_depth
+        self.__time_limit: float = time_limit
+        self.__nodes: int = 0
+        self.__completed_depth: int = 0
+        self.__stop_event: StopEvent = Event()
+        self.__executor: ProcessPoolExecutor = ProcessPoolExecutor(self.__workers,
+                                                                   initializer=RootSearchWorker.initialize_process,
+                                                                   initargs=(self.__stop_event, transposition_size_mb,
+                                                                             quiescence_depth))
+
+    def get_computer_move(self, board: 'Board') -> int:
+        """
+        Method used to return best computer move possible. Search is iteratively deepened from depth 1 up to max depth
+        until time runs out or stop is requested and the best move of the last completed iteration is returned. Root
+        moves of every iteration are ordered by evaluations of the previous one.
+        :param board: Board instance
+        :return: the best computer move encoded as int
+        """
+        if board is None:
+            raise NullArgumentException("BOARD CANNOT BE NULL!")
+        moves_list: MoveList = self.__generator.generate_legal_moves(board.engine_color(), board)
+        self.__stop_event.clear()
+        self.__nodes = 0
+        self.__completed_depth = 0
+
+        if moves_list.is_empty():
+            return NO_MOVE
+        moves_list.score_moves(board)
+        root_moves: List[int] = [moves_list.pick_best_move(index) for index in range(moves_list.size())]
+        snapshot: BoardSnapshot = BoardSnapshot.create(board)
+        deadline: float = perf_counter() + self.__time_limit
+
+        for depth in range(1, self.__max_depth + 1):
+            evaluations, stopped = self.__search_iteration(snapshot, root_moves, depth, deadline)
+
+            if stopped:
+                break
+            root_moves.sort(key=evaluations.__getitem__, reverse=True)
+            self.__completed_depth = depth
+        return root_moves[0]
+
+    def stop_search(self) -> None:
+        """
+        Method used to request stop of running search. Stop is shared with every worker process.
+        :return: None
+        """
+        self.__stop_event.set()
+
+    def shutdown(self) -> None:
+        """
+        Method used to stop running search and to close worker processes. Engine cannot search after it.
+        :return: None
+        """
+        self.__stop_event.set()
+        self.__executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_workers(self) -> int:
+        """
+        Gives access to number of worker processes
+        :return: int
+        """
+        return self.__workers
+
+    def get_searched_nodes(self) -> int:
+        """
+        Gives access to number of nodes searched by every worker during the last search
+        :return: int
+        """
+        return self.__nodes
+
+    def get_completed_depth(self) -> int:
+        """
+        Gives access to depth of the last fully completed iteration
+        :return: int
+        """
+        return self.__completed_depth
+
+    def __search_iteration(self, snapshot: BoardSnapshot, root_moves: List[int], depth: int,
+                           deadline: float) -> Tuple[Dict[int, float], bool]:
+        """
+        Method used to search every root move to given depth in batches of worker count size. Batch is submitted
+        with alpha of the best evaluation of previous batches, so workers can cut off moves which cannot be better.
+        :param snapshot: BoardSnapshot instance of root position
+        :param root_moves: list of int encoded root moves in search order
+        :param depth: int depth of iteration counted from the root
+        :param deadline: float perf counter value at which search has to stop
+        :return: tuple of evaluations of root moves and whether iteration was stopped
+        """
+        evaluations: Dict[int, float] = {}
+        alpha: float = -inf
+
+        for start in range(0, len(root_moves), self.__workers):
+            time_left: float = deadline - perf_counter()
+
+            if time_left <= 0 or self.__stop_event.is_set():
+                return evaluations, True
+            futures: List[Future] = [self.__executor.submit(RootSearchWorker.search_in_process, snapshot, move, depth,
+                                                            alpha, time_left)
+                                     for move in root_moves[start:start + self.__workers]]
+            stopped: bool = False
+
+            for future in futures:
+                move, evaluation, nodes, move_stopped = future.result()
+                self.__nodes += nodes
+                evaluations[move] = evaluation
+                stopped = stopped or move_stopped
+
+            if stopped:
+                return evaluations, True
+            alpha = max(alpha, max(evaluations.values()))
+        return evaluations, False
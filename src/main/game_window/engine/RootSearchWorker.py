@@ -0,0 +1,90 @@
+from multiprocessing.synchronize import Event
+from os import getpid
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.board.BoardSnapshot import BoardSnapshot
+from game_window.board.fen.FenData import FenData
+from game_window.board.fen.FenMaker import FenMaker
+from game_window.board.GameBoard import GameBoard
+from game_window.engine.EnginePlayer import EnginePlayer
+from game_window.engine.Evaluator import Evaluator
+from game_window.engine.TranspositionTable import TranspositionTable
+from game_window.enums.MoveEnum import MoveEnum
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.moving.generation.MoveGenerator import MoveGenerator
+
+
+class RootSearchWorker:
+    """
+    Class searching root moves inside of engine worker process. Every process keeps one worker with its own board,
+    transposition table and move history for its whole life, so they are created only once and reused by every search.
+    """
+
+    __slots__ = ("__board", "__engine")
+
+    def __init__(self, stop_condition: Callable[[], bool], transposition_size_mb: int, quiescence_depth: int) -> None:
+        if stop_condition is None or transposition_size_mb is None or quiescence_depth is None:
+            raise NullArgumentException("STOP CONDITION, TRANSPOSITION SIZE AND QUIESCENCE DEPTH CANNOT BE NULLS!")
+        generator: MoveGenerator = MoveGenerator()
+        self.__board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), generator)
+        self.__engine: EnginePlayer = EnginePlayer(generator, Evaluator(), TranspositionTable(transposition_size_mb),
+                                                   max_depth=MoveEnum.MAX_SEARCH_PLY.value,
+                                                   quiescence_depth=quiescence_depth, stop_condition=stop_condition)
+
+    def search_root_move(self, snapshot: BoardSnapshot, move: int, depth: int, alpha: float,
+                         time_limit: float) -> Tuple[int, float, int, bool]:
+        """
+        Method used to search engine move of position given as snapshot
+        :param snapshot: BoardSnapshot instance of searched position
+        :param move: int encoded legal engine move
+        :param depth: int depth counted from the root
+        :param alpha: float value of the best evaluation already known by the root
+        :param time_limit: float seconds search can take
+        :return: tuple of move, its evaluation, number of searched nodes and whether search was stopped
+        """
+        if snapshot is None or move is None or depth is None or alpha is None or time_limit is None:
+            raise NullArgumentException("SNAPSHOT, MOVE, DEPTH, ALPHA AND TIME LIMIT CANNOT BE NULLS!")
+        if time_limit <= 0:
+            raise IllegalArgumentException("TIME LIMIT HAS TO BE POSITIVE!")
+        snapshot.restore(self.__board)
+        evaluation: float = self.__engine.search_root_move(self.__board, move, depth, alpha, time_limit=time_limit)
+        nodes: int = self.__engine.get_searched_nodes() + self.__engine.get_quiescence_nodes()
+
+        return move, evaluation, nodes, self.__engine.is_search_stopped()
+
+    @staticmethod
+    def initialize_process(stop_event: Event, transposition_size_mb: int, quiescence_depth: int) -> None:
+        """
+        Method run once by every process of the pool to create its worker
+        :param stop_event: Event shared by every process, search stops once it is set
+        :param transposition_size_mb: int size of worker transposition table in megabytes
+        :param quiescence_depth: int maximal depth of quiescence search
+        :return: None
+        """
+        PROCESS_WORKERS[getpid()] = RootSearchWorker(stop_event.is_set, transposition_size_mb, quiescence_depth)
+
+    @staticmethod
+    def search_in_process(snapshot: BoardSnapshot, move: int, depth: int, alpha: float,
+                          time_limit: float) -> Tuple[int, float, int, bool]:
+        """
+        Method submitted to the pool, it searches root move with worker of current process
+        :param snapshot: BoardSnapshot instance of searched position
+        :param move: int encoded legal engine move
+        :param depth: int depth counted from the root
+        :param alpha: float value of the best evaluation already known by the root
+        :param time_limit: float seconds search can take
+        :return: tuple of move, its evaluation, number of searched nodes and whether search was stopped
+        """
+        worker: Optional[RootSearchWorker] = PROCESS_WORKERS.get(getpid())
+
+        if worker is None:
+            raise IllegalArgumentException("PROCESS WAS NOT INITIALIZED WITH ROOT SEARCH WORKER!")
+        return worker.search_root_move(snapshot, move, depth, alpha, time_limit)
+
+
+PROCESS_WORKERS: Dict[int, RootSearchWorker] = {}
@@ -0,0 +1,198 @@
+from array import array
+from typing import Tuple
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.enums.TranspositionEnum import TranspositionEnum
+from game_window.moving.generation.data.MoveUtil import NO_MOVE
+
+
+class TranspositionTable:
+    """
+    Fixed size transposition table keyed by Zobrist key. Entries are stored in parallel typed arrays
+    and grouped into buckets: with TWO_TIER scheme every bucket has a depth-preferred slot and an always-replace slot.
+    """
+
+    __slots__ = ("__keys", "__moves", "__scores", "__depths", "__bounds", "__ages", "__bucket_mask", "__bucket_size",
+                 "__replacement_scheme", "__age", "__probes", "__hits")
+
+    def __init__(self, size_mb: int = TranspositionEnum.DEFAULT_SIZE_MB.value,
+                 replacement_scheme: int = TranspositionEnum.TWO_TIER.value) -> None:
+        if size_mb is None or replacement_scheme is None:
+            raise NullArgumentException("SIZE AND REPLACEMENT SCHEME CANNOT BE NULLS!")
+        if size_mb <= 0:
+            raise IllegalArgumentException("TRANSPOSITION TABLE SIZE HAS TO BE POSITIVE!")
+        if replacement_scheme not in REPLACEMENT_SCHEMES:
+            raise IllegalArgumentException("SUCH REPLACEMENT SCHEME DOES NOT EXIST!")
+        self.__replacement_scheme: int = replacement_scheme
+        self.__bucket_size: int = 2 if replacement_scheme == TWO_TIER else 1
+        max_buckets: int = size_mb * BYTES_IN_MB // (TranspositionEnum.ENTRY_SIZE_BYTES.value * self.__bucket_size)
+        buckets: int = 1 << (max_buckets.bit_length() - 1)
+        entries: int = buckets * self.__bucket_size
+
+        self.__bucket_mask: int = buckets - 1
+        self.__keys: array = array("Q", bytes(8 * entries))
+        self.__moves: array = array("H", bytes(2 * entries))
+        self.__scores: array = array("d", bytes(8 * entries))
+        self.__depths: array = array("b", bytes(entries))
+        self.__bounds: array = array("b", bytes(entries))
+        self.__ages: array = array("B", bytes(entries))
+        self.__age: int = 0
+        self.__probes: int = 0
+        self.__hits: int = 0
+
+    def probe(self, key: int) -> int:
+        """
+        Looks for an entry of given position
+        :param key: int 64-bit Zobrist key of position
+        :return: int index of entry to be read with getters or NO_ENTRY if position is not stored
+        """
+        self.__probes += 1
+        first_slot: int = (key & self.__bucket_mask) * self.__bucket_size
+
+        for slot in range(first_slot, first_slot + self.__bucket_size):
+            if self.__keys[slot] == key and self.__bounds[slot] != NONE_BOUND:
+                self.__hits += 1
+                return slot
+        return NO_ENTRY
+
+    def store(self, key: int, depth: int, bound: int, score: float, move: int) -> None:
+        """
+        Stores search result of position according to replacement scheme
+        :param key: int 64-bit Zobrist key of position
+        :param depth: int depth position was searched to
+        :param bound: int bound type (EXACT_BOUND, LOWER_BOUND or UPPER_BOUND)
+        :param score: float score of position
+        :param move: int encoded best move or NO_MOVE
+        :return: None
+        """
+        slot: int = (key & self.__bucket_mask) * self.__bucket_size
+
+        if self.__replacement_scheme != ALWAYS_REPLACE and not self.__can_replace(slot, key, depth):
+            if self.__replacement_scheme == DEPTH_PREFERRED:
+                return
+            slot += 1
+        elif self.__replacement_scheme == TWO_TIER and self.__keys[slot] != key:
+            self.__copy_entry(slot, slot + 1)
+
+        if move == NO_MOVE and self.__keys[slot] == key:
+            move = self.__moves[slot]
+        self.__keys[slot] = key
+        self.__depths[slot] = depth
+        self.__bounds[slot] = bound
+        self.__scores[slot] = score
+        self.__moves[slot] = move
+        self.__ages[slot] = self.__age
+
+    def __can_replace(self, slot: int, key: int, depth: int) -> bool:
+        """
+        Checks if depth-preferred slot can be overwritten. It can be if it stores the same position, shallower search
+        or an entry from one of previous searches.
+        :param slot: int index of depth-preferred slot
+        :param key: int 64-bit Zobrist key of new position
+        :param depth: int depth of new entry
+        :return: bool
+        """
+        return self.__keys[slot] == key or depth >= self.__depths[slot] or self.__ages[slot] != self.__age or \
+            self.__bounds[slot] == NONE_BOUND
+
+    def __copy_entry(self, source_slot: int, target_slot: int) -> None:
+        """
+        Copies entry between slots. Used to move old entry of depth-preferred slot into always-replace one.
+        :param source_slot: int index of copied entry
+        :param target_slot: int index of overwritten entry
+        :return: None
+        """
+        self.__keys[target_slot] = self.__keys[source_slot]
+        self.__depths[target_slot] = self.__depths[source_slot]
+        self.__bounds[target_slot] = self.__bounds[source_slot]
+        self.__scores[target_slot] = self.__scores[source_slot]
+        self.__moves[target_slot] = self.__moves[source_slot]
+        self.__ages[target_slot] = self.__ages[source_slot]
+
+    def get_depth(self, entry: int) -> int:
+        """
+        Gives access to depth of probed entry
+        :param entry: int index returned by probe
+        :return: int depth
+        """
+        return self.__depths[entry]
+
+    def get_bound(self, entry: int) -> int:
+        """
+        Gives access to bound type of probed entry
+        :param entry: int index returned by probe
+        :return: int bound type
+        """
+        return self.__bounds[entry]
+
+    def get_score(self, entry: int) -> float:
+        """
+        Gives access to score of probed entry
+        :param entry: int index returned by probe
+        :return: float score
+        """
+        return self.__scores[entry]
+
+    def get_move(self, entry: int) -> int:
+        """
+        Gives access to best move of probed entry
+        :param entry: int index returned by probe
+        :return: int encoded move or NO_MOVE
+        """
+        return self.__moves[entry]
+
+    def new_search(self) -> None:
+        """
+        Marks beginning of a new search, so entries of previous searches are replaced first
+        :return: None
+        """
+        self.__age = (self.__age + 1) & MAX_AGE
+
+    def clear(self) -> None:
+        """
+        Removes every entry and resets counters. Used when a new game starts.
+        :return: None
+        """
+        entries: int = len(self.__keys)
+
+        self.__keys[:] = array("Q", bytes(8 * entries))
+        self.__bounds[:] = array("b", bytes(entries))
+        self.__depths[:] = array("b", bytes(entries))
+        self.__age = 0
+        self.__probes = 0
+        self.__hits = 0
+
+    def size(self) -> int:
+        """
+        Returns number of entries table can hold
+        :return: int
+        """
+        return len(self.__keys)
+
+    def probes(self) -> int:
+        """
+        Returns number of probes since last clear
+        :return: int
+        """
+        return self.__probes
+
+    def hits(self) -> int:
+        """
+        Returns number of successful probes since last clear
+        :return: int
+        """
+        return self.__hits
+
+
+BYTES_IN_MB: int = 1 << 20
+MAX_AGE: int = 0xFF
+NO_ENTRY: int = TranspositionEnum.NO_ENTRY.value
+NONE_BOUND: int = TranspositionEnum.NONE_BOUND.value
+EXACT_BOUND: int = TranspositionEnum.EXACT_BOUND.value
+LOWER_BOUND: int = TranspositionEnum.LOWER_BOUND.value
+UPPER_BOUND: int = TranspositionEnum.UPPER_BOUND.value
+ALWAYS_REPLACE: int = TranspositionEnum.ALWAYS_REPLACE.value
+DEPTH_PREFERRED: int = TranspositionEnum.DEPTH_PREFERRED.value
+TWO_TIER: int = TranspositionEnum.TWO_TIER.value
+REPLACEMENT_SCHEMES: Tuple[int, ...] = (ALWAYS_REPLACE, DEPTH_PREFERRED, TWO_TIER)
@@ -0,0 +1,348 @@
+import math
+from typing import List
+from typing import Tuple
+
+from numpy import arange
+from numpy import array
+from numpy import bool_
+from numpy import dtype
+from numpy import float64
+from numpy import full
+from numpy import int8
+from numpy import int16
+from numpy import intp
+from numpy import ndarray
+from numpy import ones
+from numpy import take_along_axis
+from numpy import trunc
+from numpy import where
+from numpy import zeros
+from numpy.typing import NDArray
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.board.BoardUtil import BoardUtil
+from game_window.ColorManager import ColorManager
+from game_window.engine.static_eval.MaterialEval import PIECES_VALUES_ARRAY
+from game_window.engine.static_eval.PieceSquareTables import PieceSquareTables
+from game_window.enums.BoardEnum import BoardEnum
+from game_window.enums.EvalEnum import EvalEnum
+from game_window.enums.MoveEnum import MoveEnum
+from game_window.enums.PiecesEnum import PiecesEnum
+
+
+class BatchStaticEvaluator:
+    """
+    Class evaluating whole stack of board arrays at once with vectorized NumPy operations. Every term gives the same
+    values as its StaticEvaluator counterpart and terms are summed in the same order, so scores are equal to
+    evaluate_static_position of every single board. Meant for offline evaluation of large sets of positions.
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def evaluate_positions(boards_arrays: NDArray[int8], engine_color: int,
+                           favor_color: int) -> NDArray[float64]:
+        """
+        Method used to evaluate every board of given stack
+        :param boards_arrays: int8 array of shape (N, 64) with board arrays of the same orientation
+        :param engine_color: int value of engine color which decides orientation of boards
+        :param favor_color: int value of favor_color in favor of which we evaluate positions
+        :return: float64 array of N evaluations
+        """
+        if boards_arrays is None or engine_color is None or favor_color is None:
+            raise NullArgumentException("BOARDS ARRAYS, ENGINE COLOR AND FAVOR COLOR CANNOT BE NULLS!")
+        if not ColorManager.is_it_valid_color(engine_color) or not ColorManager.is_it_valid_color(favor_color):
+            raise IllegalArgumentException("WRONG COLOR ARGUMENT!")
+        if boards_arrays.ndim != 2 or boards_arrays.shape[1] != BOARD_SIZE:
+            raise IllegalArgumentException("BOARDS ARRAYS HAVE TO BE OF SHAPE (N, 64)!")
+        pieces: NDArray[intp] = boards_arrays.astype(intp)
+
+        material_eval = BatchStaticEvaluator.evaluate_pieces_on_board(pieces, engine_color, favor_color)
+        center_possession_eval = BatchStaticEvaluator.evaluate_center_possession(pieces, favor_color)
+        light_dev_eval = BatchStaticEvaluator.evaluate_light_pieces_walked(pieces, engine_color, favor_color)
+        king_pressure = BatchStaticEvaluator.evaluate_king_pressure(pieces, favor_color)
+        bishops = BatchStaticEvaluator.evaluate_bishops(pieces, favor_color)
+        free_lines = BatchStaticEvaluator.evaluate_free_lines_for_rooks(pieces, favor_color)
+        chains = BatchStaticEvaluator.evaluate_pawn_chains(pieces, favor_color)
+        connection = BatchStaticEvaluator.eval_rook_connection(pieces, favor_color)
+
+        static_eval = 1.2 * material_eval + center_possession_eval + light_dev_eval + king_pressure + free_lines
+        static_eval += chains + bishops + connection
+
+        return static_eval.astype(float64)
+
+    @staticmethod
+    def get_colors(pieces: NDArray[intp]) -> NDArray[intp]:
+        """
+        Method used to get color of every square
+        :param pieces: array of shape (N, 64) with board arrays
+        :return: array of shape (N, 64) with colors of pieces (0 for empty squares)
+        """
+        return pieces & COLORS_MASK
+
+    @staticmethod
+    def get_signs(colors: NDArray[intp], favor_color: int) -> NDArray[intp]:
+        """
+        Method used to get evaluation sign of every square
+        :param colors: array of shape (N, 64) with colors of pieces
+        :param favor_color: int value of favor_color
+        :return: array of shape (N, 64) with 1 for favor pieces, -1 for enemy pieces and 0 for empty squares
+        """
+        return (colors == favor_color).astype(intp) - (colors == ColorManager.get_opposite_piece_color(favor_color))
+
+    @staticmethod
+    def evaluate_pieces_on_board(pieces: NDArray[intp], engine_color: int,
+                                 favor_color: int) -> NDArray[intp]:
+        """
+        Method used to sum value of pieces and their squares
+        :param pieces: array of shape (N, 64) with board arrays
+        :param engine_color: int value of engine color
+        :param favor_color: int value of favor_color
+        :return: array of N evaluations
+        """
+        table: NDArray[int16] = PieceSquareTables.create_piece_square_table(engine_color)
+        colors: NDArray[intp] = BatchStaticEvaluator.get_colors(pieces)
+        values: NDArray[intp] = pieces & PIECE_MASK
+        points: NDArray[intp] = table[colors, values, SQUARES] + PIECES_VALUES_ARRAY.take(values)
+
+        return (points * BatchStaticEvaluator.get_signs(colors, favor_color)).sum(axis=1)
+
+    @staticmethod
+    def evaluate_center_possession(pieces: NDArray[intp], favor_color: int) -> NDArray[intp]:
+        """
+        Method used to evaluate a center possession
+        :param pieces: array of shape (N, 64) with board arrays
+        :param favor_color: int value of favor_color
+        :return: array of N evaluations
+        """
+        signs: NDArray[intp] = BatchStaticEvaluator.get_signs(BatchStaticEvaluator.get_colors(pieces),
+                                                                          favor_color)
+        return (signs * CENTER_POINTS).sum(axis=1)
+
+    @staticmethod
+    def evaluate_light_pieces_walked(pieces: NDArray[intp], engine_color: int,
+                                     favor_color: int) -> NDArray[intp]:
+        """
+        Method used to evaluate if light pieces are walked from their starting position
+        :param pieces: array of shape (N, 64) with board arrays
+        :param engine_color: int value of engine color
+        :param favor_color: int value of favor_color
+        :return: array of N evaluations
+        """
+        enemy_color: int = ColorManager.get_opposite_piece_color(favor_color)
+        evaluations: List[NDArray[intp]] = []
+
+        for color in (favor_color, enemy_color):
+            positions: Tuple[int, ...] = ENGINE_LIGHT_SQUARES if color == engine_color else PLAYER_LIGHT_SQUARES
+            on_start: NDArray[bool_] = pieces[:, list(positions)] == LIGHT_PIECES | color
+            evaluations.append(where(on_start, -EvalEnum.WALKED.value, EvalEnum.WALKED.value).sum(axis=1))
+        return evaluations[0] - evaluations[1]
+
+    @staticmethod
+    def evaluate_king_pressure(pieces: NDArray[intp], favor_color: int) -> NDArray[float64]:
+        """
+        Method used to evaluate pressure on king. Distances are summed in square order like in KingPressure, so
+        truncated result is the same.
+        :param pieces: array of shape (N, 64) with board arrays
+        :param favor_color: int value of favor_color
+        :return: array of N evaluations
+        """
+        enemy_color: int = ColorManager.get_opposite_piece_color(favor_color)
+        colors: NDArray[intp] = BatchStaticEvaluator.get_colors(pieces)
+        pressures: List[NDArray[float64]] = []
+
+        for color, king_color in ((favor_color, enemy_color), (enemy_color, favor_color)):
+            kings: NDArray[bool_] = pieces == king_color | PiecesEnum.KING.value
+
+            if not kings.any(axis=1).all():
+                raise ValueError("THERE IS NO FRIENDLY KING AND IT IS NOT POSSIBLE!")
+            scores: NDArray[float64] = KING_DISTANCE_SCORES[kings.argmax(axis=1)]
+            pressures.append(where(colors == color, scores, 0.0).cumsum(axis=1)[:, -1])
+        return trunc(pressures[1] - pressures[0])
+
+    @staticmethod
+    def evaluate_bishops(pieces: NDArray[intp], favor_color: int) -> NDArray[float64]:
+        """
+        Method used to evaluate if players have a pair of bishops
+        :param pieces: array of shape (N, 64) with board arrays
+        :param favor_color: int value of favor_color
+        :return: array of N evaluations
+        """
+        enemy_color: int = ColorManager.get_opposite_piece_color(favor_color)
+        favor_pair: NDArray[bool_] = (pieces == favor_color | PiecesEnum.BISHOP.value).sum(axis=1) >= 2
+        enemy_pair: NDArray[bool_] = (pieces == enemy_color | PiecesEnum.BISHOP.value).sum(axis=1) >= 2
+
+        return (favor_pair.astype(float64) - enemy_pair) * EvalEnum.BISHOP_PAIR.value
+
+    @staticmethod
+    def evaluate_free_lines_for_rooks(pieces: NDArray[intp],
+                                      favor_color: int) -> NDArray[float64]:
+        """
+        Method used to evaluate free lines for rooks
+        :param pieces: array of shape (N, 64) with board arrays
+        :param favor_color: int value of favor_color
+        :return: array of N evaluations
+        """
+        occupied: NDArray[intp] = (pieces != PiecesEnum.NONE.value).astype(intp)
+        rooks: NDArray[bool_] = pieces & PIECE_MASK == PiecesEnum.ROOK.value
+        signs: NDArray[intp] = BatchStaticEvaluator.get_signs(BatchStaticEvaluator.get_colors(pieces),
+                                                                          favor_color)
+        horizontal_eval = where(occupied @ ROW_MASKS.T == 0, EvalEnum.FREE_LINE.value, 0)
+        vertical_eval = where(occupied @ TOP_MASKS.T != 0, 0,
+                              where(occupied @ BOTTOM_MASKS.T != 0, EvalEnum.NOT_FREE_LINE.value,
+                                    EvalEnum.FREE_LINE.value))
+
+        return where(rooks, (horizontal_eval + vertical_eval) * signs, 0).sum(axis=1).astype(float64)
+
+    @staticmethod
+    def evaluate_pawn_chains(pieces: NDArray[intp], favor_color: int) -> NDArray[intp]:
+        """
+        Method used to evaluate pawn chains. Every pawn adds lengths of both diagonal chains it belongs to.
+        :param pieces: array of shape (N, 64) with board arrays
+        :param favor_color: int value of favor_color
+        :return: array of N evaluations
+        """
+        enemy_color: int = ColorManager.get_opposite_piece_color(favor_color)
+        grid: NDArray[intp] = pieces.reshape(-1, BOARD_LENGTH, BOARD_LENGTH)
+        evaluations: List[NDArray[intp]] = []
+
+        for color in (favor_color, enemy_color):
+            pawns: NDArray[bool_] = grid == color | PiecesEnum.PAWN.value
+            chains: NDArray[intp] = zeros(pieces.shape[0], dtype=intp)
+
+            for row_step, col_step in CHAIN_DIRECTIONS:
+                chain_lengths: NDArray[intp] = ones(pawns.shape, dtype=intp)
+
+                for step_sign in (1, -1):
+                    in_chain: NDArray[bool_] = pawns
+
+                    for distance in range(1, BOARD_LENGTH):
+                        in_chain = in_chain & BatchStaticEvaluator.shift_grid(pawns, step_sign * distance * row_step,
+                                                                              step_sign * distance * col_step)
+                        chain_lengths += in_chain
+                chains += (chain_lengths * pawns).sum(axis=(1, 2))
+            evaluations.append(chains)
+        return evaluations[0] - evaluations[1]
+
+    @staticmethod
+    def shift_grid(grid: NDArray[bool_], row_shift: int, col_shift: int) -> NDArray[bool_]:
+        """
+        Method used to look at squares moved by given shift from every square of 8x8 grids
+        :param grid: bool array of shape (N, 8, 8)
+        :param row_shift: int rows shift
+        :param col_shift: int columns shift
+        :return: bool array where value of square is value of shifted square (False if it is outside the board)
+        """
+        shifted: NDArray[bool_] = zeros(grid.shape, dtype=bool_)
+        rows: int = BOARD_LENGTH - abs(row_shift)
+        cols: int = BOARD_LENGTH - abs(col_shift)
+
+        if rows <= 0 or cols <= 0:
+            return shifted
+        target_row, source_row = max(-row_shift, 0), max(row_shift, 0)
+        target_col, source_col = max(-col_shift, 0), max(col_shift, 0)
+        shifted[:, target_row:target_row + rows, target_col:target_col + cols] = \
+            grid[:, source_row:source_row + rows, source_col:source_col + cols]
+
+        return shifted
+
+    @staticmethod
+    def eval_rook_connection(pieces: NDArray[intp], favor_color: int) -> NDArray[float64]:
+        """
+        Method used to evaluate rook connections. Like RookEval only the first rook of each color is checked and
+        enemy rooks do not block its lines.
+        :param pieces: array of shape (N, 64) with board arrays
+        :param favor_color: int value of favor_color
+        :return: array of N evaluations
+        """
+        padded: NDArray[intp] = zeros((pieces.shape[0], BOARD_SIZE + 1), dtype=intp)
+        padded[:, :-1] = pieces
+        padded[:, -1] = RAY_END
+        boards_indexes: NDArray[intp] = arange(pieces.shape[0])
+        evaluation: NDArray[float64] = zeros(pieces.shape[0], dtype=float64)
+
+        for color in (favor_color, ColorManager.get_opposite_piece_color(favor_color)):
+            own_rook: int = color | PiecesEnum.ROOK.value
+            rooks: NDArray[bool_] = pieces == own_rook
+            has_rook: NDArray[bool_] = rooks.sum(axis=1) > 0
+            rays: NDArray[intp] = padded[boards_indexes[:, None, None], ROOK_RAYS[rooks.argmax(axis=1)]]
+            stops: NDArray[bool_] = ((rays != PiecesEnum.NONE.value) &
+                                                  (rays & PIECE_MASK != PiecesEnum.ROOK.value)) | (rays == own_rook)
+            first_stops: NDArray[intp] = take_along_axis(rays, stops.argmax(axis=2)[:, :, None],
+                                                                     axis=2)[:, :, 0]
+            connection_eval = where((first_stops == own_rook).any(axis=1), EvalEnum.CONNECTED_ROOKS.value,
+                                    EvalEnum.NOT_CONNECTED_ROOKS.value)
+            evaluation += where(has_rook, connection_eval if color == favor_color else -connection_eval, 0)
+        return evaluation
+
+    @staticmethod
+    def create_lines_masks() -> Tuple[NDArray[intp], NDArray[intp], NDArray[intp]]:
+        """
+        Creates masks of squares checked by RookEval free lines evaluation
+        :return: tuple of row, top and bottom masks, each of shape (64, 64) indexed by rook square
+        """
+        distances: ndarray[int, dtype[int8]] = BoardUtil.calculate_distance_to_borders()
+        masks: NDArray[intp] = zeros((len(LINES_DIRECTIONS), BOARD_SIZE, BOARD_SIZE), dtype=intp)
+
+        for square in range(BOARD_SIZE):
+            for mask_index, directions in enumerate(LINES_DIRECTIONS):
+                for direction_index in directions:
+                    step: int = MoveEnum.SLIDING_DIRECTIONS.value[direction_index]
+
+                    for distance in range(1, distances[square][direction_index] + 1):
+                        masks[mask_index, square, square + distance * step] = 1
+        return masks[0], masks[1], masks[2]
+
+    @staticmethod
+    def create_rook_rays() -> NDArray[intp]:
+        """
+        Creates squares of rook lines of every square, padded with index of square outside the board
+        :return: array of shape (64, 4, 8)
+        """
+        distances: ndarray[int, dtype[int8]] = BoardUtil.calculate_distance_to_borders()
+        rays: NDArray[intp] = full((BOARD_SIZE, len(MoveEnum.ROOK_DIRECTIONS.value), BOARD_LENGTH),
+                                               BOARD_SIZE, dtype=intp)
+
+        for square in range(BOARD_SIZE):
+            for index, direction in enumerate(MoveEnum.ROOK_DIRECTIONS_INDEXES.value):
+                for direction_step in range(distances[square][direction]):
+                    rays[square, index, direction_step] = \
+                        square + (direction_step + 1) * MoveEnum.ROOK_DIRECTIONS.value[index]
+        return rays
+
+    @staticmethod
+    def create_king_distance_scores() -> NDArray[float64]:
+        """
+        Creates KingPressure scores of piece standing on every square against king on every square
+        :return: array of shape (64, 64) indexed by king square and piece square
+        """
+        scores: NDArray[float64] = zeros((BOARD_SIZE, BOARD_SIZE))
+
+        for king_square in range(BOARD_SIZE):
+            for square in range(BOARD_SIZE):
+                x_diff: int = king_square // BOARD_LENGTH - square // BOARD_LENGTH
+                y_diff: int = king_square % BOARD_LENGTH - square % BOARD_LENGTH
+                scores[king_square, square] = 8 * math.sqrt(2) - math.sqrt(x_diff * x_diff + y_diff * y_diff)
+        return scores
+
+
+BOARD_LENGTH: int = BoardEnum.BOARD_LENGTH.value
+BOARD_SIZE: int = BoardEnum.BOARD_SIZE.value
+COLORS_MASK: int = PiecesEnum.WHITE.value | PiecesEnum.BLACK.value
+PIECE_MASK: int = 0b111
+RAY_END: int = -1
+SQUARES: NDArray[intp] = arange(BOARD_SIZE, dtype=intp)
+CENTER_POINTS: NDArray[intp] = array([
+    EvalEnum.SIDE_CENTER.value * (square in BoardEnum.CENTER_SIDE_SQUARES.value) +
+    EvalEnum.MAIN_CENTER.value * (square in BoardEnum.CENTER_MAIN_SQUARES.value)
+    for square in range(BOARD_SIZE)], dtype=intp)
+ENGINE_LIGHT_SQUARES: Tuple[int, ...] = (1, 2, 5, 6)
+PLAYER_LIGHT_SQUARES: Tuple[int, ...] = (57, 58, 61, 62)
+LIGHT_PIECES: NDArray[intp] = array([PiecesEnum.KNIGHT.value, PiecesEnum.BISHOP.value,
+                                                 PiecesEnum.BISHOP.value, PiecesEnum.KNIGHT.value], dtype=intp)
+CHAIN_DIRECTIONS: Tuple[Tuple[int, int], ...] = ((1, 1), (1, -1))
+LINES_DIRECTIONS: Tuple[Tuple[int, ...], ...] = ((3, 4), (1,), (6,))
+ROW_MASKS, TOP_MASKS, BOTTOM_MASKS = BatchStaticEvaluator.create_lines_masks()
+ROOK_RAYS: NDArray[intp] = BatchStaticEvaluator.create_rook_rays()
+KING_DISTANCE_SCORES: NDArray[float64] = BatchStaticEvaluator.create_king_distance_scores()
@@ -0,0 +1,76 @@
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from numpy import array
+from numpy import dtype
+from numpy import int8
+from numpy import int16
+from numpy import ndarray
+from numpy.typing import NDArray
+
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.ColorManager import ColorManager
+from game_window.engine.static_eval.PieceSquareTables import PieceSquareTables
+from game_window.engine.static_eval.StaticEvalUtil import StaticEvalUtil
+from game_window.enums.PiecesEnum import PiecesEnum
+
+if TYPE_CHECKING:
+    from game_window.board.Board import Board
+
+
+class MaterialEval:
+    """
+    Class containing methods to evaluate material and piece square points. Board keeps their sum as running total
+    updated on every square change, so evaluation does not loop over the board.
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def evaluate_material(board: 'Board', favor_color: int) -> float:
+        """
+        Method used to get material and piece square evaluation from running total of board
+        :param board: Board instance
+        :param favor_color: int value of favor_color
+        :return: float value of evaluation
+        """
+        if board is None or favor_color is None:
+            raise NullArgumentException("BOARD AND FAVOR COLOR CANNOT BE NULLS!")
+        return StaticEvalUtil.return_proper_evaluation_sign_value(board.material_score(), favor_color,
+                                                                  board.engine_color())
+
+    @staticmethod
+    def get_piece_points(piece: int, square: int, table: NDArray[int16], engine_color: int) -> int:
+        """
+        Method used to get points of piece standing on given square from engine point of view
+        :param piece: int value of piece with its color (0 for empty square)
+        :param square: int index of square
+        :param table: int16 piece square table indexed by color, piece value and square
+        :param engine_color: int value of engine color
+        :return: int points, positive for engine pieces and negative for player pieces
+        """
+        if piece == PiecesEnum.NONE.value:
+            return 0
+        piece_color: int = ColorManager.get_piece_color(piece)
+        points: int = PIECES_VALUES[piece - piece_color] + int(table[piece_color, piece - piece_color, square])
+
+        return points if piece_color == engine_color else -points
+
+    @staticmethod
+    def calculate_material_score(board_array: ndarray[int, dtype[int8]], table: NDArray[int16],
+                                 engine_color: int) -> int:
+        """
+        Calculates from scratch material and piece square points of engine pieces minus player pieces
+        :param board_array: ndarray of board 1D
+        :param table: int16 piece square table indexed by color, piece value and square
+        :param engine_color: int value of engine color
+        :return: int score
+        """
+        if board_array is None or table is None or engine_color is None:
+            raise NullArgumentException("BOARD ARRAY, TABLE AND ENGINE COLOR CANNOT BE NULLS!")
+        return PieceSquareTables.sum_piece_square_points(board_array, table, PIECES_VALUES_ARRAY, engine_color)
+
+
+PIECES_VALUES: Tuple[int, ...] = (0,) + tuple(StaticEvalUtil.get_piece_point_value(piece)
+                                              for piece in PiecesEnum.PIECES_TUPLE.value[1:])
+PIECES_VALUES_ARRAY: NDArray[int16] = array(PIECES_VALUES, dtype=int16)
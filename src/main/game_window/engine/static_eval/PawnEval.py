@@ -1,3 +1,5 @@
+from typing import Optional
+from typing import Tuple
 from typing import TYPE_CHECKING
 
 from numpy import dtype
@@ -5,8 +7,10 @@
 from numpy import ndarray
 
 from game_window.ColorManager import ColorManager
+from game_window.engine.static_eval.PawnHashTable import PawnHashTable
 from game_window.enums.BoardEnum import BoardEnum
 from game_window.enums.MoveEnum import MoveEnum
+from game_window.enums.PawnHashEnum import PawnHashEnum
 from game_window.enums.PiecesEnum import PiecesEnum
 
 if TYPE_CHECKING:
@@ -21,15 +25,22 @@ class PawnEval:
     __slots__ = ()
 
     @staticmethod
-    def evaluate_pawn_chains(board: 'Board', favor_color: int) -> float:
+    def evaluate_pawn_chains(board: 'Board', favor_color: int, pawn_table: Optional[PawnHashTable] = None) -> float:
         """
         Method used to evaluate pawn chains on board
         :param board: Board instance
         :param favor_color: int value of favor_color
+        :param pawn_table: PawnHashTable instance caching chains of pawn structures, None to always calculate them
         :return: float
         """
         enemy_color: int = ColorManager.get_opposite_piece_color(favor_color)
 
+        if pawn_table is not None:
+            white_chains, black_chains = PawnEval.get_cached_pawn_chains(board, pawn_table)
+
+            return white_chains - black_chains if favor_color == PiecesEnum.WHITE.value else \
+                black_chains - white_chains
+
         favor_eval: float = PawnEval.get_pawn_chains_eval(board, favor_color)
         enemy_eval: float = PawnEval.get_pawn_chains_eval(board, enemy_color)
 
@@ -37,6 +48,26 @@ def evaluate_pawn_chains(board: 'Board', favor_color: int) -> float:
 
         return evaluation
 
+    @staticmethod
+    def get_cached_pawn_chains(board: 'Board', pawn_table: PawnHashTable) -> Tuple[int, int]:
+        """
+        Method used to get pawn chains evaluations from pawn hash table. On miss they are calculated and stored.
+        :param board: Board instance
+        :param pawn_table: PawnHashTable instance
+        :return: tuple of white and black pawn chains evaluations
+        """
+        pawn_key: int = board.pawn_key()
+        entry: int = pawn_table.probe(pawn_key)
+
+        if entry != PawnHashEnum.NO_ENTRY.value:
+            return pawn_table.get_chains(entry, PiecesEnum.WHITE.value), \
+                pawn_table.get_chains(entry, PiecesEnum.BLACK.value)
+        white_chains: int = PawnEval.get_pawn_chains_eval(board, PiecesEnum.WHITE.value)
+        black_chains: int = PawnEval.get_pawn_chains_eval(board, PiecesEnum.BLACK.value)
+
+        pawn_table.store(pawn_key, white_chains, black_chains)
+        return white_chains, black_chains
+
     @staticmethod
     def is_friendly_pawn(board: 'Board', square: int, piece_color: int) -> bool:
         """
@@ -125,12 +156,12 @@ def get_right_leaning_chain(board: 'Board', index: int, color: int, step_right:
         return len(right_leaning_chain)
 
     @staticmethod
-    def get_pawn_chains_eval(board: 'Board', color: int) -> float:
+    def get_pawn_chains_eval(board: 'Board', color: int) -> int:
         """
         Method used to evaluate pawn chains for current favor_color
         :param board: Board instance
         :param color: int value of favor_color
-        :return: float
+        :return: int
         """
         step_left = MoveEnum.TOP_LEFT.value if color == board.player_color() else MoveEnum.BOTTOM_LEFT.value
         step_right = MoveEnum.TOP_RIGHT.value if color == board.player_color() else MoveEnum.BOTTOM_RIGHT.value
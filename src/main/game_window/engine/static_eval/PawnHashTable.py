@@ -0,0 +1,114 @@
+from array import array
+from typing import Dict
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.ColorManager import ColorManager
+from game_window.enums.PawnHashEnum import PawnHashEnum
+from game_window.enums.PiecesEnum import PiecesEnum
+
+
+class PawnHashTable:
+    """
+    Fixed size table of pawn chains evaluations keyed by pawn-only Zobrist key. Chains of both colors depend only
+    on pawns, so one entry stores them for white and black. Every slot is always replaced.
+    """
+
+    __slots__ = ("__keys", "__filled", "__chains", "__mask", "__probes", "__hits")
+
+    def __init__(self, entries: int = PawnHashEnum.DEFAULT_ENTRIES.value) -> None:
+        if entries is None:
+            raise NullArgumentException("ENTRIES CANNOT BE NULL!")
+        if entries <= 0:
+            raise IllegalArgumentException("PAWN HASH TABLE SIZE HAS TO BE POSITIVE!")
+        entries = 1 << (entries.bit_length() - 1)
+
+        self.__mask: int = entries - 1
+        self.__keys: array = array("Q", bytes(8 * entries))
+        self.__filled: array = array("B", bytes(entries))
+        self.__chains: Dict[int, array] = {
+            PiecesEnum.WHITE.value: array("l", bytes(array("l").itemsize * entries)),
+            PiecesEnum.BLACK.value: array("l", bytes(array("l").itemsize * entries))
+        }
+        self.__probes: int = 0
+        self.__hits: int = 0
+
+    def probe(self, key: int) -> int:
+        """
+        Looks for an entry of given pawn structure
+        :param key: int 64-bit pawn-only Zobrist key
+        :return: int index of entry to be read with get_chains or NO_ENTRY if structure is not stored
+        """
+        self.__probes += 1
+        slot: int = key & self.__mask
+
+        if self.__filled[slot] and self.__keys[slot] == key:
+            self.__hits += 1
+            return slot
+        return NO_ENTRY
+
+    def store(self, key: int, white_chains: int, black_chains: int) -> None:
+        """
+        Stores pawn chains evaluations of both colors
+        :param key: int 64-bit pawn-only Zobrist key
+        :param white_chains: int chains evaluation of white pawns
+        :param black_chains: int chains evaluation of black pawns
+        :return: None
+        """
+        slot: int = key & self.__mask
+
+        self.__keys[slot] = key
+        self.__filled[slot] = 1
+        self.__chains[PiecesEnum.WHITE.value][slot] = white_chains
+        self.__chains[PiecesEnum.BLACK.value][slot] = black_chains
+
+    def get_chains(self, entry: int, color: int) -> int:
+        """
+        Gives access to chains evaluation of probed entry
+        :param entry: int index returned by probe
+        :param color: int value of color
+        :return: int chains evaluation
+        """
+        if not ColorManager.is_it_valid_color(color):
+            raise IllegalArgumentException("WRONG COLOR ARGUMENT!")
+        return self.__chains[color][entry]
+
+    def clear(self) -> None:
+        """
+        Removes every entry and resets counters
+        :return: None
+        """
+        self.__filled[:] = array("B", bytes(len(self.__filled)))
+        self.__probes = 0
+        self.__hits = 0
+
+    def size(self) -> int:
+        """
+        Returns number of entries table can hold
+        :return: int
+        """
+        return len(self.__keys)
+
+    def probes(self) -> int:
+        """
+        Returns number of probes since last clear
+        :return: int
+        """
+        return self.__probes
+
+    def hits(self) -> int:
+        """
+        Returns number of successful probes since last clear
+        :return: int
+        """
+        return self.__hits
+
+    def hit_rate(self) -> float:
+        """
+        Returns part of probes which found stored structure
+        :return: float between 0 and 1 (0 if table was not probed)
+        """
+        return self.__hits / self.__probes if self.__probes else 0.0
+
+
+NO_ENTRY: int = PawnHashEnum.NO_ENTRY.value
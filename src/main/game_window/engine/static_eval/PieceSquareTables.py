@@ -0,0 +1,94 @@
+from typing import Dict
+from typing import Tuple
+
+from numpy import arange
+from numpy import asarray
+from numpy import dtype
+from numpy import int8
+from numpy import int16
+from numpy import intp
+from numpy import ndarray
+from numpy import zeros
+from numpy.typing import NDArray
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.ColorManager import ColorManager
+from game_window.enums.BoardEnum import BoardEnum
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.enums.SquaresEval import SquaresEval
+
+
+class PieceSquareTables:
+    """
+    Class creating piece square tables as dense [color][piece][square] arrays. Engine pieces always stand on the upper
+    part of the board, so tables depend on engine color and are created on board setup and when sides are switched.
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def create_piece_square_table(engine_color: int) -> NDArray[int16]:
+        """
+        Creates piece square table of given board orientation
+        :param engine_color: int value of engine color
+        :return: int16 array indexed by color, piece value and square. Empty square points are 0
+        """
+        if engine_color is None:
+            raise NullArgumentException("ENGINE COLOR CANNOT BE NULL!")
+        if not ColorManager.is_it_valid_color(engine_color):
+            raise IllegalArgumentException("WRONG COLOR ARGUMENT!")
+        player_color: int = ColorManager.get_opposite_piece_color(engine_color)
+        table: NDArray[int16] = zeros((TABLE_COLORS, TABLE_PIECES, BoardEnum.BOARD_SIZE.value), dtype=int16)
+
+        for color, side in ((engine_color, ENGINE_SIDE), (player_color, PLAYER_SIDE)):
+            for piece, squares_eval in SIDES_SQUARES_EVALS[side].items():
+                table[color, piece] = squares_eval.value
+        return table
+
+    @staticmethod
+    def sum_piece_square_points(board_array: ndarray[int, dtype[int8]], table: NDArray[int16],
+                                piece_values: NDArray[int16], engine_color: int) -> int:
+        """
+        Sums with vectorized lookups points of every piece on board from engine point of view
+        :param board_array: ndarray of board 1D
+        :param table: int16 array indexed by color, piece value and square
+        :param piece_values: int16 array of points added to every piece indexed by piece value
+        :param engine_color: int value of engine color
+        :return: int points of engine pieces minus points of player pieces
+        """
+        if board_array is None or table is None or piece_values is None or engine_color is None:
+            raise NullArgumentException("BOARD ARRAY, TABLE, PIECE VALUES AND ENGINE COLOR CANNOT BE NULLS!")
+        pieces: NDArray[intp] = asarray(board_array, dtype=intp)
+        colors: NDArray[intp] = pieces & COLORS_MASK
+        values: NDArray[intp] = pieces & PIECE_MASK
+        points: NDArray[int16] = table[colors, values, SQUARES] + piece_values.take(values)
+
+        return int(points[colors == engine_color].sum()) - int(points[colors != engine_color].sum())
+
+
+ENGINE_SIDE: int = 0
+PLAYER_SIDE: int = 1
+TABLE_COLORS: int = PiecesEnum.BLACK.value + 1
+TABLE_PIECES: int = PiecesEnum.QUEEN.value + 1
+COLORS_MASK: int = PiecesEnum.WHITE.value | PiecesEnum.BLACK.value
+PIECE_MASK: int = 0b111
+SQUARES: NDArray[intp] = arange(BoardEnum.BOARD_SIZE.value, dtype=intp)
+SIDES_SQUARES_EVALS: Tuple[Dict[int, SquaresEval], ...] = (
+    {
+        PiecesEnum.KING.value: SquaresEval.ENGINE_KING,
+        PiecesEnum.PAWN.value: SquaresEval.ENGINE_PAWN,
+        PiecesEnum.KNIGHT.value: SquaresEval.KNIGHT,
+        PiecesEnum.BISHOP.value: SquaresEval.ENGINE_BISHOP,
+        PiecesEnum.ROOK.value: SquaresEval.ENGINE_ROOK,
+        PiecesEnum.QUEEN.value: SquaresEval.QUEEN
+    },
+    {
+        PiecesEnum.KING.value: SquaresEval.PLAYER_KING,
+        PiecesEnum.PAWN.value: SquaresEval.PLAYER_PAWN,
+        PiecesEnum.KNIGHT.value: SquaresEval.KNIGHT,
+        PiecesEnum.BISHOP.value: SquaresEval.PLAYER_BISHOP,
+        PiecesEnum.ROOK.value: SquaresEval.PLAYER_ROOK,
+        PiecesEnum.QUEEN.value: SquaresEval.QUEEN
+    }
+)
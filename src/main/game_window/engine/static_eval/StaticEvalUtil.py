@@ -2,7 +2,6 @@
 
 from game_window.enums.EvalEnum import EvalEnum
 from game_window.enums.PiecesEnum import PiecesEnum
-from game_window.enums.SquaresEval import SquaresEval
 
 if TYPE_CHECKING:
     from game_window.board.Board import Board
@@ -62,31 +61,13 @@ def get_piece_point_value(piece_value: int) -> int:
         return pieces_dict[piece_value]
 
     @staticmethod
-    def get_pieces_square_points(piece_value: int, pieces_color: int, square: int, board: 'Board') -> float:
+    def get_pieces_square_points(piece_value: int, pieces_color: int, square: int, board: 'Board') -> int:
         """
         Method used to get an eval value of current square for given piece
         :param board: Board instance
         :param square: int value of current square
         :param piece_value: int value of piece
         :param pieces_color: int value of pieces favor_color
-        :return: float value of eval
+        :return: int value of eval
         """
-        engine_color: int = board.engine_color()
-        player_color: int = board.player_color()
-
-        if piece_value == PiecesEnum.QUEEN.value:
-            return SquaresEval.QUEEN.value[square]
-        if piece_value == PiecesEnum.KNIGHT.value:
-            return SquaresEval.KNIGHT.value[square]
-
-        squares_dict = {
-            (engine_color, PiecesEnum.KING.value): SquaresEval.ENGINE_KING.value[square],
-            (engine_color, PiecesEnum.ROOK.value): SquaresEval.ENGINE_ROOK.value[square],
-            (engine_color, PiecesEnum.PAWN.value): SquaresEval.ENGINE_PAWN.value[square],
-            (engine_color, PiecesEnum.BISHOP.value): SquaresEval.ENGINE_BISHOP.value[square],
-            (player_color, PiecesEnum.KING.value): SquaresEval.PLAYER_KING.value[square],
-            (player_color, PiecesEnum.ROOK.value): SquaresEval.PLAYER_ROOK.value[square],
-            (player_color, PiecesEnum.PAWN.value): SquaresEval.PLAYER_PAWN.value[square],
-            (player_color, PiecesEnum.BISHOP.value): SquaresEval.PLAYER_BISHOP.value[square]
-        }
-        return squares_dict[pieces_color, piece_value]
+        return int(board.piece_square_table()[pieces_color, piece_value, square])
@@ -1,3 +1,4 @@
+from typing import Optional
 from typing import TYPE_CHECKING
 
 from numpy import dtype
@@ -7,7 +8,9 @@
 from game_window.ColorManager import ColorManager
 from game_window.engine.static_eval.KingPressure import KingPressure
 from game_window.engine.static_eval.LightPiecesEval import LightPiecesEval
+from game_window.engine.static_eval.MaterialEval import MaterialEval
 from game_window.engine.static_eval.PawnEval import PawnEval
+from game_window.engine.static_eval.PawnHashTable import PawnHashTable
 from game_window.engine.static_eval.RookEval import RookEval
 from game_window.engine.static_eval.StaticEvaluation import StaticEvaluation
 from game_window.engine.static_eval.StaticEvalUtil import StaticEvalUtil
@@ -24,7 +27,10 @@ class StaticEvaluator(StaticEvaluation):
     Class containing methods for static evaluation
     """
 
-    __slots__ = ()
+    __slots__ = "__pawn_table"
+
+    def __init__(self, pawn_table: Optional[PawnHashTable] = None) -> None:
+        self.__pawn_table: PawnHashTable = PawnHashTable() if pawn_table is None else pawn_table
 
     def evaluate_static_position(self, board: 'Board', favor_color: int) -> float:
         """
@@ -39,7 +45,7 @@ def evaluate_static_position(self, board: 'Board', favor_color: int) -> float:
         king_pressure: float = KingPressure.evaluate_king_pressure(board, favor_color)
         bishops: float = LightPiecesEval.evaluate_bishops(board, favor_color)
         free_lines: float = RookEval.evaluate_free_lines_for_rooks(board, favor_color)
-        chains: float = PawnEval.evaluate_pawn_chains(board, favor_color)
+        chains: float = PawnEval.evaluate_pawn_chains(board, favor_color, self.__pawn_table)
         connection: float = RookEval.eval_rook_connection(board, favor_color)
 
         static_eval: float = 1.2 * material_eval + center_possession_eval + light_dev_eval + king_pressure + free_lines
@@ -47,27 +53,23 @@ def evaluate_static_position(self, board: 'Board', favor_color: int) -> float:
 
         return static_eval
 
+    def pawn_table(self) -> PawnHashTable:
+        """
+        Gives access to pawn hash table used to cache pawn chains
+        :return: PawnHashTable instance
+        """
+        return self.__pawn_table
+
     @staticmethod
     def evaluate_pieces_on_board(board: 'Board', favor_color: int) -> float:
         """
-        Method used to sum value of pieces on board and return this sum as evaluation
-        :param favor_color:
+        Method used to sum value of pieces on board and their squares and return this sum as evaluation. Sum is kept
+        by the board and updated with every move, so it is not calculated here.
+        :param favor_color: int value of favor_color
         :param board: Board instance
         :return: float value of evaluation
         """
-        evaluation: float = 0
-        board_array: ndarray[int, dtype[int8]] = board.board_array()
-
-        for square, piece in enumerate(board_array):
-            if piece == 0:
-                continue
-            pieces_color: int = ColorManager.get_piece_color(piece)
-            piece_value: int = piece - pieces_color
-            points: float = StaticEvalUtil.get_piece_point_value(piece_value)
-            points += StaticEvalUtil.get_pieces_square_points(piece_value, pieces_color, square, board)
-
-            evaluation += StaticEvalUtil.return_proper_evaluation_sign_value(points, favor_color, pieces_color)
-        return evaluation
+        return MaterialEval.evaluate_material(board, favor_color)
 
     @staticmethod
     def evaluate_center_possession(board: 'Board', favor_color: int) -> float:
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class EvalCacheEnum(Enum):
+    """
+    Enum containing evaluation cache sizes
+    """
+
+    __slots__ = ()
+
+    DEFAULT_ENTRIES: int = 1 << 16
+    NO_ENTRY: int = -1
@@ -63,7 +63,13 @@ class MoveEnum(Enum):
     PLAYER_EN_PASSANT_SQUARES: Tuple[int, ...] = (16, 17, 18, 19, 20, 21, 22, 23)
 
     NONE_EN_PASSANT_SQUARE: int = -1
-    MAX_NUM_OF_MOVES: int = 80
+    MAX_NUM_OF_MOVES: int = 256
+    MAX_SEARCH_PLY: int = 64
+    HASH_MOVE_SCORE: int = 1_000_000
+    CAPTURE_MOVE_SCORE: int = 100_000
+    KILLER_MOVE_SCORE: int = 90_000
+    KILLERS_PER_PLY: int = 2
+    MAX_HISTORY_SCORE: int = 50_000
 
     TOP_DIR: int = 1
     TOP_STEP: int = -8
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class PawnHashEnum(Enum):
+    """
+    Enum containing pawn hash table sizes
+    """
+
+    __slots__ = ()
+
+    DEFAULT_ENTRIES: int = 1 << 14
+    NO_ENTRY: int = -1
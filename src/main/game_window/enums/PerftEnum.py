@@ -0,0 +1,33 @@
+from enum import Enum
+from typing import Tuple
+
+
+class PerftEnum(Enum):
+    """
+    Enum containing perft test positions with their expected numbers of leaf nodes from depth 1 onwards
+    """
+
+    __slots__ = ()
+
+    DEFAULT_DEPTH: int = 3
+
+    SUITE: Tuple[Tuple[str, str, Tuple[int, ...]], ...] = (
+        ("start", "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+         (20, 400, 8902, 197281, 4865609)),
+        ("kiwipete", "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+         (48, 2039, 97862, 4085603)),
+        ("position 3", "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+         (14, 191, 2812, 43238, 674624)),
+        ("position 4", "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+         (6, 264, 9467, 422333)),
+        ("position 5", "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+         (44, 1486, 62379, 2103487)),
+        ("under promotions", "n1n5/PPPk4/8/8/8/8/4Kppp/5N1N b - - 0 1",
+         (24, 496, 9483, 182838)),
+        ("en passant into check", "8/8/1k6/2b5/2pP4/8/5K2/8 b - d3 0 1",
+         (15, 126, 1928, 13931, 206379)),
+        ("en passant out of pin", "8/5bk1/8/2Pp4/8/1K6/8/8 w - d6 0 1",
+         (8, 104, 736, 9287, 62297)),
+        ("pinned pawn", "3k4/3p4/8/K1P4r/8/8/8/8 b - - 0 1",
+         (18, 92, 1670, 10138, 185429))
+    )
@@ -0,0 +1,25 @@
+from enum import Enum
+
+
+class SearchEnum(Enum):
+    """
+    Enum containing default limits of engine search
+    """
+
+    __slots__ = ()
+
+    MAX_DEPTH: int = 3
+    TIME_LIMIT: float = 5.0
+    NO_NODE_LIMIT: int = 0
+    QUIESCENCE_DEPTH: int = 4
+    DELTA_MARGIN: float = 20
+    NULL_WINDOW: float = 0.01
+    ASPIRATION_WINDOW: float = 5.0
+    MAX_ASPIRATION_WINDOW: float = 80.0
+    ASPIRATION_MIN_DEPTH: int = 2
+    NULL_MOVE_REDUCTION: int = 2
+    NULL_MOVE_MIN_DEPTH: int = 3
+    LATE_MOVE_REDUCTION: int = 1
+    LATE_MOVE_MIN_DEPTH: int = 3
+    LATE_MOVE_MIN_INDEX: int = 3
+    WORKER_TRANSPOSITION_SIZE_MB: int = 8
@@ -0,0 +1,22 @@
+from enum import Enum
+
+
+class TranspositionEnum(Enum):
+    """
+    Enum containing transposition table bound types, replacement schemes and sizes
+    """
+
+    __slots__ = ()
+
+    NONE_BOUND: int = 0
+    EXACT_BOUND: int = 1
+    LOWER_BOUND: int = 2
+    UPPER_BOUND: int = 3
+
+    ALWAYS_REPLACE: int = 10
+    DEPTH_PREFERRED: int = 11
+    TWO_TIER: int = 12
+
+    DEFAULT_SIZE_MB: int = 16
+    ENTRY_SIZE_BYTES: int = 21
+    NO_ENTRY: int = -1
@@ -0,0 +1,21 @@
+from enum import Enum
+from typing import Tuple
+
+
+class UciEnum(Enum):
+    """
+    Enum containing names, tokens and default values of UCI protocol
+    """
+
+    __slots__ = ()
+
+    ENGINE_NAME: str = "Chess-Game"
+    ENGINE_AUTHOR: str = "Chess-Game contributors"
+
+    FILES: str = "abcdefgh"
+    PROMOTION_LETTERS: Tuple[str, ...] = ("q", "n", "r", "b")
+    NULL_MOVE: str = "0000"
+
+    GO_LIMITS: Tuple[str, ...] = ("depth", "movetime", "nodes", "wtime", "btime", "winc", "binc", "movestogo")
+    DEFAULT_MOVES_TO_GO: int = 30
+    MS_IN_SECOND: int = 1000
@@ -4,6 +4,7 @@
 from game_window.board.Board import Board
 from game_window.Canvas import Canvas
 from game_window.engine.Engine import Engine
+from game_window.EngineWorker import EngineWorker
 from game_window.moving.generation.data.Move import Move
 from game_window.Promoter import Promoter
 
@@ -31,6 +32,15 @@ def create_engine(self) -> Engine:
         """
         pass
 
+    @abstractmethod
+    def create_engine_worker(self, engine: Engine) -> EngineWorker:
+        """
+        Method used to init EngineWorker which searches moves of given engine outside of gui thread
+        :param engine: Engine instance
+        :return: EngineWorker instance
+        """
+        pass
+
     @abstractmethod
     def create_promoter(self) -> Promoter:
         """
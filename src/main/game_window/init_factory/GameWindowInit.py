@@ -8,6 +8,7 @@
 from game_window.engine.EnginePlayer import EnginePlayer
 from game_window.engine.Evaluation import Evaluation
 from game_window.engine.Evaluator import Evaluator
+from game_window.EngineWorker import EngineWorker
 from game_window.enums.MoveEnum import MoveEnum
 from game_window.enums.PiecesEnum import PiecesEnum
 from game_window.init_factory.GameWindowFactory import GameWindowFactory
@@ -45,6 +46,14 @@ def create_engine(self) -> Engine:
 
         return EnginePlayer(generator, evaluator)
 
+    def create_engine_worker(self, engine: Engine) -> EngineWorker:
+        """
+        Method used to init EngineWorker which searches moves of given engine outside of gui thread
+        :param engine: Engine instance
+        :return: EngineWorker instance
+        """
+        return EngineWorker(engine)
+
     def create_promoter(self) -> Promoter:
         """
         Method used to init Promoter
@@ -6,8 +6,8 @@
 
 from game_window.ColorManager import ColorManager
 from game_window.enums.PiecesEnum import PiecesEnum
-from game_window.moving.generation.data.Move import Move
 from game_window.moving.generation.data.MoveData import MoveData
+from game_window.moving.generation.data.MoveUtil import MoveUtil
 from game_window.moving.MoveMakingUtil import MoveMakingUtil
 from game_window.moving.MoveUnMakingUtil import MoveUnMakingUtil
 
@@ -23,15 +23,15 @@ class MoveMaker:
     __slots__ = ()
 
     @staticmethod
-    def make_move(move: Move, color: int, board: 'Board') -> MoveData:
+    def make_move(move: int, color: int, board: 'Board') -> MoveData:
         """
-        Method used to make a given move. It means to update the board int array
+        Method used to make a given move. It means to update the board int array and pass the turn to the opponent
         :param board: Board instance
-        :param move: Move instance - move we want to make
+        :param move: int encoded move we want to make
         :param color: color of a piece
         :return: MoveData instance containing fen_data before the move and the deleted piece by move
         """
-        end_square: int = move.get_end_square()
+        end_square: int = MoveUtil.get_end_square(move)
         board_array: ndarray[int, dtype[int8]] = board.board_array()
         move_data: MoveData = MoveMakingUtil.copy_fen_data_to_move_data(board)
         enemy_color: int = ColorManager.get_opposite_piece_color(color)
@@ -40,24 +40,15 @@ def make_move(move: Move, color: int, board: 'Board') -> MoveData:
             board.disable_castling_on_side(enemy_color, end_square)
         board.update_fen_data_with_double_pawn_movement(move)
 
-        if MoveMakingUtil.check_and_handle_rook_movement(move, board, color, move_data):
-            return move_data
-        if MoveMakingUtil.check_and_handle_promotion_movement(move, board, color, move_data):
-            return move_data
-        if MoveMakingUtil.check_and_handle_castling_movement(move, board, color, move_data):
-            return move_data
-        if MoveMakingUtil.check_and_handle_en_passant_movement(move, board, color, move_data):
-            return move_data
-        if MoveMakingUtil.check_and_handle_kings_movement(move, board, color, move_data):
-            return move_data
-        MoveMakingUtil.update_move_data_with_deleted_piece(move_data, board, color, move)
+        MoveMaker.__update_board_with_move(move, board, color, move_data)
+        board.set_opposite_move_color()
 
         return move_data
 
     @staticmethod
-    def un_make_move(move: Move, deleted_data: MoveData, board: 'Board') -> None:
+    def un_make_move(move: int, deleted_data: MoveData, board: 'Board') -> None:
         """
-        Removes given move with a value of deleted piece
+        Removes given move with a value of deleted piece and gives the turn back
         :param deleted_data: MoveData instance
         :param board: Board instance
         :param move: move to be unmade
@@ -65,6 +56,7 @@ def un_make_move(move: Move, deleted_data: MoveData, board: 'Board') -> None:
         """
         deleted_piece: int = deleted_data.deleted_piece
         color: int = ColorManager.get_piece_color(deleted_piece)
+        board.set_opposite_move_color()
 
         if MoveUnMakingUtil.check_and_un_make_castling_move(move, deleted_data, board, color):
             return
@@ -73,3 +65,25 @@ def un_make_move(move: Move, deleted_data: MoveData, board: 'Board') -> None:
         if MoveUnMakingUtil.check_and_un_make_en_passant_move(move, deleted_data, board):
             return
         MoveUnMakingUtil.un_make_basic_move(move, deleted_data, board)
+
+    @staticmethod
+    def __update_board_with_move(move: int, board: 'Board', color: int, move_data: MoveData) -> None:
+        """
+        Method used to move pieces on board and fill move data with the piece deleted by move
+        :param move: int encoded move
+        :param board: Board instance
+        :param color: int value of color
+        :param move_data: MoveData instance
+        :return: None
+        """
+        if MoveMakingUtil.check_and_handle_rook_movement(move, board, color, move_data):
+            return
+        if MoveMakingUtil.check_and_handle_promotion_movement(move, board, color, move_data):
+            return
+        if MoveMakingUtil.check_and_handle_castling_movement(move, board, color, move_data):
+            return
+        if MoveMakingUtil.check_and_handle_en_passant_movement(move, board, color, move_data):
+            return
+        if MoveMakingUtil.check_and_handle_kings_movement(move, board, color, move_data):
+            return
+        MoveMakingUtil.update_move_data_with_deleted_piece(move_data, board, color, move)
@@ -1,8 +1,5 @@
 from typing import TYPE_CHECKING
 
-from numpy import dtype
-from numpy import int8
-from numpy import ndarray
 from numpy import sign
 
 from exceptions.IllegalArgumentException import IllegalArgumentException
@@ -12,8 +9,8 @@
 from game_window.enums.MoveEnum import MoveEnum
 from game_window.enums.PiecesEnum import PiecesEnum
 from game_window.enums.SpecialFlags import SpecialFlags
-from game_window.moving.generation.data.Move import Move
 from game_window.moving.generation.data.MoveData import MoveData
+from game_window.moving.generation.data.MoveUtil import MoveUtil
 from game_window.moving.generation.king_and_knights.KingUtil import KingUtil
 
 if TYPE_CHECKING:
@@ -28,11 +25,11 @@ class MoveMakingUtil:
     __slots__ = ()
 
     @staticmethod
-    def castle_king(piece: int, move: Move, board: 'Board') -> None:
+    def castle_king(piece: int, move: int, board: 'Board') -> None:
         """
         Method used to castle king it means prepare board for castling
         :param piece: int value of piece_square
-        :param move: Move instance
+        :param move: int encoded move
         :param board: Board instance
         :return: None
         """
@@ -43,20 +40,19 @@ def castle_king(piece: int, move: Move, board: 'Board') -> None:
 
         if piece_value != PiecesEnum.KING.value:
             raise IllegalArgumentException("YOU CANNOT CASTLE PIECE WHICH IS NOT KING!")
-        if move.get_special_flag() != SpecialFlags.CASTLING.value:
+        if MoveUtil.get_special_flag(move) != SpecialFlags.CASTLING.value:
             raise IllegalArgumentException("THIS IS NOT CASTLING MOVE!")
 
-        start_square: int = move.get_start_square()
-        board_array: ndarray[int, dtype[int8]] = board.board_array()
-        end_square: int = move.get_end_square()
+        start_square: int = MoveUtil.get_start_square(move)
+        end_square: int = MoveUtil.get_end_square(move)
         distance: int = start_square - end_square
         is_queen_side: bool = distance > 0
         rook_position: int = KingUtil.get_rook_position(color, is_queen_side, board.engine_color(), board.player_color())
 
-        board_array[start_square] = PiecesEnum.NONE.value
-        board_array[end_square] = piece
-        board_array[rook_position] = PiecesEnum.NONE.value
-        board_array[end_square + sign(distance)] = color | PiecesEnum.ROOK.value
+        board.set_piece_on_square(start_square, PiecesEnum.NONE.value)
+        board.set_piece_on_square(end_square, piece)
+        board.set_piece_on_square(rook_position, PiecesEnum.NONE.value)
+        board.set_piece_on_square(end_square + int(sign(distance)), color | PiecesEnum.ROOK.value)
 
         board.set_castling_king_side(False, color)
         board.set_castling_queen_side(False, color)
@@ -70,71 +66,67 @@ def make_en_passant_capture(piece: int, board: 'Board') -> None:
         :return: None
         """
         piece_value: int = piece - ColorManager.get_piece_color(piece)
-        board_array: ndarray[int, dtype[int8]] = board.board_array()
 
         if piece_value != PiecesEnum.PAWN.value:
             raise IllegalArgumentException("THIS PIECE CANNOT MAKE AN EN PASSANT CAPTURE!")
         if piece is None:
             raise NullArgumentException("PIECE CANNOT BE NULL!")
 
-        board_array[board.en_passant_square()] = piece
-        board_array[board.en_passant_piece_square()] = 0
+        board.set_piece_on_square(board.en_passant_square(), piece)
+        board.set_piece_on_square(board.en_passant_piece_square(), PiecesEnum.NONE.value)
 
         board.set_en_passant_square(MoveEnum.NONE_EN_PASSANT_SQUARE.value)
         board.set_en_passant_piece_square(MoveEnum.NONE_EN_PASSANT_SQUARE.value)
 
-        board.update_fen()
-
     @staticmethod
-    def check_and_handle_rook_movement(move: Move, board: 'Board', color: int, move_data: MoveData) -> bool:
+    def check_and_handle_rook_movement(move: int, board: 'Board', color: int, move_data: MoveData) -> bool:
         """
         Method used to check if moving piece is rook and if so handle its movement
-        :param move: Move instance
+        :param move: int encoded move
         :param board: Board instance
         :param color: int value of color
         :param move_data: MoveData instance
         :return: None
         """
-        moving_piece: int = move.get_moving_piece()
+        moving_piece: int = MoveUtil.get_moving_piece(move)
 
         if moving_piece == PiecesEnum.ROOK.value:
             MoveMakingUtil.update_move_data_with_deleted_piece(move_data, board, color, move)
-            board.disable_castling_on_side(board.engine_color(), move.get_start_square())
+            board.disable_castling_on_side(color, MoveUtil.get_start_square(move))
             return True
         return False
 
     @staticmethod
-    def check_and_handle_promotion_movement(move: Move, board: 'Board', color: int, move_data: MoveData) -> bool:
+    def check_and_handle_promotion_movement(move: int, board: 'Board', color: int, move_data: MoveData) -> bool:
         """
         Method used to check if it is promotion move and if so handle its movement
-        :param move: Move instance
+        :param move: int encoded move
         :param board: Board instance
         :param color: int value of color
         :param move_data: MoveData instance
         :return: bool
         """
-        special_flag: int = move.get_special_flag()
-        board_array: ndarray[int, dtype[int8]] = board.board_array()
-        end_square: int = move.get_end_square()
+        special_flag: int = MoveUtil.get_special_flag(move)
+        end_square: int = MoveUtil.get_end_square(move)
 
         if special_flag in SpecialFlags.PROMOTIONS.value:
             MoveMakingUtil.update_move_data_with_deleted_piece(move_data, board, color, move)
-            board_array[end_square] = BoardUtil.get_promotion_piece(color, special_flag)
+            board.set_piece_on_square(end_square, BoardUtil.get_promotion_piece(color, special_flag))
             return True
         return False
 
     @staticmethod
-    def check_and_handle_castling_movement(move: Move, board: 'Board', color: int, move_data: MoveData) -> bool:
+    def check_and_handle_castling_movement(move: int, board: 'Board', color: int, move_data: MoveData) -> bool:
         """
         Method used to check if it is castling move and if so handle its movement
-        :param move: Move instance
+        :param move: int encoded move
         :param board: Board instance
         :param color: int value of color
         :param move_data: MoveData instance
         :return: bool
         """
-        special_flag: int = move.get_special_flag()
-        moving_piece: int = move.get_moving_piece()
+        special_flag: int = MoveUtil.get_special_flag(move)
+        moving_piece: int = MoveUtil.get_moving_piece(move)
 
         if special_flag == SpecialFlags.CASTLING.value:
             deleted_piece = color | moving_piece
@@ -144,69 +136,68 @@ def check_and_handle_castling_movement(move: Move, board: 'Board', color: int, m
         return False
 
     @staticmethod
-    def check_and_handle_en_passant_movement(move: Move, board: 'Board', color: int, move_data: MoveData) -> bool:
+    def check_and_handle_en_passant_movement(move: int, board: 'Board', color: int, move_data: MoveData) -> bool:
         """
         Method used to check if it is en passant move and if so handle its movement
-        :param move: Move instance
+        :param move: int encoded move
         :param board: Board instance
         :param color: int value of color
         :param move_data: MoveData instance
         :return: bool
         """
-        special_flag: int = move.get_special_flag()
+        special_flag: int = MoveUtil.get_special_flag(move)
 
         if special_flag == SpecialFlags.EN_PASSANT.value:
-            move_data.deleted_piece = board.delete_piece_from_board_square(move.get_start_square())
+            move_data.deleted_piece = board.delete_piece_from_board_square(MoveUtil.get_start_square(move))
 
             MoveMakingUtil.make_en_passant_capture(move_data.deleted_piece, board)
             return True
         return False
 
     @staticmethod
-    def check_and_handle_kings_movement(move: Move, board: 'Board', color: int, move_data: MoveData) -> bool:
+    def check_and_handle_kings_movement(move: int, board: 'Board', color: int, move_data: MoveData) -> bool:
         """
         Method used to check if moving piece is king and if so handle its movement
-        :param move: Move instance
+        :param move: int encoded move
         :param board: Board instance
         :param color: int value of color
         :param move_data: MoveData instance
         :return: bool
         """
-        moving_piece: int = move.get_moving_piece()
+        moving_piece: int = MoveUtil.get_moving_piece(move)
 
         if moving_piece == PiecesEnum.KING.value:
             MoveMakingUtil.update_move_data_with_deleted_piece(move_data, board, color, move)
-            board.set_castling_king_side(False, board.engine_color())
-            board.set_castling_queen_side(False, board.engine_color())
+            board.set_castling_king_side(False, color)
+            board.set_castling_queen_side(False, color)
             return True
         return False
 
     @staticmethod
-    def update_board_with_movement(board: 'Board', move: Move, color: int) -> int:
+    def update_board_with_movement(board: 'Board', move: int, color: int) -> int:
         """
         Method used update board with movement and return the piece on movement end square
         :param board: Board instance
-        :param move: Move instance
+        :param move: int encoded move
         :param color: int value of color
         :return: int value of deleted piece by move
         """
-        board_array: ndarray[int, dtype[int8]] = board.board_array()
-        end_square: int = move.get_end_square()
+        end_square: int = MoveUtil.get_end_square(move)
 
-        deleted_piece: int = board_array[end_square]
-        board_array[move.get_start_square()] = 0
-        board_array[end_square] = color | move.get_moving_piece()
+        deleted_piece: int = board.board_array()[end_square]
+        board.set_piece_on_square(MoveUtil.get_start_square(move), PiecesEnum.NONE.value)
+        board.set_piece_on_square(end_square, color | MoveUtil.get_moving_piece(move))
 
         return deleted_piece
 
     @staticmethod
-    def update_move_data_with_deleted_piece(move_data: MoveData, board: 'Board', color: int, move: Move) -> None:
+    def update_move_data_with_deleted_piece(move_data: MoveData, board: 'Board', color: int, move: int) -> None:
         """
         Method used update move data with deleted piece value
         :param move_data: MoveData instance
         :param board: Board instance
         :param color: int value of color
-        :param move: Move instance
+        :param move: int encoded move
         :return: None
         """
         move_data.deleted_piece = MoveMakingUtil.update_board_with_movement(board, move, color)
@@ -5,12 +5,14 @@
 from game_window.engine.static_eval.StaticEvalUtil import StaticEvalUtil
 from game_window.enums.BoardEnum import BoardEnum
 from game_window.enums.EvalEnum import EvalEnum
+from game_window.enums.MoveEnum import MoveEnum
 from game_window.enums.PiecesEnum import PiecesEnum
 from game_window.enums.SpecialFlags import SpecialFlags
-from game_window.moving.generation.data.Move import Move
+from game_window.moving.generation.data.MoveUtil import MoveUtil
 
 if TYPE_CHECKING:
     from game_window.board.Board import Board
+    from game_window.engine.MoveHistory import MoveHistory
 
 
 class MoveSortUtil:
@@ -21,23 +23,20 @@ class MoveSortUtil:
     __slots__ = ()
 
     @staticmethod
-    def count_moves_score(move: Move, board: 'Board') -> int:
+    def count_moves_score(move: int, board: 'Board') -> int:
         """
         Method used to make early evaluation to sort __moves so to make search faster
-        :param move: Move to evaluate
+        :param move: int encoded move to evaluate
         :param board: Board instance
         :return: int value of evaluation
         """
-        if move is None:
-            return -999_999
-
         score: int = 0
-        target_square: int = move.get_end_square()
-        target_piece: int = board.board_array()[target_square]
+        target_square: int = MoveUtil.get_end_square(move)
+        target_piece: int = int(board.board_array()[target_square])
         target_color: int = ColorManager.get_piece_color(target_piece)
         target_piece_value: int = target_piece - target_color
-        special_flag: int = move.get_special_flag()
-        piece: int = move.get_moving_piece()
+        special_flag: int = MoveUtil.get_special_flag(move)
+        piece: int = MoveUtil.get_moving_piece(move)
 
         if special_flag == SpecialFlags.CASTLING.value:
             score += 50
@@ -62,3 +61,77 @@ def count_moves_score(move: Move, board: 'Board') -> int:
 
             score += 3 * target_eval - friendly_eval
         return score
+
+    @staticmethod
+    def count_capture_gain(move: int, board: 'Board') -> int:
+        """
+        Method used to count material gained by capture: captured piece value and promotion gain if pawn promotes
+        :param move: int encoded capture move
+        :param board: Board instance
+        :return: int value of material gain
+        """
+        target_piece: int = int(board.board_array()[MoveUtil.get_end_square(move)])
+        special_flag: int = MoveUtil.get_special_flag(move)
+        gain: int = 0
+
+        if special_flag == SpecialFlags.EN_PASSANT.value:
+            gain += StaticEvalUtil.get_piece_point_value(PiecesEnum.PAWN.value)
+        elif target_piece != PiecesEnum.NONE.value:
+            gain += StaticEvalUtil.get_piece_point_value(target_piece - ColorManager.get_piece_color(target_piece))
+
+        if special_flag in SpecialFlags.PROMOTIONS.value:
+            color: int = PiecesEnum.WHITE.value
+            promotion_piece: int = BoardUtil.get_promotion_piece(color, special_flag) - color
+            gain += StaticEvalUtil.get_piece_point_value(promotion_piece) - \
+                StaticEvalUtil.get_piece_point_value(PiecesEnum.PAWN.value)
+        return gain
+
+    @staticmethod
+    def count_mvv_lva_score(move: int, board: 'Board') -> int:
+        """
+        Method used to count Most Valuable Victim - Least Valuable Attacker score of capture, so captures of the most
+        valuable pieces are searched first and among them captures made by the cheapest attacker
+        :param move: int encoded capture move
+        :param board: Board instance
+        :return: int value of score
+        """
+        attacker_value: int = StaticEvalUtil.get_piece_point_value(MoveUtil.get_moving_piece(move))
+
+        return MVV_LVA_VICTIM_WEIGHT * MoveSortUtil.count_capture_gain(move, board) - attacker_value
+
+    @staticmethod
+    def is_quiet_move(move: int, board: 'Board') -> bool:
+        """
+        Method used to check if move neither captures nor promotes
+        :param move: int encoded move
+        :param board: Board instance
+        :return: bool
+        """
+        special_flag: int = MoveUtil.get_special_flag(move)
+
+        return board.board_array()[MoveUtil.get_end_square(move)] == PiecesEnum.NONE.value and \
+            special_flag != SpecialFlags.EN_PASSANT.value and special_flag not in SpecialFlags.PROMOTIONS.value
+
+    @staticmethod
+    def count_ordering_score(move: int, board: 'Board', move_history: 'MoveHistory', ply: int) -> int:
+        """
+        Method used to count search ordering score of move. Captures and promotions are ordered first with MVV-LVA,
+        then killer moves of the ply and then other quiet moves by their history and static scores
+        :param move: int encoded move
+        :param board: Board instance
+        :param move_history: MoveHistory instance with killers and history scores
+        :param ply: int distance of node from the root
+        :return: int value of score
+        """
+        if not MoveSortUtil.is_quiet_move(move, board):
+            return MoveEnum.CAPTURE_MOVE_SCORE.value + MoveSortUtil.count_mvv_lva_score(move, board)
+
+        for slot in range(MoveEnum.KILLERS_PER_PLY.value):
+            if move_history.get_killer(ply, slot) == move:
+                return MoveEnum.KILLER_MOVE_SCORE.value - slot
+        color: int = ColorManager.get_piece_color(board.board_array()[MoveUtil.get_start_square(move)])
+
+        return move_history.get_history_score(move, color) + MoveSortUtil.count_moves_score(move, board)
+
+
+MVV_LVA_VICTIM_WEIGHT: int = 10
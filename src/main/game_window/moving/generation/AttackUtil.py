@@ -0,0 +1,205 @@
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from numpy import dtype
+from numpy import int8
+from numpy import ndarray
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.board.BitBoardUtil import BitBoardUtil
+from game_window.ColorManager import ColorManager
+from game_window.enums.MoveEnum import MoveEnum
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.moving.generation.data.LegalityData import LegalityData
+from game_window.moving.generation.king_and_knights.KingKnightGen import KING_TARGETS
+from game_window.moving.generation.king_and_knights.KingKnightGen import KNIGHT_TARGETS
+from game_window.moving.generation.king_and_knights.KingUtil import KingUtil
+from game_window.moving.generation.sliding_piece.SlidingAttacks import DIAGONAL_DIRECTIONS_INDEXES
+from game_window.moving.generation.sliding_piece.SlidingAttacks import SlidingAttacks
+from game_window.moving.generation.sliding_piece.SlidingAttacks import SQUARES_BETWEEN
+
+if TYPE_CHECKING:
+    from game_window.board.Board import Board
+
+
+class AttackUtil:
+    """
+    Util class containing methods to calculate attacked squares, checks and pins of a position
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def convert_targets_to_bitboards(targets: Tuple[Tuple[int, ...], ...]) -> Tuple[int, ...]:
+        """
+        Converts tuple of target squares of every square into tuple of bitboards
+        :param targets: tuple indexed by square containing tuples of target squares
+        :return: tuple of int bitboards indexed by square
+        """
+        if targets is None:
+            raise NullArgumentException("TARGETS CANNOT BE NULL!")
+        bitboards: List[int] = []
+
+        for square_targets in targets:
+            bitboard: int = 0
+
+            for target in square_targets:
+                bitboard |= 1 << target
+            bitboards.append(bitboard)
+        return tuple(bitboards)
+
+    @staticmethod
+    def get_pawn_attacks_table(color: int, board: 'Board') -> Tuple[int, ...]:
+        """
+        Returns pawn attacks bitboards of pawns of given color. Engine pawns attack down the board and player pawns up.
+        :param color: int value of pawns color
+        :param board: Board instance
+        :return: tuple of int bitboards indexed by square
+        """
+        return PAWN_DOWN_ATTACKS if color == board.engine_color() else PAWN_UP_ATTACKS
+
+    @staticmethod
+    def is_square_attacked(board: 'Board', square: int, attacker_color: int) -> bool:
+        """
+        Checks if given square is attacked by any piece of attacker color
+        :param board: Board instance
+        :param square: int index of square
+        :param attacker_color: int value of attacking color
+        :return: bool
+        """
+        if None in (board, square, attacker_color):
+            raise NullArgumentException("ARGUMENTS CANNOT BE NULLS!")
+        if not ColorManager.is_it_valid_color(attacker_color):
+            raise IllegalArgumentException("COLOR DOES NOT EXISTS!")
+        board_array: ndarray[int, dtype[int8]] = board.board_array()
+        occupancy: int = board.occupancy()
+        defender_color: int = ColorManager.get_opposite_piece_color(attacker_color)
+        pawn_sources: int = AttackUtil.get_pawn_attacks_table(defender_color, board)[square]
+        attackers_sources: Tuple[Tuple[int, Tuple[int, ...]], ...] = (
+            (pawn_sources, (PiecesEnum.PAWN.value,)),
+            (KNIGHT_ATTACKS[square], (PiecesEnum.KNIGHT.value,)),
+            (KING_ATTACKS[square], (PiecesEnum.KING.value,)),
+            (SlidingAttacks.get_bishop_attacks(square, occupancy), (PiecesEnum.BISHOP.value, PiecesEnum.QUEEN.value)),
+            (SlidingAttacks.get_rook_attacks(square, occupancy), (PiecesEnum.ROOK.value, PiecesEnum.QUEEN.value))
+        )
+
+        for sources, pieces in attackers_sources:
+            sources &= occupancy
+
+            while sources:
+                source_bit: int = sources & -sources
+                piece: int = int(board_array[source_bit.bit_length() - 1])
+
+                if piece & attacker_color and piece - attacker_color in pieces:
+                    return True
+                sources ^= source_bit
+        return False
+
+    @staticmethod
+    def is_king_in_check(board: 'Board', color: int) -> bool:
+        """
+        Checks if king of given color is attacked
+        :param board: Board instance
+        :param color: int value of king color
+        :return: bool
+        """
+        if board is None or color is None:
+            raise NullArgumentException("ARGUMENTS CANNOT BE NULLS!")
+        king_square: int = KingUtil.find_friendly_king_squares(board.board_array(), color)
+
+        return AttackUtil.is_square_attacked(board, king_square, ColorManager.get_opposite_piece_color(color))
+
+    @staticmethod
+    def calculate_legality_data(color: int, board: 'Board') -> LegalityData:
+        """
+        Calculates squares attacked by the opponent, checkers and pinned pieces of the player of given color
+        :param color: int value of color to move
+        :param board: Board instance
+        :return: LegalityData instance
+        """
+        if color is None or board is None:
+            raise NullArgumentException("ARGUMENTS CANNOT BE NULLS!")
+        if not ColorManager.is_it_valid_color(color):
+            raise IllegalArgumentException("COLOR DOES NOT EXISTS!")
+        board_array: ndarray[int, dtype[int8]] = board.board_array()
+        occupancy: int = board.occupancy()
+        enemy_color: int = ColorManager.get_opposite_piece_color(color)
+        king_square: int = KingUtil.find_friendly_king_squares(board_array, color)
+        king_bit: int = 1 << king_square
+        occupancy_without_king: int = occupancy ^ king_bit
+        enemy_pawn_attacks: Tuple[int, ...] = AttackUtil.get_pawn_attacks_table(enemy_color, board)
+        attacked_squares: int = 0
+        checkers: int = 0
+
+        for square in BitBoardUtil.get_squares(occupancy):
+            piece: int = int(board_array[square])
+
+            if not piece & enemy_color:
+                continue
+            piece -= enemy_color
+
+            if piece == PiecesEnum.PAWN.value:
+                attacks: int = enemy_pawn_attacks[square]
+            elif piece == PiecesEnum.KNIGHT.value:
+                attacks = KNIGHT_ATTACKS[square]
+            elif piece == PiecesEnum.KING.value:
+                attacks = KING_ATTACKS[square]
+            else:
+                attacks = SlidingAttacks.get_sliding_piece_attacks(piece, square, occupancy_without_king)
+            attacked_squares |= attacks
+
+            if attacks & king_bit:
+                checkers |= 1 << square
+        checkers_count: int = BitBoardUtil.count_bits(checkers)
+        check_mask: int = FULL_BOARD
+
+        if checkers_count == 1:
+            check_mask = checkers | SQUARES_BETWEEN[king_square][checkers.bit_length() - 1]
+        pin_rays: Dict[int, int] = AttackUtil.calculate_pin_rays(king_square, enemy_color, board)
+
+        return LegalityData(king_square, attacked_squares, checkers_count, check_mask, pin_rays)
+
+    @staticmethod
+    def calculate_pin_rays(king_square: int, enemy_color: int, board: 'Board') -> Dict[int, int]:
+        """
+        Finds pieces pinned to the king and squares they can move to without exposing the king
+        :param king_square: int index of friendly king square
+        :param enemy_color: int value of opponent color
+        :param board: Board instance
+        :return: dict of pinned piece square to bitboard of squares between king and pinning piece (pinner included)
+        """
+        board_array: ndarray[int, dtype[int8]] = board.board_array()
+        occupancy: int = board.occupancy()
+        pin_rays: Dict[int, int] = {}
+
+        for direction_index in range(MoveEnum.SLIDING_DIRECTIONS_NUMBER.value):
+            blocker: int = SlidingAttacks.get_ray_attacks(direction_index, king_square, occupancy) & occupancy
+
+            if blocker == 0 or int(board_array[blocker.bit_length() - 1]) & enemy_color:
+                continue
+            pin_ray: int = SlidingAttacks.get_ray_attacks(direction_index, king_square, occupancy ^ blocker)
+            pinner: int = pin_ray & occupancy & ~blocker
+
+            if pinner == 0:
+                continue
+            pinner_piece: int = int(board_array[pinner.bit_length() - 1])
+            pinning_pieces: Tuple[int, ...] = DIAGONAL_PINNERS if direction_index in DIAGONAL_DIRECTIONS_INDEXES \
+                else LINE_PINNERS
+
+            if pinner_piece & enemy_color and pinner_piece - enemy_color in pinning_pieces:
+                pin_rays[blocker.bit_length() - 1] = pin_ray
+        return pin_rays
+
+
+FULL_BOARD: int = (1 << 64) - 1
+DIAGONAL_PINNERS: Tuple[int, ...] = (PiecesEnum.BISHOP.value, PiecesEnum.QUEEN.value)
+LINE_PINNERS: Tuple[int, ...] = (PiecesEnum.ROOK.value, PiecesEnum.QUEEN.value)
+KNIGHT_ATTACKS: Tuple[int, ...] = AttackUtil.convert_targets_to_bitboards(KNIGHT_TARGETS)
+KING_ATTACKS: Tuple[int, ...] = AttackUtil.convert_targets_to_bitboards(KING_TARGETS)
+PAWN_UP_ATTACKS: Tuple[int, ...] = AttackUtil.convert_targets_to_bitboards(KingUtil.calculate_jump_targets(
+    (MoveEnum.PAWN_UP_LEFT_ATTACK.value, MoveEnum.PAWN_UP_RIGHT_ATTACK.value), MoveEnum.PAWN_RANGE.value))
+PAWN_DOWN_ATTACKS: Tuple[int, ...] = AttackUtil.convert_targets_to_bitboards(KingUtil.calculate_jump_targets(
+    (MoveEnum.PAWN_DOWN_LEFT_ATTACK.value, MoveEnum.PAWN_DOWN_RIGHT_ATTACK.value), MoveEnum.PAWN_RANGE.value))
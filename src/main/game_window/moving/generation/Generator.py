@@ -1,4 +1,5 @@
 from abc import ABC
+from typing import Optional
 from typing import TYPE_CHECKING
 
 from game_window.moving.generation.data.MoveList import MoveList
@@ -14,10 +15,12 @@ class Generator(ABC):
 
     __slots__ = ()
 
-    def generate_legal_moves(self, color_to_move: int, board: 'Board', captures_only: bool = False) -> MoveList:
+    def generate_legal_moves(self, color_to_move: int, board: 'Board', captures_only: bool = False,
+                             moves_list: Optional[MoveList] = None) -> MoveList:
         """
         Method used to generate legal __moves for current position for given player
         :param captures_only: decides if method should generate every legal move or captures only
+        :param moves_list: MoveList to be cleared and filled (for example from MoveListPool), new one if None
         :param color_to_move: player color int
         :param board: Board instance
         :return: MoveList
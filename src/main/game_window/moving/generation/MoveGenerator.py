@@ -1,23 +1,27 @@
+from typing import Optional
 from typing import TYPE_CHECKING
 
 from numpy import dtype
-from numpy import full
 from numpy import int8
 from numpy import ndarray
 
 from game_window.ColorManager import ColorManager
 from game_window.enums.BoardEnum import BoardEnum
-from game_window.enums.MoveEnum import MoveEnum
 from game_window.enums.PiecesEnum import PiecesEnum
 from game_window.enums.SpecialFlags import SpecialFlags
-from game_window.moving.generation.data.Move import Move
+from game_window.moving.generation.AttackUtil import AttackUtil
+from game_window.moving.generation.data.LegalityData import LegalityData
 from game_window.moving.generation.data.MoveData import MoveData
 from game_window.moving.generation.data.MoveList import MoveList
 from game_window.moving.generation.data.Moves import Moves
+from game_window.moving.generation.data.MoveUtil import END_SQUARE_SHIFT
+from game_window.moving.generation.data.MoveUtil import KIND_FLAGS
+from game_window.moving.generation.data.MoveUtil import KIND_PIECES
+from game_window.moving.generation.data.MoveUtil import MOVE_KIND_SHIFT
+from game_window.moving.generation.data.MoveUtil import SQUARE_MASK
 from game_window.moving.generation.Generator import Generator
 from game_window.moving.generation.king_and_knights.KingKnightGen import KingKnightGen
 from game_window.moving.generation.king_and_knights.KingKnightGenerator import KingKnightGenerator
-from game_window.moving.generation.king_and_knights.KingUtil import KingUtil
 from game_window.moving.generation.pawns.PawnGen import PawnGen
 from game_window.moving.generation.pawns.PawnGenerator import PawnGenerator
 from game_window.moving.generation.sliding_piece.SlidingGenerator import SlidingGenerator
@@ -34,48 +38,95 @@ class MoveGenerator(Generator):
     Class used for generating __moves
     """
 
-    __slots__ = ("__pawn_gen", "__king_knight", "__sliding_gen")
+    __slots__ = ("__pawn_gen", "__king_knight", "__sliding_gen", "__pseudo_legal_moves")
 
     def __init__(self) -> None:
         self.__pawn_gen: PawnGenerator = PawnGen()
         self.__king_knight: KingKnightGenerator = KingKnightGen()
         self.__sliding_gen: SlidingGenerator = SlidingPiecesGen()
+        self.__pseudo_legal_moves: MoveList = Moves()
 
-    def generate_legal_moves(self, color_to_move: int, board: 'Board', captures_only: bool = False) -> MoveList:
+    def generate_legal_moves(self, color_to_move: int, board: 'Board', captures_only: bool = False,
+                             moves_list: Optional[MoveList] = None) -> MoveList:
         """
         Method used to generate legal __moves for current position for given player
         :param captures_only: decides if method should generate every legal move or captures only
         :param color_to_move: player color int
         :param board: Board instance
+        :param moves_list: MoveList to be cleared and filled (for example from MoveListPool), new one if None
         :return: MoveList
         """
         pseudo_legal_moves: MoveList = self.__generate_moves(color_to_move, board, captures_only)
-        legal_moves: MoveList = Moves(full(MoveEnum.MAX_NUM_OF_MOVES.value, None, dtype=object))
+
+        if moves_list is None:
+            legal_moves: MoveList = Moves()
+        else:
+            legal_moves = moves_list
+            legal_moves.clear()
+
+        if pseudo_legal_moves.is_empty():
+            return legal_moves
+        legality_data: LegalityData = AttackUtil.calculate_legality_data(color_to_move, board)
 
         for index in range(pseudo_legal_moves.size()):
-            move_to_verify: Move = pseudo_legal_moves[index]
-            is_it_valid_move: bool = True
-            deleted_data: MoveData = MoveMaker.make_move(move_to_verify, color_to_move, board)
-            opponent_moves: MoveList = self.__generate_moves(ColorManager.get_opposite_piece_color(color_to_move),
-                                                             board, captures_only)
-            kings_square: int = KingUtil.find_friendly_king_squares(board.board_array(), color_to_move)
-
-            for j in range(opponent_moves.size()):
-                move: Move = opponent_moves[j]
-                special_flag: int = move_to_verify.get_special_flag()
-                end_square: int = move.get_end_square()
-
-                if special_flag == SpecialFlags.CASTLING.value and end_square in KingUtil.get_castling_squares(move_to_verify):
-                    is_it_valid_move = False
-                    break
-                if end_square == kings_square:
-                    is_it_valid_move = False
-                    break
-            if is_it_valid_move:
+            move_to_verify: int = pseudo_legal_moves[index]
+
+            if self.__is_it_legal_move(move_to_verify, color_to_move, board, legality_data):
                 legal_moves.append(move_to_verify)
-            MoveMaker.un_make_move(move_to_verify, deleted_data, board)
         return legal_moves
 
+    def __is_it_legal_move(self, move: int, color_to_move: int, board: 'Board', legality_data: LegalityData) -> bool:
+        """
+        Checks if pseudo legal move does not leave own king in check using attacked squares, checkers and pins
+        :param move: int encoded move
+        :param color_to_move: player color int
+        :param board: Board instance
+        :param legality_data: LegalityData instance of current position
+        :return: bool
+        """
+        start_square: int = move & SQUARE_MASK
+        end_square: int = move >> END_SQUARE_SHIFT & SQUARE_MASK
+        special_flag: int = KIND_FLAGS[move >> MOVE_KIND_SHIFT]
+
+        if KIND_PIECES[move >> MOVE_KIND_SHIFT] == PiecesEnum.KING.value:
+            if special_flag == SpecialFlags.CASTLING.value:
+                if legality_data.checkers_count > 0:
+                    return False
+                step: int = 1 if end_square > start_square else -1
+                castling_path: int = (1 << (start_square + step)) | (1 << end_square)
+
+                return legality_data.attacked_squares & castling_path == 0
+            return legality_data.attacked_squares & (1 << end_square) == 0
+
+        if legality_data.checkers_count > 1:
+            return False
+        if special_flag == SpecialFlags.EN_PASSANT.value:
+            return self.__is_it_legal_en_passant(move, color_to_move, board, legality_data.king_square)
+        end_square_bit: int = 1 << end_square
+
+        if legality_data.check_mask & end_square_bit == 0:
+            return False
+        pin_ray: Optional[int] = legality_data.pin_rays.get(start_square)
+
+        return pin_ray is None or pin_ray & end_square_bit != 0
+
+    @staticmethod
+    def __is_it_legal_en_passant(move: int, color_to_move: int, board: 'Board', king_square: int) -> bool:
+        """
+        Verifies en passant by making it, because it removes two pieces from the same rank and masks cannot tell that
+        :param move: int encoded move
+        :param color_to_move: player color int
+        :param board: Board instance
+        :param king_square: int index of friendly king square
+        :return: bool
+        """
+        deleted_data: MoveData = MoveMaker.make_move(move, color_to_move, board)
+        is_king_attacked: bool = AttackUtil.is_square_attacked(board, king_square,
+                                                               ColorManager.get_opposite_piece_color(color_to_move))
+        MoveMaker.un_make_move(move, deleted_data, board)
+
+        return not is_king_attacked
+
     def __generate_moves(self, color_to_move: int, board: 'Board', captures_only: bool) -> MoveList:
         """
         Static method used  to generate legal moves_list for pieces of given color
@@ -84,7 +135,8 @@ def __generate_moves(self, color_to_move: int, board: 'Board', captures_only: bo
         :param board: Board instance == representation of board
         :return: list of all legal __moves
         """
-        moves_list: MoveList = Moves(full(MoveEnum.MAX_NUM_OF_MOVES.value, None, dtype=object))
+        moves_list: MoveList = self.__pseudo_legal_moves
+        moves_list.clear()
         board_array: ndarray[int, dtype[int8]] = board.board_array()
 
         for square in range(BoardEnum.BOARD_SIZE.value):
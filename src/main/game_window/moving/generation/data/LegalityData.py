@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Dict
+
+
+@dataclass(slots=True)
+class LegalityData:
+    """
+    Class containing position data needed to decide which pseudo legal moves are legal
+    """
+    king_square: int
+    attacked_squares: int
+    checkers_count: int
+    check_mask: int
+    pin_rays: Dict[int, int]
@@ -1,12 +1,14 @@
 from abc import ABC
 from abc import abstractmethod
 from typing import Any
+from typing import Optional
 from typing import TYPE_CHECKING
 
-from game_window.moving.generation.data.Move import Move
+from game_window.moving.generation.data.MoveUtil import NO_MOVE
 
 if TYPE_CHECKING:
     from game_window.board.Board import Board
+    from game_window.engine.MoveHistory import MoveHistory
 
 
 class MoveList(ABC):
@@ -17,10 +19,18 @@ class MoveList(ABC):
     __slots__ = ()
 
     @abstractmethod
-    def append(self, move: Move) -> None:
+    def append(self, move: int) -> None:
         """
         Method used to append new move to the Moves
-        :param move: Move instance
+        :param move: int encoded move
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Method used to reset move list, so its buffer can be reused without new allocation
+        :return: None
         """
         pass
 
@@ -43,11 +53,44 @@ def is_empty(self) -> bool:
     @abstractmethod
     def sort(self, board: 'Board') -> None:
         """
-        Method used to sort list of item based on
+        Method used to sort moves in place from the most promising one
+        :param board: Board instance
+        :return: None
+        """
+        pass
+
+    @abstractmethod
+    def score_moves(self, board: 'Board', hash_move: int = NO_MOVE, move_history: Optional['MoveHistory'] = None,
+                    ply: int = 0) -> None:
+        """
+        Method used to count ordering score of every move once, so moves can be picked lazily with pick_best_move
+        :param board: Board instance
+        :param hash_move: int encoded best move stored in transposition table which is scored above any other move
+        :param move_history: MoveHistory instance used to order by MVV-LVA, killers and history, if not given moves
+        are ordered by static score only
+        :param ply: int distance of node from the root used to pick killer moves
         :return: None
         """
         pass
 
+    @abstractmethod
+    def score_captures(self, board: 'Board') -> None:
+        """
+        Method used to score captures with MVV-LVA, so they can be picked lazily with pick_best_move
+        :param board: Board instance
+        :return: None
+        """
+        pass
+
+    @abstractmethod
+    def pick_best_move(self, index: int) -> int:
+        """
+        Method used to move the best scored move from not yet picked ones to the given index and return it
+        :param index: int index of the first not picked move
+        :return: int encoded move
+        """
+        pass
+
     @abstractmethod
     def __iter__(self) -> Any:
         pass
@@ -57,5 +100,5 @@ def __getitem__(self, item: int) -> Any:
         pass
 
     @abstractmethod
-    def __contains__(self, move: Move) -> bool:
+    def __contains__(self, move: int) -> bool:
         pass
@@ -0,0 +1,47 @@
+from typing import List
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.enums.MoveEnum import MoveEnum
+from game_window.moving.generation.data.MoveList import MoveList
+from game_window.moving.generation.data.Moves import Moves
+
+
+class MoveListPool:
+    """
+    Class containing preallocated move lists indexed by search ply, so search does not allocate them on every node
+    """
+
+    __slots__ = ("__move_lists",)
+
+    def __init__(self, max_ply: int = MoveEnum.MAX_SEARCH_PLY.value) -> None:
+        if max_ply is None:
+            raise NullArgumentException("MAX PLY CANNOT BE NULL!")
+        if max_ply <= 0:
+            raise IllegalArgumentException("MAX PLY HAS TO BE POSITIVE!")
+        self.__move_lists: List[MoveList] = [Moves() for _ in range(max_ply)]
+
+    def get_move_list(self, ply: int) -> MoveList:
+        """
+        Returns cleared move list of given ply. Lists are reused, so list of a ply is valid until it is requested again.
+        :param ply: int index of search ply
+        :return: MoveList instance
+        """
+        if ply is None:
+            raise NullArgumentException("PLY CANNOT BE NULL!")
+        if ply < 0:
+            raise IllegalArgumentException("PLY CANNOT BE NEGATIVE!")
+
+        while ply >= len(self.__move_lists):
+            self.__move_lists.append(Moves())
+        move_list: MoveList = self.__move_lists[ply]
+        move_list.clear()
+
+        return move_list
+
+    def size(self) -> int:
+        """
+        Returns number of move lists in the pool
+        :return: int
+        """
+        return len(self.__move_lists)
@@ -0,0 +1,150 @@
+from typing import Dict
+from typing import Tuple
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.enums.SpecialFlags import SpecialFlags
+from game_window.moving.generation.data.Move import Move
+
+
+class MoveUtil:
+    """
+    Util class for moves encoded as 16-bit ints. Bits 0-5 store start square, bits 6-11 end square and bits 12-15
+    a move kind which is a pair of moving piece and special flag.
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def get_move_kind(piece: int, special_flag: int) -> int:
+        """
+        Returns move kind bits (already shifted) of given moving piece and special flag
+        :param piece: int value of piece without color
+        :param special_flag: int value of special flag
+        :return: int value of move kind bits
+        """
+        if piece is None or special_flag is None:
+            raise NullArgumentException("PIECE AND SPECIAL FLAG CANNOT BE NULLS!")
+        move_kind: int = MOVE_KINDS.get((piece, special_flag), -1)
+
+        if move_kind == -1:
+            raise IllegalArgumentException("SUCH PIECE CANNOT MAKE MOVE WITH THIS SPECIAL FLAG!")
+        return move_kind
+
+    @staticmethod
+    def encode_move(start_square: int, end_square: int, piece: int, special_flag: int) -> int:
+        """
+        Packs move data into single int
+        :param start_square: int index of start square
+        :param end_square: int index of end square
+        :param piece: int value of piece without color
+        :param special_flag: int value of special flag
+        :return: int encoded move
+        """
+        if start_square is None or end_square is None:
+            raise NullArgumentException("SQUARES CANNOT BE NULLS!")
+        if not 0 <= start_square <= 63 or not 0 <= end_square <= 63:
+            raise IllegalArgumentException("SQUARES ARE NOT WITHIN BOARD BOUNDS!")
+        return MoveUtil.get_move_kind(piece, special_flag) | end_square << END_SQUARE_SHIFT | start_square
+
+    @staticmethod
+    def get_start_square(move: int) -> int:
+        """
+        Returns start square of encoded move
+        :param move: int encoded move
+        :return: int index of start square
+        """
+        return move & SQUARE_MASK
+
+    @staticmethod
+    def get_end_square(move: int) -> int:
+        """
+        Returns end square of encoded move
+        :param move: int encoded move
+        :return: int index of end square
+        """
+        return move >> END_SQUARE_SHIFT & SQUARE_MASK
+
+    @staticmethod
+    def get_moving_piece(move: int) -> int:
+        """
+        Returns moving piece of encoded move
+        :param move: int encoded move
+        :return: int value of piece without color
+        """
+        return KIND_PIECES[move >> MOVE_KIND_SHIFT]
+
+    @staticmethod
+    def get_special_flag(move: int) -> int:
+        """
+        Returns special flag of encoded move
+        :param move: int encoded move
+        :return: int value of special flag
+        """
+        return KIND_FLAGS[move >> MOVE_KIND_SHIFT]
+
+    @staticmethod
+    def create_move(move: int) -> Move:
+        """
+        Creates Move instance of encoded move. Should be used only by gui which works on Move objects.
+        :param move: int encoded move
+        :return: Move instance
+        """
+        if move is None:
+            raise NullArgumentException("MOVE CANNOT BE NULL!")
+        return Move(MoveUtil.get_start_square(move), MoveUtil.get_end_square(move), MoveUtil.get_moving_piece(move),
+                    MoveUtil.get_special_flag(move))
+
+    @staticmethod
+    def is_the_same_move(move: int, move_instance: Move) -> bool:
+        """
+        Checks if encoded move has the same squares and moving piece as Move instance (special flag is not compared)
+        :param move: int encoded move
+        :param move_instance: Move instance
+        :return: bool
+        """
+        if move is None or move_instance is None:
+            raise NullArgumentException("MOVES CANNOT BE NULLS!")
+        return move & SQUARES_MASK == move_instance.get_start_square() | \
+            move_instance.get_end_square() << END_SQUARE_SHIFT and \
+            MoveUtil.get_moving_piece(move) == move_instance.get_moving_piece()
+
+    @staticmethod
+    def to_string(move: int) -> str:
+        """
+        Returns string representation of encoded move
+        :param move: int encoded move
+        :return: str
+        """
+        return f"\tStartSquare : {MoveUtil.get_start_square(move)}\n\tEndSquare : {MoveUtil.get_end_square(move)}\n" \
+               f"\tPiece : {MoveUtil.get_moving_piece(move)}\n\tSpecialFlag : {MoveUtil.get_special_flag(move)}\n"
+
+    @staticmethod
+    def to_short_string(move: int) -> str:
+        """
+        Returns one word representation of encoded move with start and end square
+        :param move: int encoded move
+        :return: str like 52-36
+        """
+        return f"{MoveUtil.get_start_square(move)}-{MoveUtil.get_end_square(move)}"
+
+
+END_SQUARE_SHIFT: int = 6
+MOVE_KIND_SHIFT: int = 12
+SQUARE_MASK: int = 0b111111
+SQUARES_MASK: int = (1 << MOVE_KIND_SHIFT) - 1
+NO_MOVE: int = 0
+KIND_PIECES: Tuple[int, ...] = (PiecesEnum.KING.value, PiecesEnum.PAWN.value, PiecesEnum.KNIGHT.value,
+                                PiecesEnum.BISHOP.value, PiecesEnum.ROOK.value, PiecesEnum.QUEEN.value,
+                                PiecesEnum.PAWN.value, PiecesEnum.KING.value, PiecesEnum.PAWN.value,
+                                PiecesEnum.PAWN.value, PiecesEnum.PAWN.value, PiecesEnum.PAWN.value)
+KIND_FLAGS: Tuple[int, ...] = (SpecialFlags.NONE.value, SpecialFlags.NONE.value, SpecialFlags.NONE.value,
+                               SpecialFlags.NONE.value, SpecialFlags.NONE.value, SpecialFlags.NONE.value,
+                               SpecialFlags.EN_PASSANT.value, SpecialFlags.CASTLING.value,
+                               SpecialFlags.PROMOTE_TO_QUEEN.value, SpecialFlags.PROMOTE_TO_KNIGHT.value,
+                               SpecialFlags.PROMOTE_TO_ROOK.value, SpecialFlags.PROMOTE_TO_BISHOP.value)
+MOVE_KINDS: Dict[Tuple[int, int], int] = {
+    (piece, special_flag): kind << MOVE_KIND_SHIFT
+    for kind, (piece, special_flag) in enumerate(zip(KIND_PIECES, KIND_FLAGS))
+}
@@ -1,20 +1,19 @@
+from array import array
 from dataclasses import dataclass
 from dataclasses import field
 from typing import Any
+from typing import Optional
 from typing import TYPE_CHECKING
 
-from numpy import asarray
-from numpy import dtype
-from numpy import generic
-from numpy import ndarray
-
 from exceptions.NullArgumentException import NullArgumentException
-from game_window.moving.generation.data.Move import Move
+from game_window.enums.MoveEnum import MoveEnum
 from game_window.moving.generation.data.MoveList import MoveList
+from game_window.moving.generation.data.MoveUtil import NO_MOVE
 from game_window.moving.MoveSortUtil import MoveSortUtil
 
 if TYPE_CHECKING:
     from game_window.board.Board import Board
+    from game_window.engine.MoveHistory import MoveHistory
 
 
 @dataclass(slots=True, order=True, unsafe_hash=True)
@@ -22,19 +21,27 @@ class Moves(MoveList):
     """
     Class containing the list of item
     """
-    __moves: ndarray[Move, dtype[generic]]
+    __moves: array = field(default_factory=lambda: array("H", bytes(2 * MoveEnum.MAX_NUM_OF_MOVES.value)))
     __size: int = field(default=0)
+    __scores: array = field(default_factory=lambda: array("i", bytes(4 * MoveEnum.MAX_NUM_OF_MOVES.value)))
 
-    def append(self, move: Move) -> None:
+    def append(self, move: int) -> None:
         """
         Method used to append new move to the Moves
-        :param move: Move instance
+        :param move: int encoded move
         """
         if move is None:
             raise NullArgumentException("WHY YOU ADD NULL MOVE TO MOVE LIST ?")
         self.__moves[self.__size] = move
         self.__size += 1
 
+    def clear(self) -> None:
+        """
+        Method used to reset move list, so its buffer can be reused without new allocation
+        :return: None
+        """
+        self.__size = 0
+
     def size(self) -> int:
         """
         Method used to return the size of move list
@@ -51,18 +58,70 @@ def is_empty(self) -> bool:
 
     def sort(self, board: 'Board') -> None:
         """
-        Method used to sort list of item based on
+        Method used to sort moves in place from the most promising one. Moves with equal scores keep their order.
+        :param board: Board instance
+        :return: None
+        """
+        self.score_moves(board)
+        order: list[int] = sorted(range(self.__size), key=self.__scores.__getitem__, reverse=True)
+
+        self.__moves[:self.__size] = array("H", [self.__moves[index] for index in order])
+        self.__scores[:self.__size] = array("i", [self.__scores[index] for index in order])
+
+    def score_moves(self, board: 'Board', hash_move: int = NO_MOVE, move_history: Optional['MoveHistory'] = None,
+                    ply: int = 0) -> None:
+        """
+        Method used to count ordering score of every move once, so moves can be picked lazily with pick_best_move
+        :param board: Board instance
+        :param hash_move: int encoded best move stored in transposition table which is scored above any other move
+        :param move_history: MoveHistory instance used to order by MVV-LVA, killers and history, if not given moves
+        are ordered by static score only
+        :param ply: int distance of node from the root used to pick killer moves
         :return: None
         """
-        sorted_moves: list[Move] = sorted(self.__moves, key=lambda item: MoveSortUtil.count_moves_score(item, board),
-                                          reverse=True)
-        self.__moves = asarray(sorted_moves)
+        for index in range(self.__size):
+            move: int = self.__moves[index]
+
+            if move == hash_move:
+                self.__scores[index] = MoveEnum.HASH_MOVE_SCORE.value
+            elif move_history is None:
+                self.__scores[index] = MoveSortUtil.count_moves_score(move, board)
+            else:
+                self.__scores[index] = MoveSortUtil.count_ordering_score(move, board, move_history, ply)
+
+    def score_captures(self, board: 'Board') -> None:
+        """
+        Method used to score captures with MVV-LVA, so they can be picked lazily with pick_best_move
+        :param board: Board instance
+        :return: None
+        """
+        for index in range(self.__size):
+            self.__scores[index] = MoveSortUtil.count_mvv_lva_score(self.__moves[index], board)
+
+    def pick_best_move(self, index: int) -> int:
+        """
+        Method used to move the best scored move from not yet picked ones to the given index and return it.
+        Moves between are shifted by one, so the result is the same as after a stable sort. Requires score_moves call.
+        :param index: int index of the first not picked move
+        :return: int encoded move
+        """
+        best_index: int = max(range(index, self.__size), key=self.__scores.__getitem__)
+
+        if best_index != index:
+            best_move: int = self.__moves[best_index]
+            best_score: int = self.__scores[best_index]
+
+            self.__moves[index + 1:best_index + 1] = self.__moves[index:best_index]
+            self.__scores[index + 1:best_index + 1] = self.__scores[index:best_index]
+            self.__moves[index] = best_move
+            self.__scores[index] = best_score
+        return self.__moves[index]
 
     def __iter__(self) -> Any:
-        return self.__moves.__iter__()
+        return self.__moves[:self.__size].__iter__()
 
     def __getitem__(self, item: int) -> Any:
         return self.__moves[item]
 
-    def __contains__(self, move: Move) -> bool:
-        return move in self.__moves
+    def __contains__(self, move: int) -> bool:
+        return move in self.__moves[:self.__size]
@@ -1,22 +1,29 @@
 from typing import Tuple
 from typing import TYPE_CHECKING
 
+from numpy import dtype
+from numpy import int8
+from numpy import ndarray
+
 from game_window.board.BoardUtil import BoardUtil
 from game_window.ColorManager import ColorManager
-from game_window.enums.BoardEnum import BoardEnum
 from game_window.enums.MoveEnum import MoveEnum
 from game_window.enums.PiecesEnum import PiecesEnum
 from game_window.enums.SpecialFlags import SpecialFlags
-from game_window.moving.generation.data.Move import Move
 from game_window.moving.generation.data.MoveList import MoveList
-from game_window.moving.generation.GenUtil import GenUtil
+from game_window.moving.generation.data.MoveUtil import END_SQUARE_SHIFT
+from game_window.moving.generation.data.MoveUtil import MoveUtil
 from game_window.moving.generation.king_and_knights.KingKnightGenerator import KingKnightGenerator
 from game_window.moving.generation.king_and_knights.KingUtil import KingUtil
-from game_window.moving.generation.pawns.PawnUtil import PawnUtil
 
 if TYPE_CHECKING:
     from game_window.board.Board import Board
 
+KNIGHT_TARGETS: Tuple[Tuple[int, ...], ...] = KingUtil.calculate_jump_targets(MoveEnum.KNIGHT_DIRECTIONS.value,
+                                                                              MoveEnum.MAX_KNIGHT_JUMP.value)
+KING_TARGETS: Tuple[Tuple[int, ...], ...] = KingUtil.calculate_jump_targets(MoveEnum.KING_DIRECTIONS.value,
+                                                                            MoveEnum.KING_RANGE.value)
+
 
 class KingKnightGen(KingKnightGenerator):
     """
@@ -37,27 +44,20 @@ def generate_moves_for_knight_and_king(self, moves_list: MoveList, piece: int, c
         :param start_square: int index of current end_square
         :return: None
         """
-        if piece == PiecesEnum.KING.value:
-            directions: Tuple[int, ...] = MoveEnum.KING_DIRECTIONS.value
-            piece_range: int = MoveEnum.KING_RANGE.value
-        else:
-            directions = MoveEnum.KNIGHT_DIRECTIONS.value
-            piece_range = MoveEnum.MAX_KNIGHT_JUMP.value
-
-        for direction in range(MoveEnum.KK_DIRECTIONS_NUMBER.value):
-            move_target: int = start_square + directions[direction]
+        targets: Tuple[int, ...] = KING_TARGETS[start_square] if piece == PiecesEnum.KING.value else \
+            KNIGHT_TARGETS[start_square]
+        board_array: ndarray[int, dtype[int8]] = board.board_array()
+        move_code: int = MoveUtil.get_move_kind(piece, SpecialFlags.NONE.value) | start_square
 
-            if move_target > BoardEnum.BOARD_SIZE.value - 1 or move_target < 0:
-                continue
-
-            if not PawnUtil.is_attack_target_in_border_bounds(start_square, move_target, piece_range):
-                continue
-            piece_on_move_target: int = board.board_array()[move_target]
+        for move_target in targets:
+            piece_on_move_target: int = board_array[move_target]
 
-            if ColorManager.get_piece_color(piece_on_move_target) == color:
+            if piece_on_move_target == PiecesEnum.NONE.value:
+                if captures_only:
+                    continue
+            elif ColorManager.get_piece_color(piece_on_move_target) == color:
                 continue
-            move: Move = Move(start_square, move_target, piece, SpecialFlags.NONE.value)
-            GenUtil.add_move_if_needed(moves_list, move, captures_only, board)
+            moves_list.append(move_code | move_target << END_SQUARE_SHIFT)
 
         if piece == PiecesEnum.KING.value and not captures_only:
             self.__generate_castling_moves(moves_list, piece, color, board, start_square)
@@ -78,11 +78,11 @@ def __generate_castling_moves(self, moves_list: MoveList, piece: int, color: int
                 move_target: int = start_square + MoveEnum.CASTLE_MOVE.value
             else:
                 move_target = start_square - MoveEnum.CASTLE_MOVE.value
-            moves_list.append(Move(start_square, move_target, piece, SpecialFlags.CASTLING.value))
+            moves_list.append(MoveUtil.encode_move(start_square, move_target, piece, SpecialFlags.CASTLING.value))
 
         if not KingUtil.is_anything_on_queen_side(board, start_square) and board.can_king_castle_queen_side(color):
             if not BoardUtil.is_board_inverted(board):
                 move_target = start_square - MoveEnum.CASTLE_MOVE.value
             else:
                 move_target = start_square + MoveEnum.CASTLE_MOVE.value
-            moves_list.append(Move(start_square, move_target, piece, SpecialFlags.CASTLING.value))
+            moves_list.append(MoveUtil.encode_move(start_square, move_target, piece, SpecialFlags.CASTLING.value))
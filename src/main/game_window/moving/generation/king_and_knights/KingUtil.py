@@ -1,3 +1,5 @@
+from typing import List
+from typing import Tuple
 from typing import TYPE_CHECKING
 
 from numpy import array
@@ -159,3 +161,33 @@ def find_friendly_king_squares(board_array: ndarray[int, dtype[int8]], color_to_
             if board_array[index] == color_to_move | PiecesEnum.KING.value:
                 return index
         raise ValueError("THERE IS NO FRIENDLY KING AND IT IS NOT POSSIBLE!")
+
+    @staticmethod
+    def calculate_jump_targets(directions: Tuple[int, ...], max_jump: int) -> Tuple[Tuple[int, ...], ...]:
+        """
+        Calculates targets of every square for pieces jumping by given directions (knights and kings)
+        :param directions: tuple of int directions
+        :param max_jump: int value of max column distance of a single jump
+        :return: tuple indexed by square containing tuples of valid target squares
+        """
+        if directions is None or max_jump is None:
+            raise NullArgumentException("ARGUMENTS CANNOT BE NULLS!")
+        if max_jump < 0:
+            raise IllegalArgumentException("MAX JUMP CANNOT BE NEGATIVE!")
+        targets: List[Tuple[int, ...]] = []
+
+        for square in range(BoardEnum.BOARD_SIZE.value):
+            square_targets: List[int] = []
+
+            for direction in directions:
+                move_target: int = square + direction
+
+                if move_target < 0 or move_target > BoardEnum.BOARD_SIZE.value - 1:
+                    continue
+                column_distance: int = abs(square % BoardEnum.BOARD_LENGTH.value -
+                                           move_target % BoardEnum.BOARD_LENGTH.value)
+
+                if column_distance <= max_jump:
+                    square_targets.append(move_target)
+            targets.append(tuple(square_targets))
+        return tuple(targets)
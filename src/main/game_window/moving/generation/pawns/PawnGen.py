@@ -4,8 +4,8 @@
 from game_window.enums.MoveEnum import MoveEnum
 from game_window.enums.PiecesEnum import PiecesEnum
 from game_window.enums.SpecialFlags import SpecialFlags
-from game_window.moving.generation.data.Move import Move
 from game_window.moving.generation.data.MoveList import MoveList
+from game_window.moving.generation.data.MoveUtil import MoveUtil
 from game_window.moving.generation.pawns.PawnGenerator import PawnGenerator
 from game_window.moving.generation.pawns.PawnUtil import PawnUtil
 
@@ -70,7 +70,7 @@ def __add_pawn_moves(self, start_square: int, piece: int, color: int, moves_list
         if pawn_index_bounds_min <= start_square <= pawn_index_bounds_max and PawnUtil.no_piece_in_pawns_way(
                 double_move_target, start_square, board,
                 direction * MoveEnum.PAWN_UP_SINGLE_MOVE.value):
-            moves_list.append(Move(start_square, double_move_target, piece, SpecialFlags.NONE.value))
+            moves_list.append(MoveUtil.encode_move(start_square, double_move_target, piece, SpecialFlags.NONE.value))
         if board.board_array()[move_target] == 0:
             self.__add_moves_and_promotions(start_square, move_target, piece, moves_list)
 
@@ -90,20 +90,14 @@ def __add_pawn_attacks(self, start_square: int, piece: int, color: int, moves_li
         left_piece_square: int = start_square + PawnUtil.get_attack_direction(color, "LEFT", engine_color)
         right_piece_square: int = start_square + PawnUtil.get_attack_direction(color, "RIGHT", engine_color)
 
-        if left_piece_square < 0 or left_piece_square > 63 or right_piece_square < 0 or right_piece_square > 63:
-            return
-        left_piece: int = board.board_array()[left_piece_square]
-        right_piece: int = board.board_array()[right_piece_square]
-
-        if color != ColorManager.get_piece_color(left_piece) and left_piece != PiecesEnum.NONE.value:
-            if PawnUtil.is_attack_target_in_border_bounds(start_square, left_piece_square,
-                                                          MoveEnum.PAWN_RANGE.value):
-                self.__add_moves_and_promotions(start_square, left_piece_square, piece, moves_list)
-
-        if color != ColorManager.get_piece_color(right_piece) and right_piece != PiecesEnum.NONE.value:
-            if PawnUtil.is_attack_target_in_border_bounds(start_square, right_piece_square,
-                                                          MoveEnum.PAWN_RANGE.value):
-                self.__add_moves_and_promotions(start_square, right_piece_square, piece, moves_list)
+        for target_square in (left_piece_square, right_piece_square):
+            if target_square < 0 or target_square > 63:
+                continue
+            target_piece: int = board.board_array()[target_square]
+
+            if color != ColorManager.get_piece_color(target_piece) and target_piece != PiecesEnum.NONE.value:
+                if PawnUtil.is_attack_target_in_border_bounds(start_square, target_square, MoveEnum.PAWN_RANGE.value):
+                    self.__add_moves_and_promotions(start_square, target_square, piece, moves_list)
         self.__add_en_passant_moves(start_square, piece, color, moves_list, board)
 
     def __add_moves_and_promotions(self, start_square: int, move_target: int, piece: int, moves_list: MoveList) -> None:
@@ -117,9 +111,9 @@ def __add_moves_and_promotions(self, start_square: int, move_target: int, piece:
         """
         if 56 <= move_target <= 63 or 0 <= move_target <= 7:
             for flag in range(SpecialFlags.PROMOTE_TO_QUEEN.value, SpecialFlags.PROMOTE_TO_BISHOP.value + 1):
-                moves_list.append(Move(start_square, move_target, piece, flag))
+                moves_list.append(MoveUtil.encode_move(start_square, move_target, piece, flag))
         else:
-            moves_list.append(Move(start_square, move_target, piece, SpecialFlags.NONE.value))
+            moves_list.append(MoveUtil.encode_move(start_square, move_target, piece, SpecialFlags.NONE.value))
 
     def __add_en_passant_moves(self, start_square: int, piece: int, color: int, moves_list: MoveList, board: 'Board') -> None:
         """
@@ -138,7 +132,11 @@ def __add_en_passant_moves(self, start_square: int, piece: int, color: int, move
 
         if not PawnUtil.is_it_valid_en_passant(board, color):
             return
+        if not PawnUtil.is_attack_target_in_border_bounds(start_square, en_passant_square, MoveEnum.PAWN_RANGE.value):
+            return
         if en_passant_square == en_passant_target_left:
-            moves_list.append(Move(start_square, en_passant_target_left, piece, SpecialFlags.EN_PASSANT.value))
+            moves_list.append(MoveUtil.encode_move(start_square, en_passant_target_left, piece,
+                                                   SpecialFlags.EN_PASSANT.value))
         elif en_passant_square == en_passant_target_right:
-            moves_list.append(Move(start_square, en_passant_target_right, piece, SpecialFlags.EN_PASSANT.value))
+            moves_list.append(MoveUtil.encode_move(start_square, en_passant_target_right, piece,
+                                                   SpecialFlags.EN_PASSANT.value))
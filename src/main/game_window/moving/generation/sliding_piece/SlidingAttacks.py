@@ -0,0 +1,147 @@
+from typing import List
+from typing import Tuple
+
+from numpy import dtype
+from numpy import int8
+from numpy import ndarray
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.board.BoardUtil import BoardUtil
+from game_window.enums.BoardEnum import BoardEnum
+from game_window.enums.MoveEnum import MoveEnum
+from game_window.enums.PiecesEnum import PiecesEnum
+
+
+class SlidingAttacks:
+    """
+    Class containing methods to calculate sliding pieces attacks with precomputed rays and first blocker lookup
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def calculate_rays() -> Tuple[Tuple[int, ...], ...]:
+        """
+        Calculates ray bitboards (every square up to the board border) for every sliding direction and every square
+        :return: tuple indexed by direction index (MoveEnum.SLIDING_DIRECTIONS order) of tuples indexed by square
+        """
+        distances: ndarray[int, dtype[int8]] = BoardUtil.calculate_distance_to_borders()
+        rays: List[Tuple[int, ...]] = []
+
+        for direction_index, direction in enumerate(MoveEnum.SLIDING_DIRECTIONS.value):
+            direction_rays: List[int] = []
+
+            for square in range(BoardEnum.BOARD_SIZE.value):
+                ray: int = 0
+
+                for direction_step in range(distances[square][direction_index]):
+                    ray |= 1 << (square + direction * (direction_step + 1))
+                direction_rays.append(ray)
+            rays.append(tuple(direction_rays))
+        return tuple(rays)
+
+    @staticmethod
+    def calculate_squares_between() -> Tuple[Tuple[int, ...], ...]:
+        """
+        Calculates bitboards of squares lying strictly between every pair of squares sharing a line or a diagonal
+        :return: tuple indexed by first square of tuples indexed by second square (0 if squares are not aligned)
+        """
+        rays: Tuple[Tuple[int, ...], ...] = SlidingAttacks.calculate_rays()
+        squares_between: List[List[int]] = [[0] * BoardEnum.BOARD_SIZE.value
+                                            for _ in range(BoardEnum.BOARD_SIZE.value)]
+
+        for direction_rays in rays:
+            for square in range(BoardEnum.BOARD_SIZE.value):
+                ray: int = direction_rays[square]
+
+                while ray:
+                    target_bit: int = ray & -ray
+                    target: int = target_bit.bit_length() - 1
+                    squares_between[square][target] = direction_rays[square] & ~direction_rays[target] & ~target_bit
+                    ray ^= target_bit
+        return tuple(tuple(row) for row in squares_between)
+
+    @staticmethod
+    def get_ray_attacks(direction_index: int, square: int, occupancy: int) -> int:
+        """
+        Returns attacks of a sliding piece in single direction. Ray is cut on the first blocker which is
+        the least significant bit for increasing directions and the most significant one for decreasing ones.
+        :param direction_index: int index of direction in MoveEnum.SLIDING_DIRECTIONS
+        :param square: int index of start square
+        :param occupancy: int bitboard of every piece on board
+        :return: int bitboard of attacked squares
+        """
+        direction_rays: Tuple[int, ...] = RAYS[direction_index]
+        attacks: int = direction_rays[square]
+        blockers: int = attacks & occupancy
+
+        if blockers == 0:
+            return attacks
+
+        if INCREASING_DIRECTIONS[direction_index]:
+            first_blocker: int = (blockers & -blockers).bit_length() - 1
+        else:
+            first_blocker = blockers.bit_length() - 1
+        return attacks ^ direction_rays[first_blocker]
+
+    @staticmethod
+    def get_bishop_attacks(square: int, occupancy: int) -> int:
+        """
+        Returns bitboard of squares attacked by a bishop
+        :param square: int index of bishop square
+        :param occupancy: int bitboard of every piece on board
+        :return: int bitboard of attacked squares
+        """
+        attacks: int = 0
+
+        for direction_index in DIAGONAL_DIRECTIONS_INDEXES:
+            attacks |= SlidingAttacks.get_ray_attacks(direction_index, square, occupancy)
+        return attacks
+
+    @staticmethod
+    def get_rook_attacks(square: int, occupancy: int) -> int:
+        """
+        Returns bitboard of squares attacked by a rook
+        :param square: int index of rook square
+        :param occupancy: int bitboard of every piece on board
+        :return: int bitboard of attacked squares
+        """
+        attacks: int = 0
+
+        for direction_index in LINE_DIRECTIONS_INDEXES:
+            attacks |= SlidingAttacks.get_ray_attacks(direction_index, square, occupancy)
+        return attacks
+
+    @staticmethod
+    def get_sliding_piece_attacks(piece: int, square: int, occupancy: int) -> int:
+        """
+        Returns bitboard of squares attacked by a sliding piece (bishop, rook or queen)
+        :param piece: int value of piece without color
+        :param square: int index of piece square
+        :param occupancy: int bitboard of every piece on board
+        :return: int bitboard of attacked squares
+        """
+        if piece is None or square is None or occupancy is None:
+            raise NullArgumentException("ARGUMENTS CANNOT BE NULLS!")
+
+        if piece == PiecesEnum.BISHOP.value:
+            return SlidingAttacks.get_bishop_attacks(square, occupancy)
+        if piece == PiecesEnum.ROOK.value:
+            return SlidingAttacks.get_rook_attacks(square, occupancy)
+        if piece == PiecesEnum.QUEEN.value:
+            return SlidingAttacks.get_bishop_attacks(square, occupancy) | \
+                SlidingAttacks.get_rook_attacks(square, occupancy)
+        raise IllegalArgumentException("IT IS NOT A SLIDING PIECE!")
+
+
+DIAGONAL_DIRECTIONS_INDEXES: Tuple[int, ...] = tuple(
+    index for index, direction in enumerate(MoveEnum.SLIDING_DIRECTIONS.value)
+    if direction in (MoveEnum.TOP_LEFT.value, MoveEnum.TOP_RIGHT.value, MoveEnum.BOTTOM_LEFT.value,
+                     MoveEnum.BOTTOM_RIGHT.value))
+LINE_DIRECTIONS_INDEXES: Tuple[int, ...] = tuple(
+    index for index, direction in enumerate(MoveEnum.SLIDING_DIRECTIONS.value)
+    if direction in (MoveEnum.TOP.value, MoveEnum.LEFT.value, MoveEnum.RIGHT.value, MoveEnum.BOTTOM.value))
+INCREASING_DIRECTIONS: Tuple[bool, ...] = tuple(direction > 0 for direction in MoveEnum.SLIDING_DIRECTIONS.value)
+RAYS: Tuple[Tuple[int, ...], ...] = SlidingAttacks.calculate_rays()
+SQUARES_BETWEEN: Tuple[Tuple[int, ...], ...] = SlidingAttacks.calculate_squares_between()
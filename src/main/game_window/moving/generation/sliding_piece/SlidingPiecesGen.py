@@ -1,14 +1,19 @@
 from typing import TYPE_CHECKING
 
+from numpy import dtype
+from numpy import int8
+from numpy import ndarray
+
 from exceptions.IllegalArgumentException import IllegalArgumentException
 from exceptions.NullArgumentException import NullArgumentException
+from game_window.board.BitBoardUtil import BitBoardUtil
 from game_window.ColorManager import ColorManager
-from game_window.enums.MoveEnum import MoveEnum
 from game_window.enums.PiecesEnum import PiecesEnum
 from game_window.enums.SpecialFlags import SpecialFlags
-from game_window.moving.generation.data.Move import Move
 from game_window.moving.generation.data.MoveList import MoveList
-from game_window.moving.generation.GenUtil import GenUtil
+from game_window.moving.generation.data.MoveUtil import END_SQUARE_SHIFT
+from game_window.moving.generation.data.MoveUtil import MoveUtil
+from game_window.moving.generation.sliding_piece.SlidingAttacks import SlidingAttacks
 from game_window.moving.generation.sliding_piece.SlidingGenerator import SlidingGenerator
 from game_window.moving.generation.sliding_piece.SlidingPiecesUtil import SlidingPiecesUtil
 
@@ -41,17 +46,19 @@ def generate_sliding_piece_moves(self, piece: int, start_square: int, moves_list
                 or start_square < 0:
             raise IllegalArgumentException("GIVEN ARGS ARE NOT WITHIN BONDS!")
 
-        for direction in range(MoveEnum.SLIDING_DIRECTIONS_NUMBER.value):
-            for direction_step in range(board.distances()[start_square][direction]):
-                if not SlidingPiecesUtil.is_it_sliding_piece_move(piece, MoveEnum.SLIDING_DIRECTIONS.value[direction]):
-                    continue
-                move_target: int = start_square + MoveEnum.SLIDING_DIRECTIONS.value[direction] * (direction_step + 1)
-                piece_on_move_target: int = board.board_array()[move_target]
+        if not SlidingPiecesUtil.is_it_sliding_piece(piece):
+            raise IllegalArgumentException("IT IS NOT A SLIDING PIECE!")
+        occupancy: int = board.occupancy()
+        board_array: ndarray[int, dtype[int8]] = board.board_array()
+        attacks: int = SlidingAttacks.get_sliding_piece_attacks(piece, start_square, occupancy)
+        move_code: int = MoveUtil.get_move_kind(piece, SpecialFlags.NONE.value) | start_square
+
+        for move_target in BitBoardUtil.get_squares(attacks & occupancy):
+            if ColorManager.get_piece_color(board_array[move_target]) != color:
+                moves_list.append(move_code | move_target << END_SQUARE_SHIFT)
 
-                if ColorManager.get_piece_color(piece_on_move_target) == color:
-                    break
-                move: Move = Move(start_square, move_target, piece, SpecialFlags.NONE.value)
-                GenUtil.add_move_if_needed(moves_list, move, captures_only, board)
+        if captures_only:
+            return
 
-                if ColorManager.get_piece_color(piece_on_move_target) == ColorManager.get_opposite_piece_color(color):
-                    break
+        for move_target in BitBoardUtil.get_squares(attacks & ~occupancy):
+            moves_list.append(move_code | move_target << END_SQUARE_SHIFT)
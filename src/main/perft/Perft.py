@@ -0,0 +1,92 @@
+from typing import Dict
+from typing import TYPE_CHECKING
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.moving.generation.data.MoveData import MoveData
+from game_window.moving.generation.data.MoveList import MoveList
+from game_window.moving.generation.data.MoveListPool import MoveListPool
+from game_window.moving.generation.Generator import Generator
+from game_window.moving.MoveMaker import MoveMaker
+from uci.UciUtil import UciUtil
+
+if TYPE_CHECKING:
+    from game_window.board.Board import Board
+
+
+class Perft:
+    """
+    Class counting leaf nodes of legal move tree, used to check move generator correctness and measure its speed.
+    Leaves are counted in bulk: on the last ply only the size of legal moves list is added.
+    """
+
+    __slots__ = ("__generator", "__move_lists")
+
+    def __init__(self, generator: Generator) -> None:
+        if generator is None:
+            raise NullArgumentException("GENERATOR CANNOT BE NULL!")
+        self.__generator: Generator = generator
+        self.__move_lists: MoveListPool = MoveListPool()
+
+    def count_nodes(self, board: 'Board', depth: int) -> int:
+        """
+        Method used to count leaf nodes of legal move tree of color to move
+        :param board: Board instance
+        :param depth: int depth of the tree
+        :return: int number of leaf nodes
+        """
+        if board is None or depth is None:
+            raise NullArgumentException("BOARD AND DEPTH CANNOT BE NULLS!")
+        if depth < 0:
+            raise IllegalArgumentException("DEPTH CANNOT BE NEGATIVE!")
+        if depth == 0:
+            return 1
+        return self.__count_nodes(board, depth, 0)
+
+    def divide(self, board: 'Board', depth: int) -> Dict[str, int]:
+        """
+        Method used to count leaf nodes below every legal move of color to move
+        :param board: Board instance
+        :param depth: int depth of the tree counted with root moves
+        :return: dict of moves in UCI notation and their numbers of leaf nodes
+        """
+        if board is None or depth is None:
+            raise NullArgumentException("BOARD AND DEPTH CANNOT BE NULLS!")
+        if depth < 1:
+            raise IllegalArgumentException("DIVIDE DEPTH HAS TO BE POSITIVE!")
+        color: int = board.color_to_move()
+        moves_list: MoveList = self.__generator.generate_legal_moves(color, board)
+        nodes: Dict[str, int] = {}
+
+        for index in range(moves_list.size()):
+            move: int = moves_list[index]
+            uci_move: str = UciUtil.convert_move_to_uci(move, board)
+
+            move_data: MoveData = MoveMaker.make_move(move, color, board)
+            nodes[uci_move] = self.count_nodes(board, depth - 1)
+            MoveMaker.un_make_move(move, move_data, board)
+        return nodes
+
+    def __count_nodes(self, board: 'Board', depth: int, ply: int) -> int:
+        """
+        Recursive part of node counting
+        :param board: Board instance
+        :param depth: int remaining depth, at least 1
+        :param ply: int distance from the root used to pick move list from the pool
+        :return: int number of leaf nodes
+        """
+        color: int = board.color_to_move()
+        moves_list: MoveList = self.__generator.generate_legal_moves(color, board,
+                                                                     moves_list=self.__move_lists.get_move_list(ply))
+
+        if depth == 1:
+            return moves_list.size()
+        nodes: int = 0
+
+        for index in range(moves_list.size()):
+            move: int = moves_list[index]
+
+            move_data: MoveData = MoveMaker.make_move(move, color, board)
+            nodes += self.__count_nodes(board, depth - 1, ply + 1)
+            MoveMaker.un_make_move(move, move_data, board)
+        return nodes
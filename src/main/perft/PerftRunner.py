@@ -0,0 +1,128 @@
+from time import perf_counter
+from typing import Dict
+from typing import TextIO
+from typing import Tuple
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.board.Board import Board
+from game_window.board.fen.FenData import FenData
+from game_window.board.fen.FenMaker import FenMaker
+from game_window.board.GameBoard import GameBoard
+from game_window.enums.PerftEnum import PerftEnum
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.moving.generation.MoveGenerator import MoveGenerator
+from perft.Perft import Perft
+
+
+class PerftRunner:
+    """
+    Class running perft on single positions or on the bundled suite and reporting nodes, time and nodes per second
+    """
+
+    __slots__ = ("__output", "__generator", "__perft")
+
+    def __init__(self, output_stream: TextIO) -> None:
+        if output_stream is None:
+            raise NullArgumentException("OUTPUT STREAM CANNOT BE NULL!")
+        self.__output: TextIO = output_stream
+        self.__generator: MoveGenerator = MoveGenerator()
+        self.__perft: Perft = Perft(self.__generator)
+
+    def run_position(self, fen: str, depth: int, divide: bool = False,
+                     engine_color: int = PiecesEnum.BLACK.value) -> int:
+        """
+        Method used to run perft of given position and report it
+        :param fen: str fen string
+        :param depth: int depth of the tree
+        :param divide: bool if nodes below every root move should be reported
+        :param engine_color: int value of engine color which decides board orientation
+        :return: int number of leaf nodes
+        """
+        if None in (fen, depth, divide, engine_color):
+            raise NullArgumentException("FEN, DEPTH, DIVIDE AND ENGINE COLOR CANNOT BE NULLS!")
+        board: Board = self.create_board(fen, engine_color)
+        start_time: float = perf_counter()
+
+        if divide:
+            divided_nodes: Dict[str, int] = self.__perft.divide(board, depth)
+            nodes: int = sum(divided_nodes.values())
+
+            for uci_move, move_nodes in sorted(divided_nodes.items()):
+                self.__write(f"{uci_move}: {move_nodes}")
+        else:
+            nodes = self.__perft.count_nodes(board, depth)
+        self.__write(f"Nodes: {nodes} {self.__get_speed_report(nodes, perf_counter() - start_time)}")
+
+        return nodes
+
+    def run_suite(self, depth: int) -> bool:
+        """
+        Method used to run every suite position in both board orientations up to given depth. Positions without
+        expected count on given depth are run on their deepest known depth.
+        :param depth: int maximal depth of the tree
+        :return: bool True if every count was as expected
+        """
+        if depth is None:
+            raise NullArgumentException("DEPTH CANNOT BE NULL!")
+        if depth < 1:
+            raise IllegalArgumentException("DEPTH HAS TO BE POSITIVE!")
+        suite: Tuple[Tuple[str, str, Tuple[int, ...]], ...] = PerftEnum.SUITE.value
+        total_nodes: int = 0
+        total_time: float = 0.0
+        failed: int = 0
+
+        for name, fen, expected_counts in suite:
+            position_depth: int = min(depth, len(expected_counts))
+            expected: int = expected_counts[position_depth - 1]
+
+            for engine_color, orientation in ((PiecesEnum.BLACK.value, "white down"),
+                                              (PiecesEnum.WHITE.value, "black down")):
+                board: Board = self.create_board(fen, engine_color)
+                start_time: float = perf_counter()
+                nodes: int = self.__perft.count_nodes(board, position_depth)
+                elapsed_time: float = perf_counter() - start_time
+                result: str = "OK" if nodes == expected else f"FAILED (expected {expected})"
+
+                total_nodes += nodes
+                total_time += elapsed_time
+                failed += nodes != expected
+                self.__write(f"{name} [{orientation}] depth {position_depth}: {nodes} {result} "
+                             f"{self.__get_speed_report(nodes, elapsed_time)}")
+        self.__write(f"Total: {total_nodes} nodes, {failed} failed {self.__get_speed_report(total_nodes, total_time)}")
+
+        return failed == 0
+
+    def create_board(self, fen: str, engine_color: int) -> Board:
+        """
+        Creates board with position of given fen and engine playing given color
+        :param fen: str fen string
+        :param engine_color: int value of engine color which decides board orientation
+        :return: Board instance
+        """
+        board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), self.__generator)
+        board.load_fen(fen, engine_color)
+
+        return board
+
+    @staticmethod
+    def __get_speed_report(nodes: int, elapsed_time: float) -> str:
+        """
+        Formats time and nodes per second of perft run
+        :param nodes: int number of leaf nodes
+        :param elapsed_time: float time in seconds
+        :return: str report
+        """
+        return f"({elapsed_time:.3f}s, {int(nodes / max(elapsed_time, MIN_TIME))} nps)"
+
+    def __write(self, message: str) -> None:
+        """
+        Writes single report line
+        :param message: str line without new line character
+        :return: None
+        """
+        self.__output.write(f"{message}\n")
+        self.__output.flush()
+
+
+MIN_TIME: float = 1e-6
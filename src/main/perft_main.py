@@ -0,0 +1,28 @@
+import sys
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from game_window.enums.BoardEnum import BoardEnum
+from game_window.enums.PerftEnum import PerftEnum
+from game_window.enums.PiecesEnum import PiecesEnum
+from perft.PerftRunner import PerftRunner
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description="Counts leaf nodes of legal move tree (perft).")
+    parser.add_argument("--fen", default=BoardEnum.STARTING_POSITION.value, help="position to count, start by default")
+    parser.add_argument("--depth", type=int, default=PerftEnum.DEFAULT_DEPTH.value, help="depth of the tree")
+    parser.add_argument("--divide", action="store_true", help="report nodes below every root move")
+    parser.add_argument("--black-down", action="store_true", help="count on board with black pieces at the bottom")
+    parser.add_argument("--suite", action="store_true", help="run bundled positions with expected counts")
+    arguments: Namespace = parser.parse_args()
+    runner: PerftRunner = PerftRunner(sys.stdout)
+
+    if arguments.suite:
+        sys.exit(0 if runner.run_suite(arguments.depth) else 1)
+    engine_color: int = PiecesEnum.WHITE.value if arguments.black_down else PiecesEnum.BLACK.value
+    runner.run_position(arguments.fen, arguments.depth, arguments.divide, engine_color)
+
+
+if __name__ == '__main__':
+    main()
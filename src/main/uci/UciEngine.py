@@ -0,0 +1,334 @@
+from threading import Lock
+from threading import Thread
+from time import perf_counter
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TextIO
+
+from numpy import inf
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.board.Board import Board
+from game_window.board.fen.FenData import FenData
+from game_window.board.fen.FenMaker import FenMaker
+from game_window.board.GameBoard import GameBoard
+from game_window.ColorManager import ColorManager
+from game_window.engine.EnginePlayer import EnginePlayer
+from game_window.engine.Evaluator import Evaluator
+from game_window.engine.TranspositionTable import TranspositionTable
+from game_window.enums.BoardEnum import BoardEnum
+from game_window.enums.MoveEnum import MoveEnum
+from game_window.enums.PerftEnum import PerftEnum
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.enums.SearchEnum import SearchEnum
+from game_window.enums.UciEnum import UciEnum
+from game_window.moving.generation.data.MoveData import MoveData
+from game_window.moving.generation.data.MoveUtil import MoveUtil
+from game_window.moving.generation.data.MoveUtil import NO_MOVE
+from game_window.moving.generation.MoveGenerator import MoveGenerator
+from game_window.moving.MoveMaker import MoveMaker
+from perft.Perft import Perft
+from uci.UciUtil import UciUtil
+
+
+class UciEngine:
+    """
+    Console front-end speaking UCI protocol over text streams. It uses only engine and board classes, so it can run
+    on headless machines without Qt. Search runs in a separate thread, so stop and isready are answered while engine
+    is thinking.
+    """
+
+    __slots__ = ("__input", "__output", "__output_lock", "__generator", "__evaluator", "__transposition_table",
+                 "__perft", "__board", "__engine", "__search_thread")
+
+    def __init__(self, input_stream: TextIO, output_stream: TextIO) -> None:
+        if input_stream is None or output_stream is None:
+            raise NullArgumentException("STREAMS CANNOT BE NULLS!")
+        self.__input: TextIO = input_stream
+        self.__output: TextIO = output_stream
+        self.__output_lock: Lock = Lock()
+        self.__generator: MoveGenerator = MoveGenerator()
+        self.__evaluator: Evaluator = Evaluator()
+        self.__transposition_table: TranspositionTable = TranspositionTable()
+        self.__perft: Perft = Perft(self.__generator)
+        self.__board: Optional[Board] = self.__create_board(BoardEnum.STARTING_POSITION.value,
+                                                            PiecesEnum.WHITE.value)
+        self.__engine: Optional[EnginePlayer] = None
+        self.__search_thread: Optional[Thread] = None
+
+    def run(self) -> None:
+        """
+        Method used to read and execute commands until quit command or end of input. On end of input running search
+        is allowed to finish, so scripted sessions get their best move.
+        :return: None
+        """
+        for line in self.__input:
+            if not self.handle_command(line):
+                return
+        self.__wait_for_search()
+
+    def handle_command(self, line: str) -> bool:
+        """
+        Method used to execute single line of UCI protocol. Unknown commands are ignored as protocol requires.
+        :param line: str command line
+        :return: bool False if engine should quit
+        """
+        if line is None:
+            raise NullArgumentException("COMMAND CANNOT BE NULL!")
+        tokens: List[str] = line.split()
+
+        if not tokens:
+            return True
+        if tokens[0] == "quit":
+            self.__stop_search()
+            return False
+        commands: Dict[str, Callable[[List[str]], None]] = {
+            "uci": self.__introduce,
+            "isready": self.__answer_ready,
+            "ucinewgame": self.__start_new_game,
+            "position": self.__set_position,
+            "go": self.__go,
+            "stop": self.__stop
+        }
+        command: Optional[Callable[[List[str]], None]] = commands.get(tokens[0])
+
+        if command is not None:
+            command(tokens)
+        return True
+
+    def __introduce(self, tokens: List[str]) -> None:
+        """
+        Answers uci command with engine identity
+        :param tokens: list of command tokens
+        :return: None
+        """
+        self.__write(f"id name {UciEnum.ENGINE_NAME.value}")
+        self.__write(f"id author {UciEnum.ENGINE_AUTHOR.value}")
+        self.__write("uciok")
+
+    def __answer_ready(self, tokens: List[str]) -> None:
+        """
+        Answers isready command
+        :param tokens: list of command tokens
+        :return: None
+        """
+        self.__write("readyok")
+
+    def __start_new_game(self, tokens: List[str]) -> None:
+        """
+        Stops search, clears transposition table and sets starting position
+        :param tokens: list of command tokens
+        :return: None
+        """
+        self.__stop_search()
+        self.__transposition_table.clear()
+        self.__board = self.__create_board(BoardEnum.STARTING_POSITION.value, PiecesEnum.WHITE.value)
+
+    def __set_position(self, tokens: List[str]) -> None:
+        """
+        Sets position given as startpos or fen and list of moves. Board is created with engine playing the color
+        which is to move after the last move, because engine searches only for its own color.
+        :param tokens: list of command tokens
+        :return: None
+        """
+        self.__stop_search()
+        moves_index: int = tokens.index("moves") if "moves" in tokens else len(tokens)
+        uci_moves: List[str] = tokens[moves_index + 1:]
+        self.__board = None
+
+        if moves_index >= 2 and tokens[1] == "startpos":
+            fen: str = BoardEnum.STARTING_POSITION.value
+        elif moves_index >= 3 and tokens[1] == "fen":
+            fen = " ".join(tokens[2:moves_index])
+        else:
+            self.__write("info string wrong position command")
+            return
+        fen_color: int = PiecesEnum.WHITE.value if fen.split()[1:2] == ["w"] else PiecesEnum.BLACK.value
+        engine_color: int = fen_color if len(uci_moves) % 2 == 0 else ColorManager.get_opposite_piece_color(fen_color)
+
+        try:
+            board: Board = self.__create_board(fen, engine_color)
+        except IllegalArgumentException:
+            self.__write(f"info string wrong fen {fen}")
+            return
+
+        for uci_move in uci_moves:
+            move: int = UciUtil.find_legal_move(uci_move, board, self.__generator)
+
+            if move == NO_MOVE:
+                self.__write(f"info string illegal move {uci_move}")
+                return
+            self.__make_move(move, board)
+        self.__board = board
+
+    def __go(self, tokens: List[str]) -> None:
+        """
+        Starts search in a separate thread with limits given by go command
+        :param tokens: list of command tokens
+        :return: None
+        """
+        self.__stop_search()
+        board: Optional[Board] = self.__board
+
+        if board is None:
+            self.__write(f"bestmove {UciEnum.NULL_MOVE.value}")
+            return
+        if tokens[1:2] == ["perft"]:
+            self.__run_perft(board, tokens)
+            return
+        limits: Dict[str, int] = self.__parse_go_limits(tokens)
+        infinite: bool = "infinite" in tokens
+        max_depth: int = min(limits.get("depth", MAX_DEPTH if infinite or limits else SearchEnum.MAX_DEPTH.value),
+                             MAX_DEPTH)
+        node_limit: int = limits.get("nodes", SearchEnum.NO_NODE_LIMIT.value)
+
+        time_limit: float = self.__get_time_limit(board, limits, infinite)
+
+        self.__engine = EnginePlayer(self.__generator, self.__evaluator, self.__transposition_table,
+                                     max_depth=max(max_depth, 1), time_limit=time_limit, node_limit=max(node_limit, 0),
+                                     verbose=False)
+        self.__search_thread = Thread(target=self.__search, args=(self.__engine, board), daemon=True)
+        self.__search_thread.start()
+
+    def __run_perft(self, board: Board, tokens: List[str]) -> None:
+        """
+        Answers go perft command with number of leaf nodes below every legal move
+        :param board: Board instance of counted position
+        :param tokens: list of command tokens
+        :return: None
+        """
+        depth: int = int(tokens[2]) if len(tokens) > 2 and tokens[2].isdigit() else PerftEnum.DEFAULT_DEPTH.value
+        divided_nodes: Dict[str, int] = self.__perft.divide(board, max(depth, 1))
+
+        for uci_move, nodes in divided_nodes.items():
+            self.__write(f"{uci_move}: {nodes}")
+        self.__write(f"\nNodes searched: {sum(divided_nodes.values())}\n")
+
+    def __stop(self, tokens: List[str]) -> None:
+        """
+        Answers stop command. Stopped search still posts the best move found so far.
+        :param tokens: list of command tokens
+        :return: None
+        """
+        self.__stop_search()
+
+    def __search(self, engine: EnginePlayer, board: Board) -> None:
+        """
+        Method executed in search thread
+        :param engine: EnginePlayer instance
+        :param board: Board instance
+        :return: None
+        """
+        start_time: float = perf_counter()
+
+        move: int = engine.get_computer_move(board)
+        elapsed_ms: int = max(int((perf_counter() - start_time) * UciEnum.MS_IN_SECOND.value), 1)
+        nodes: int = engine.get_searched_nodes() + engine.get_quiescence_nodes()
+        principal_variation: str = " ".join(UciUtil.convert_move_to_uci(pv_move, board)
+                                            for pv_move in engine.get_principal_variation())
+
+        self.__write(f"info depth {engine.get_completed_depth()} nodes {nodes} time {elapsed_ms} "
+                     f"nps {nodes * UciEnum.MS_IN_SECOND.value // elapsed_ms}"
+                     f"{f' pv {principal_variation}' if principal_variation else ''}")
+        self.__write(f"bestmove {UciUtil.convert_move_to_uci(move, board)}")
+
+    def __stop_search(self) -> None:
+        """
+        Method used to stop running search and wait for it to post its best move. Stop is requested until thread
+        finishes, because request sent before search started would be reset by it.
+        :return: None
+        """
+        while self.__engine is not None and self.__search_thread is not None and self.__search_thread.is_alive():
+            self.__engine.stop_search()
+            self.__search_thread.join(STOP_WAIT_SECONDS)
+        self.__wait_for_search()
+
+    def __wait_for_search(self) -> None:
+        """
+        Method used to wait until search thread finishes
+        :return: None
+        """
+        if self.__search_thread is not None:
+            self.__search_thread.join()
+            self.__search_thread = None
+
+    def __write(self, message: str) -> None:
+        """
+        Writes single protocol line. Lines can be written by both input and search threads.
+        :param message: str line without new line character
+        :return: None
+        """
+        with self.__output_lock:
+            self.__output.write(f"{message}\n")
+            self.__output.flush()
+
+    def __create_board(self, fen: str, engine_color: int) -> Board:
+        """
+        Creates board with position of given fen and engine playing given color
+        :param fen: str fen string
+        :param engine_color: int value of engine color
+        :return: Board instance
+        """
+        board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), self.__generator)
+        board.load_fen(fen, engine_color)
+
+        return board
+
+    @staticmethod
+    def __make_move(move: int, board: Board) -> None:
+        """
+        Makes move of color to move and updates fen counters the same way engine moves do
+        :param move: int encoded move
+        :param board: Board instance
+        :return: None
+        """
+        move_data: MoveData = MoveMaker.make_move(move, board.color_to_move(), board)
+        board.update_move_counter()
+        board.update_no_sack_and_pawn_counter(move_data.deleted_piece, MoveUtil.get_moving_piece(move))
+
+    @staticmethod
+    def __parse_go_limits(tokens: List[str]) -> Dict[str, int]:
+        """
+        Reads integer limits of go command. Limits without proper value are skipped.
+        :param tokens: list of command tokens
+        :return: dict of limit names and values
+        """
+        limits: Dict[str, int] = {}
+
+        for index in range(1, len(tokens) - 1):
+            if tokens[index] in UciEnum.GO_LIMITS.value and tokens[index + 1].lstrip("-").isdigit():
+                limits[tokens[index]] = int(tokens[index + 1])
+        return limits
+
+    def __get_time_limit(self, board: Board, limits: Dict[str, int], infinite: bool) -> float:
+        """
+        Calculates search time in seconds. Fixed move time is used as it is, clock time is split over moves to go.
+        Searches limited only by depth or nodes and infinite ones have no time limit.
+        :param board: Board instance of searched position
+        :param limits: dict of go limits
+        :param infinite: bool if go infinite was sent
+        :return: float time limit in seconds
+        """
+        ms_in_second: int = UciEnum.MS_IN_SECOND.value
+
+        if infinite:
+            return inf
+        if "movetime" in limits:
+            return max(limits["movetime"], 1) / ms_in_second
+        white_to_move: bool = board.color_to_move() == PiecesEnum.WHITE.value
+        clock: Optional[int] = limits.get("wtime" if white_to_move else "btime")
+
+        if clock is not None:
+            increment: int = limits.get("winc" if white_to_move else "binc", 0)
+            moves_to_go: int = max(limits.get("movestogo", UciEnum.DEFAULT_MOVES_TO_GO.value), 1)
+            return max(min(clock // moves_to_go + increment, clock // 2), 1) / ms_in_second
+        if "depth" in limits or "nodes" in limits:
+            return inf
+        return SearchEnum.TIME_LIMIT.value
+
+
+MAX_DEPTH: int = MoveEnum.MAX_SEARCH_PLY.value
+STOP_WAIT_SECONDS: float = 0.01
@@ -0,0 +1,108 @@
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.board.BoardUtil import BoardUtil
+from game_window.enums.BoardEnum import BoardEnum
+from game_window.enums.SpecialFlags import SpecialFlags
+from game_window.enums.UciEnum import UciEnum
+from game_window.moving.generation.data.MoveList import MoveList
+from game_window.moving.generation.data.MoveUtil import MoveUtil
+from game_window.moving.generation.data.MoveUtil import NO_MOVE
+from game_window.moving.generation.Generator import Generator
+
+if TYPE_CHECKING:
+    from game_window.board.Board import Board
+
+
+class UciUtil:
+    """
+    Util class converting board squares and encoded moves into UCI long algebraic notation and back. Board array is
+    rotated when engine plays white pieces, so every conversion depends on board orientation.
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def convert_square_to_uci(square: int, board: 'Board') -> str:
+        """
+        Method used to convert board index into square name like e4
+        :param square: int index of square
+        :param board: Board instance
+        :return: str name of square
+        """
+        if square is None or board is None:
+            raise NullArgumentException("SQUARE AND BOARD CANNOT BE NULLS!")
+        if square < 0 or square > 63:
+            raise IllegalArgumentException("SQUARE IS NOT WITHIN BOARD BOUNDS!")
+
+        if BoardUtil.is_board_inverted(board):
+            square = LAST_SQUARE - square
+        col: int = square % BOARD_LENGTH
+        row: int = BOARD_LENGTH - square // BOARD_LENGTH
+
+        return f"{FILES[col]}{row}"
+
+    @staticmethod
+    def convert_uci_to_square(name: str, board: 'Board') -> int:
+        """
+        Method used to convert square name like e4 into board index
+        :param name: str name of square
+        :param board: Board instance
+        :return: int index of square
+        """
+        if name is None or board is None:
+            raise NullArgumentException("SQUARE NAME AND BOARD CANNOT BE NULLS!")
+        if len(name) != 2 or name[0] not in FILES or name[1] not in RANKS:
+            raise IllegalArgumentException("SUCH SQUARE DOES NOT EXIST!")
+        square: int = (BOARD_LENGTH - int(name[1])) * BOARD_LENGTH + FILES.index(name[0])
+
+        return LAST_SQUARE - square if BoardUtil.is_board_inverted(board) else square
+
+    @staticmethod
+    def convert_move_to_uci(move: int, board: 'Board') -> str:
+        """
+        Method used to convert encoded move into UCI notation like e2e4 or e7e8q
+        :param move: int encoded move
+        :param board: Board instance
+        :return: str move in UCI notation
+        """
+        if move is None or board is None:
+            raise NullArgumentException("MOVE AND BOARD CANNOT BE NULLS!")
+        if move == NO_MOVE:
+            return UciEnum.NULL_MOVE.value
+        start_square: str = UciUtil.convert_square_to_uci(MoveUtil.get_start_square(move), board)
+        end_square: str = UciUtil.convert_square_to_uci(MoveUtil.get_end_square(move), board)
+        special_flag: int = MoveUtil.get_special_flag(move)
+
+        if special_flag in SpecialFlags.PROMOTIONS.value:
+            return f"{start_square}{end_square}{PROMOTION_LETTERS[special_flag - SpecialFlags.PROMOTE_TO_QUEEN.value]}"
+        return f"{start_square}{end_square}"
+
+    @staticmethod
+    def find_legal_move(uci_move: str, board: 'Board', generator: Generator) -> int:
+        """
+        Method used to find legal move of color to move matching given UCI notation
+        :param uci_move: str move in UCI notation
+        :param board: Board instance
+        :param generator: Generator instance
+        :return: int encoded move or NO_MOVE if such move is not legal
+        """
+        if uci_move is None or board is None or generator is None:
+            raise NullArgumentException("MOVE, BOARD AND GENERATOR CANNOT BE NULLS!")
+        legal_moves: MoveList = generator.generate_legal_moves(board.color_to_move(), board)
+
+        for index in range(legal_moves.size()):
+            move: int = legal_moves[index]
+
+            if UciUtil.convert_move_to_uci(move, board) == uci_move:
+                return move
+        return NO_MOVE
+
+
+BOARD_LENGTH: int = BoardEnum.BOARD_LENGTH.value
+LAST_SQUARE: int = BoardEnum.BOARD_SIZE.value - 1
+FILES: str = UciEnum.FILES.value
+RANKS: str = "12345678"
+PROMOTION_LETTERS: Tuple[str, ...] = UciEnum.PROMOTION_LETTERS.value
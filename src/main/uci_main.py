@@ -0,0 +1,11 @@
+import sys
+
+from uci.UciEngine import UciEngine
+
+
+def main() -> None:
+    UciEngine(sys.stdin, sys.stdout).run()
+
+
+if __name__ == '__main__':
+    main()
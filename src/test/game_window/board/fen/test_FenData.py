@@ -327,3 +327,18 @@ def test_set_en_passant_piece_square_not_valid_square() -> None:
         fen_data.set_en_passant_piece_square(square)
 
     # then
+
+
+def test_clear_en_passant_unsets_squares_and_key() -> None:
+    # given
+    fen_data = FenData(PiecesEnum.WHITE.value)
+    key_before: int = fen_data.zobrist_key()
+    fen_data.set_en_passant_square(20)
+    fen_data.set_en_passant_piece_square(28)
+
+    # when
+    fen_data.clear_en_passant()
+
+    # then
+    assert (fen_data.en_passant_square(), fen_data.en_passant_piece_square()) == (-1, -1)
+    assert fen_data.zobrist_key() == key_before
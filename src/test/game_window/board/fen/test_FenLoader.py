@@ -0,0 +1,70 @@
+from typing import Tuple
+
+import pytest
+from numpy import dtype
+from numpy import int8
+from numpy import ndarray
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from game_window.board.BoardInitializer import BoardInitializer
+from game_window.board.fen.FenLoader import FenLoader
+from game_window.enums.BoardEnum import BoardEnum
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.moving.generation.data.MoveData import MoveData
+
+
+def test_parse_starting_position_in_both_orientations() -> None:
+    # given
+    fen: str = BoardEnum.STARTING_POSITION.value
+
+    # when
+    result: Tuple[ndarray[int, dtype[int8]], int, MoveData] = FenLoader.parse_fen(fen, PiecesEnum.BLACK.value)
+    inverted_result: Tuple[ndarray[int, dtype[int8]], int, MoveData] = FenLoader.parse_fen(fen,
+                                                                                           PiecesEnum.WHITE.value)
+
+    # then
+    assert (result[0] == BoardInitializer.init_starting_board(PiecesEnum.BLACK.value, PiecesEnum.WHITE.value)).all()
+    assert (inverted_result[0] == BoardInitializer.init_starting_board(PiecesEnum.WHITE.value,
+                                                                        PiecesEnum.BLACK.value)).all()
+    assert result[1] == inverted_result[1] == PiecesEnum.WHITE.value
+    assert result[2] == MoveData(0, True, True, True, True, -1, -1, 0, 0)
+
+
+def test_parse_castling_en_passant_and_counters() -> None:
+    # given
+    fen: str = "r3k2r/8/8/3pP3/8/8/8/R3K1R1 w Qkq d6 0 9"
+
+    # when
+    result: MoveData = FenLoader.parse_fen(fen, PiecesEnum.BLACK.value)[2]
+    inverted_result: MoveData = FenLoader.parse_fen(fen, PiecesEnum.WHITE.value)[2]
+
+    # then
+    assert result == MoveData(0, False, True, True, True, 19, 27, 16, 0)
+    assert inverted_result == MoveData(0, True, True, False, True, 44, 36, 16, 0)
+
+
+def test_castling_right_without_rook_is_dropped() -> None:
+    # given
+    fen: str = "4k3/8/8/8/8/8/8/4K3 w KQkq - 0 1"
+
+    # when
+    result: MoveData = FenLoader.parse_fen(fen, PiecesEnum.BLACK.value)[2]
+
+    # then
+    assert not any((result.white_castle_king, result.white_castle_queen, result.black_castle_king,
+                    result.black_castle_queen))
+
+
+def test_parse_wrong_fen() -> None:
+    # given
+    fens: Tuple[str, ...] = ("8/8/8/8/8/8/8/8 w - - 0 1", "4k3/8/8/8/8/8/8/4K4 w - - 0 1",
+                             "4k3/8/8/8/8/8/8/4K3 x - - 0 1", "4k3/8/8/8/8/8/8/4K3 w - e4 0 1",
+                             "4k3/8/8/8/8/8/8/4K3 w X - 0 1", "4k3/8/8/8/8/8/8/4K3 w -")
+
+    # when
+    for fen in fens:
+        with pytest.raises(IllegalArgumentException):
+            FenLoader.parse_fen(fen, PiecesEnum.BLACK.value)
+
+    # then
+    assert FenLoader.parse_fen("4k3/8/8/8/8/8/8/4K3 b - -", PiecesEnum.BLACK.value)[1] == PiecesEnum.BLACK.value
@@ -0,0 +1,138 @@
+from game_window.board.BitBoard import BitBoard
+from game_window.board.BitBoardUtil import BitBoardUtil
+from game_window.board.fen.FenData import FenData
+from game_window.board.fen.FenMaker import FenMaker
+from game_window.board.GameBoard import GameBoard
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.enums.SpecialFlags import SpecialFlags
+from game_window.moving.generation.data.MoveData import MoveData
+from game_window.moving.generation.data.MoveUtil import MoveUtil
+from game_window.moving.generation.MoveGenerator import MoveGenerator
+from game_window.moving.MoveMaker import MoveMaker
+
+
+def is_board_in_sync(board: BitBoard) -> bool:
+    board_array = board.board_array()
+
+    for square in range(64):
+        piece: int = int(board_array[square])
+
+        if piece != 0 and not board.piece_bitboard(piece) & (1 << square):
+            return False
+    expected_occupancy: int = sum(1 << square for square in range(64) if board_array[square] != 0)
+
+    return board.occupancy() == expected_occupancy
+
+
+def test_starting_position_occupancies() -> None:
+    # given
+    board: BitBoard = BitBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    expected_white: int = 0xFFFF << 48
+    expected_black: int = 0xFFFF
+
+    # when
+    white_occupancy: int = board.color_occupancy(PiecesEnum.WHITE.value)
+    black_occupancy: int = board.color_occupancy(PiecesEnum.BLACK.value)
+
+    # then
+    assert white_occupancy == expected_white
+    assert black_occupancy == expected_black
+    assert BitBoardUtil.count_bits(board.occupancy()) == 32
+
+
+def test_add_and_delete_piece_updates_bitboards() -> None:
+    # given
+    board: BitBoard = BitBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    queen: int = PiecesEnum.WHITE.value | PiecesEnum.QUEEN.value
+
+    # when
+    board.delete_piece_from_board_square(59)
+    board.add_piece_to_the_board(queen, 35)
+
+    # then
+    assert board.piece_bitboard(queen) == 1 << 35
+    assert is_board_in_sync(board)
+
+
+def test_make_and_un_make_move_keeps_bitboards_in_sync() -> None:
+    # given
+    board: BitBoard = BitBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    occupancy: int = board.occupancy()
+    move: int = MoveUtil.encode_move(52, 36, PiecesEnum.PAWN.value, SpecialFlags.NONE.value)
+
+    # when
+    move_data: MoveData = MoveMaker.make_move(move, PiecesEnum.WHITE.value, board)
+    moved_in_sync: bool = is_board_in_sync(board)
+    MoveMaker.un_make_move(move, move_data, board)
+
+    # then
+    assert moved_in_sync
+    assert is_board_in_sync(board)
+    assert board.occupancy() == occupancy
+
+
+def test_same_legal_moves_as_game_board() -> None:
+    # given
+    bit_board: BitBoard = BitBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    game_board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+
+    # when
+    bit_board_moves_number: int = bit_board.legal_moves().size()
+    game_board_moves_number: int = game_board.legal_moves().size()
+
+    # then
+    assert bit_board_moves_number == game_board_moves_number
+
+
+def test_switch_sides_rebuilds_bitboards() -> None:
+    # given
+    board: BitBoard = BitBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    expected_white_king: int = 1 << 3
+
+    # when
+    board.switch_sides()
+
+    # then
+    assert board.piece_bitboard(PiecesEnum.WHITE.value | PiecesEnum.KING.value) == expected_white_king
+    assert is_board_in_sync(board)
+
+
+def test_load_fen_rebuilds_bitboards() -> None:
+    # given
+    bit_board: BitBoard = BitBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    game_board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    fen: str = "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1"
+
+    # when
+    bit_board.load_fen(fen, PiecesEnum.WHITE.value)
+    game_board.load_fen(fen, PiecesEnum.WHITE.value)
+
+    # then
+    assert is_board_in_sync(bit_board)
+    assert bit_board.zobrist_key() == game_board.zobrist_key()
+    assert bit_board.legal_moves().size() == game_board.legal_moves().size() == 14
+
+
+def test_make_and_un_make_null_move() -> None:
+    # given
+    bit_board: BitBoard = BitBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    game_board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    fen: str = "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3"
+    bit_board.load_fen(fen, PiecesEnum.BLACK.value)
+    game_board.load_fen(fen, PiecesEnum.BLACK.value)
+    key_before: int = game_board.zobrist_key()
+    fen_before: str = game_board.fen_string()
+
+    # when
+    bit_board_data: MoveData = bit_board.make_null_move()
+    game_board_data: MoveData = game_board.make_null_move()
+    null_move_state: tuple = (game_board.color_to_move(), game_board.en_passant_square(),
+                              game_board.fen_string().split()[1:4])
+    bit_board.un_make_null_move(bit_board_data)
+    game_board.un_make_null_move(game_board_data)
+
+    # then
+    assert null_move_state == (PiecesEnum.BLACK.value, -1, ["b", "KQkq", "-"])
+    assert bit_board.zobrist_key() == game_board.zobrist_key() == key_before
+    assert game_board.color_to_move() == PiecesEnum.WHITE.value
+    assert game_board.fen_string() == fen_before
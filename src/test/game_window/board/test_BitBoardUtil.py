@@ -0,0 +1,58 @@
+from typing import List
+
+import pytest
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from game_window.board.BitBoardUtil import BitBoardUtil
+from game_window.board.BoardInitializer import BoardInitializer
+from game_window.enums.PiecesEnum import PiecesEnum
+
+
+def test_square_mask_out_of_bounds() -> None:
+    # given
+    square: int = 64
+
+    # when
+    with pytest.raises(IllegalArgumentException):
+        BitBoardUtil.square_mask(square)
+
+    # then
+
+
+def test_get_squares_returns_ascending_indexes() -> None:
+    # given
+    bitboard: int = (1 << 63) | (1 << 7) | 1
+    expected: List[int] = [0, 7, 63]
+
+    # when
+    result: List[int] = BitBoardUtil.get_squares(bitboard)
+
+    # then
+    assert result == expected
+
+
+def test_least_and_most_significant_square() -> None:
+    # given
+    bitboard: int = (1 << 42) | (1 << 5)
+    expected: tuple[int, int] = (5, 42)
+
+    # when
+    result: tuple[int, int] = (BitBoardUtil.get_least_significant_square(bitboard),
+                               BitBoardUtil.get_most_significant_square(bitboard))
+
+    # then
+    assert result == expected
+
+
+def test_create_pieces_bitboards_starting_position() -> None:
+    # given
+    board_array = BoardInitializer.init_starting_board(PiecesEnum.BLACK.value, PiecesEnum.WHITE.value)
+    expected_white_pawns: int = 0xFF << 48
+    expected_black_king: int = 1 << 4
+
+    # when
+    bitboards: List[int] = BitBoardUtil.create_pieces_bitboards(board_array)
+
+    # then
+    assert bitboards[PiecesEnum.WHITE.value | PiecesEnum.PAWN.value] == expected_white_pawns
+    assert bitboards[PiecesEnum.BLACK.value | PiecesEnum.KING.value] == expected_black_king
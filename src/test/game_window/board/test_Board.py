@@ -1,3 +1,4 @@
+from typing import List
 from typing import Tuple
 
 import pytest
@@ -8,7 +9,10 @@
 from game_window.board.fen.FenMaker import FenMaker
 from game_window.board.GameBoard import GameBoard
 from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.enums.SpecialFlags import SpecialFlags
+from game_window.moving.generation.data.MoveUtil import MoveUtil
 from game_window.moving.generation.MoveGenerator import MoveGenerator
+from game_window.moving.MoveMaker import MoveMaker
 
 
 def test_should_this_piece_move_white_color_piece_should_move() -> None:
@@ -154,3 +158,78 @@ def test_delete_piece_from_board_values_not_with_bonds() -> None:
         result = board.delete_piece_from_board_square(square)
 
     # then
+
+
+def test_load_fen_sets_position_for_engine_color() -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    fen: str = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R b KQkq - 0 1"
+
+    # when
+    board.load_fen(fen, PiecesEnum.BLACK.value)
+
+    # then
+    assert board.engine_color() == board.color_to_move() == PiecesEnum.BLACK.value
+    assert board.board_array()[60] == PiecesEnum.WHITE.value | PiecesEnum.KING.value
+    assert board.can_king_castle_queen_side(PiecesEnum.BLACK.value)
+    assert board.legal_moves().size() == 43
+
+
+def test_load_fen_on_inverted_board() -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    fen: str = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+    # when
+    board.load_fen(fen, PiecesEnum.WHITE.value)
+
+    # then
+    assert board.player_color() == PiecesEnum.BLACK.value
+    assert board.board_array()[3] == PiecesEnum.WHITE.value | PiecesEnum.KING.value
+    assert board.legal_moves().size() == 48
+
+
+def test_fen_string_is_cached_until_board_changes() -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    first_fen: str = board.fen_string()
+
+    # when
+    second_fen: str = board.fen_string()
+    board.add_piece_to_the_board(PiecesEnum.WHITE.value | PiecesEnum.QUEEN.value, 36)
+    changed_fen: str = board.fen_string()
+
+    # then
+    assert first_fen is second_fen
+    assert changed_fen.split()[0] == "rnbqkbnr/pppppppp/8/8/4Q3/8/PPPPPPPP/RNBQKBNR"
+
+
+def test_fen_string_follows_en_passant_capture() -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    board.load_fen("rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3", PiecesEnum.BLACK.value)
+    board.fen_string()
+    move: int = MoveUtil.encode_move(28, 21, PiecesEnum.PAWN.value, SpecialFlags.EN_PASSANT.value)
+
+    # when
+    MoveMaker.make_move(move, PiecesEnum.WHITE.value, board)
+    fen: List[str] = board.fen_string().split()
+
+    # then
+    assert fen[0] == "rnbqkbnr/ppp1p1pp/5P2/3p4/8/8/PPPP1PPP/RNBQKBNR"
+    assert fen[3] == "-"
+
+
+def test_piece_counts_follow_capture() -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    board.load_fen("4k3/8/8/3q4/4N3/8/8/4K3 w - - 0 1", PiecesEnum.BLACK.value)
+    move: int = MoveUtil.encode_move(36, 27, PiecesEnum.KNIGHT.value, SpecialFlags.NONE.value)
+
+    # when
+    MoveMaker.make_move(move, PiecesEnum.WHITE.value, board)
+
+    # then
+    assert board.piece_count(PiecesEnum.BLACK.value | PiecesEnum.QUEEN.value) == 0
+    assert board.piece_count(PiecesEnum.WHITE.value | PiecesEnum.KNIGHT.value) == 1
+    assert board.piece_count(PiecesEnum.NONE.value) == 61
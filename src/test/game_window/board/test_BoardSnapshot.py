@@ -0,0 +1,32 @@
+import pickle
+
+import pytest
+
+from game_window.board.BoardSnapshot import BoardSnapshot
+from game_window.board.fen.FenData import FenData
+from game_window.board.fen.FenMaker import FenMaker
+from game_window.board.GameBoard import GameBoard
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.moving.generation.MoveGenerator import MoveGenerator
+
+
+@pytest.mark.parametrize("engine_color", [PiecesEnum.BLACK.value, PiecesEnum.WHITE.value])
+def test_restore_snapshot_on_another_board(engine_color: int) -> None:
+    # given
+    fen: str = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R b KQkq - 0 1"
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    board.load_fen(fen, engine_color)
+    restored: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+
+    # when
+    snapshot: BoardSnapshot = pickle.loads(pickle.dumps(BoardSnapshot.create(board)))
+    snapshot.restore(restored)
+
+    # then
+    assert restored.zobrist_key() == board.zobrist_key()
+    assert restored.pawn_key() == board.pawn_key()
+    assert restored.material_score() == board.material_score()
+    assert restored.color_to_move() == board.color_to_move()
+    assert restored.engine_color() == engine_color
+    assert restored.get_special_move_data() == board.get_special_move_data()
+    assert restored.legal_moves().size() == board.legal_moves().size()
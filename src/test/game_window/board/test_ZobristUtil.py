@@ -0,0 +1,187 @@
+from typing import List
+from typing import Type
+
+import pytest
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from game_window.board.BitBoard import BitBoard
+from game_window.board.Board import Board
+from game_window.board.fen.FenData import FenData
+from game_window.board.fen.FenMaker import FenMaker
+from game_window.board.GameBoard import GameBoard
+from game_window.board.ZobristUtil import ZobristUtil
+from game_window.ColorManager import ColorManager
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.enums.SpecialFlags import SpecialFlags
+from game_window.moving.generation.data.MoveData import MoveData
+from game_window.moving.generation.data.MoveList import MoveList
+from game_window.moving.generation.data.MoveUtil import MoveUtil
+from game_window.moving.generation.MoveGenerator import MoveGenerator
+from game_window.moving.MoveMaker import MoveMaker
+
+
+def walk_moves_and_compare_keys(board: GameBoard, color: int, depth: int) -> bool:
+    if depth == 0:
+        return True
+    moves: MoveList = MoveGenerator().generate_legal_moves(color, board)
+
+    for index in range(moves.size()):
+        move: int = moves[index]
+        key_before: int = board.zobrist_key()
+        move_data: MoveData = MoveMaker.make_move(move, color, board)
+
+        if board.zobrist_key() != ZobristUtil.calculate_zobrist_key(board):
+            return False
+        if board.pawn_key() != ZobristUtil.calculate_pawns_key(board.board_array()):
+            return False
+        if not walk_moves_and_compare_keys(board, ColorManager.get_opposite_piece_color(color), depth - 1):
+            return False
+        MoveMaker.un_make_move(move, move_data, board)
+
+        if board.zobrist_key() != key_before:
+            return False
+    return True
+
+
+def test_starting_position_key_is_equal_to_calculated_one() -> None:
+    # given
+    game_board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    bit_board: BitBoard = BitBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+
+    # when
+    expected: int = ZobristUtil.calculate_zobrist_key(game_board)
+
+    # then
+    assert game_board.zobrist_key() == expected
+    assert bit_board.zobrist_key() == expected
+    assert 0 < expected < 1 << 64
+
+
+def test_make_move_changes_key_and_color_to_move() -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    key_before: int = board.zobrist_key()
+    move: int = MoveUtil.encode_move(52, 36, PiecesEnum.PAWN.value, SpecialFlags.NONE.value)
+
+    # when
+    move_data: MoveData = MoveMaker.make_move(move, PiecesEnum.WHITE.value, board)
+    key_after_move: int = board.zobrist_key()
+    color_after_move: int = board.color_to_move()
+    MoveMaker.un_make_move(move, move_data, board)
+
+    # then
+    assert key_after_move != key_before
+    assert color_after_move == PiecesEnum.BLACK.value
+    assert board.color_to_move() == PiecesEnum.WHITE.value
+    assert board.zobrist_key() == key_before
+
+
+def test_incremental_key_is_equal_to_calculated_one_on_every_move() -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+
+    # when
+    result: bool = walk_moves_and_compare_keys(board, PiecesEnum.WHITE.value, 3)
+
+    # then
+    assert result
+
+
+def test_incremental_key_on_castling_en_passant_and_promotion() -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+
+    for square in (8, 11, 27, 48, 52, 57, 58, 59, 61, 62):
+        board.delete_piece_from_board_square(square)
+    board.add_piece_to_the_board(PiecesEnum.BLACK.value | PiecesEnum.PAWN.value, 27)
+    board.add_piece_to_the_board(PiecesEnum.WHITE.value | PiecesEnum.PAWN.value, 28)
+    board.add_piece_to_the_board(PiecesEnum.WHITE.value | PiecesEnum.PAWN.value, 8)
+    board.set_en_passant_square(19)
+    board.set_en_passant_piece_square(27)
+    moves: List[int] = [
+        MoveUtil.encode_move(60, 58, PiecesEnum.KING.value, SpecialFlags.CASTLING.value),
+        MoveUtil.encode_move(60, 62, PiecesEnum.KING.value, SpecialFlags.CASTLING.value),
+        MoveUtil.encode_move(28, 19, PiecesEnum.PAWN.value, SpecialFlags.EN_PASSANT.value),
+        MoveUtil.encode_move(8, 1, PiecesEnum.PAWN.value, SpecialFlags.PROMOTE_TO_KNIGHT.value)
+    ]
+    key_before: int = ZobristUtil.calculate_zobrist_key(board)
+
+    for move in moves:
+        # when
+        move_data: MoveData = MoveMaker.make_move(move, PiecesEnum.WHITE.value, board)
+        key_after_move: int = board.zobrist_key()
+        calculated_key: int = ZobristUtil.calculate_zobrist_key(board)
+        MoveMaker.un_make_move(move, move_data, board)
+
+        # then
+        assert key_after_move == calculated_key
+        assert board.zobrist_key() == key_before
+
+
+def test_transposition_has_the_same_key() -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    key_before: int = board.zobrist_key()
+    moves: List[int] = [
+        MoveUtil.encode_move(62, 45, PiecesEnum.KNIGHT.value, SpecialFlags.NONE.value),
+        MoveUtil.encode_move(6, 21, PiecesEnum.KNIGHT.value, SpecialFlags.NONE.value),
+        MoveUtil.encode_move(45, 62, PiecesEnum.KNIGHT.value, SpecialFlags.NONE.value),
+        MoveUtil.encode_move(21, 6, PiecesEnum.KNIGHT.value, SpecialFlags.NONE.value)
+    ]
+    color: int = PiecesEnum.WHITE.value
+
+    # when
+    for move in moves:
+        MoveMaker.make_move(move, color, board)
+        color = ColorManager.get_opposite_piece_color(color)
+
+    # then
+    assert board.zobrist_key() == key_before
+
+
+def test_switch_sides_recalculates_key() -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    move: int = MoveUtil.encode_move(52, 36, PiecesEnum.PAWN.value, SpecialFlags.NONE.value)
+    MoveMaker.make_move(move, PiecesEnum.WHITE.value, board)
+
+    # when
+    board.switch_sides()
+
+    # then
+    assert board.zobrist_key() == ZobristUtil.calculate_zobrist_key(board)
+
+
+@pytest.mark.parametrize("board_class", [GameBoard, BitBoard])
+def test_pawn_key_changes_only_with_pawns(board_class: Type[Board]) -> None:
+    # given
+    board: Board = board_class(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    pawn_key_before: int = board.pawn_key()
+    knight_move: int = MoveUtil.encode_move(62, 45, PiecesEnum.KNIGHT.value, SpecialFlags.NONE.value)
+    pawn_move: int = MoveUtil.encode_move(12, 28, PiecesEnum.PAWN.value, SpecialFlags.NONE.value)
+
+    # when
+    MoveMaker.make_move(knight_move, PiecesEnum.WHITE.value, board)
+    key_after_knight_move: int = board.pawn_key()
+    move_data: MoveData = MoveMaker.make_move(pawn_move, PiecesEnum.BLACK.value, board)
+    key_after_pawn_move: int = board.pawn_key()
+    MoveMaker.un_make_move(pawn_move, move_data, board)
+
+    # then
+    assert pawn_key_before == ZobristUtil.calculate_pawns_key(board.board_array())
+    assert key_after_knight_move == pawn_key_before
+    assert key_after_pawn_move != pawn_key_before
+    assert board.pawn_key() == pawn_key_before
+
+
+def test_get_en_passant_key_of_wrong_square() -> None:
+    # given
+    square: int = 64
+
+    # when
+    with pytest.raises(IllegalArgumentException):
+        ZobristUtil.get_en_passant_key(square)
+
+    # then
+    assert ZobristUtil.get_en_passant_key(-1) == 0
+    assert ZobristUtil.get_en_passant_key(19) == ZobristUtil.get_en_passant_key(43)
@@ -0,0 +1,92 @@
+from random import Random
+from typing import List
+
+import pytest
+from numpy import array
+from numpy import dtype
+from numpy import float64
+from numpy import int8
+from numpy import ndarray
+from numpy import zeros
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from game_window.board.fen.FenData import FenData
+from game_window.board.fen.FenMaker import FenMaker
+from game_window.board.GameBoard import GameBoard
+from game_window.engine.static_eval.BatchStaticEvaluator import BatchStaticEvaluator
+from game_window.engine.static_eval.StaticEvaluator import StaticEvaluator
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.moving.generation.data.MoveList import MoveList
+from game_window.moving.generation.MoveGenerator import MoveGenerator
+from game_window.moving.MoveMaker import MoveMaker
+
+
+@pytest.mark.parametrize("engine_color", [PiecesEnum.BLACK.value, PiecesEnum.WHITE.value])
+def test_evaluate_positions_is_equal_to_static_evaluator(engine_color: int) -> None:
+    # given
+    generator: MoveGenerator = MoveGenerator()
+    evaluator: StaticEvaluator = StaticEvaluator()
+    random: Random = Random(engine_color)
+    boards_arrays: List[ndarray[int, dtype[int8]]] = []
+    expected: List[List[float]] = [[], []]
+
+    for _ in range(4):
+        board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), generator)
+        board.load_fen("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1", engine_color)
+
+        for _ in range(60):
+            moves: MoveList = generator.generate_legal_moves(board.color_to_move(), board)
+
+            if moves.size() == 0:
+                break
+            MoveMaker.make_move(moves[random.randrange(moves.size())], board.color_to_move(), board)
+            boards_arrays.append(board.board_array().copy())
+            expected[0].append(evaluator.evaluate_static_position(board, PiecesEnum.WHITE.value))
+            expected[1].append(evaluator.evaluate_static_position(board, PiecesEnum.BLACK.value))
+    stack: ndarray[int, dtype[int8]] = array(boards_arrays, dtype=int8)
+
+    # when
+    white_evals: ndarray[float, dtype[float64]] = BatchStaticEvaluator.evaluate_positions(stack, engine_color,
+                                                                                          PiecesEnum.WHITE.value)
+    black_evals: ndarray[float, dtype[float64]] = BatchStaticEvaluator.evaluate_positions(stack, engine_color,
+                                                                                          PiecesEnum.BLACK.value)
+
+    # then
+    assert white_evals.tolist() == expected[0]
+    assert black_evals.tolist() == expected[1]
+
+
+def test_evaluate_positions_of_starting_position() -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    stack: ndarray[int, dtype[int8]] = array([board.board_array()] * 3, dtype=int8)
+
+    # when
+    result: ndarray[float, dtype[float64]] = BatchStaticEvaluator.evaluate_positions(stack, PiecesEnum.BLACK.value,
+                                                                                     PiecesEnum.WHITE.value)
+
+    # then
+    assert result.shape == (3,)
+    assert result.tolist() == [StaticEvaluator().evaluate_static_position(board, PiecesEnum.WHITE.value)] * 3
+
+
+def test_evaluate_positions_with_wrong_shape() -> None:
+    # given
+    stack: ndarray[int, dtype[int8]] = zeros((2, 32), dtype=int8)
+
+    # when
+    with pytest.raises(IllegalArgumentException):
+        BatchStaticEvaluator.evaluate_positions(stack, PiecesEnum.BLACK.value, PiecesEnum.WHITE.value)
+
+    # then
+
+
+def test_evaluate_positions_with_wrong_engine_color() -> None:
+    # given
+    stack: ndarray[int, dtype[int8]] = zeros((2, 64), dtype=int8)
+
+    # when
+    with pytest.raises(IllegalArgumentException):
+        BatchStaticEvaluator.evaluate_positions(stack, PiecesEnum.NONE.value, PiecesEnum.WHITE.value)
+
+    # then
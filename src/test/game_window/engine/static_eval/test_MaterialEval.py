@@ -0,0 +1,115 @@
+from typing import Dict
+from typing import Type
+
+import pytest
+
+from game_window.board.BitBoard import BitBoard
+from game_window.board.Board import Board
+from game_window.board.fen.FenData import FenData
+from game_window.board.fen.FenMaker import FenMaker
+from game_window.board.GameBoard import GameBoard
+from game_window.ColorManager import ColorManager
+from game_window.engine.static_eval.MaterialEval import MaterialEval
+from game_window.engine.static_eval.StaticEvalUtil import StaticEvalUtil
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.enums.SquaresEval import SquaresEval
+from game_window.moving.generation.data.MoveData import MoveData
+from game_window.moving.generation.data.MoveList import MoveList
+from game_window.moving.generation.MoveGenerator import MoveGenerator
+from game_window.moving.MoveMaker import MoveMaker
+
+
+def get_square_points(piece_value: int, pieces_color: int, square: int, board: Board) -> int:
+    side: str = "ENGINE" if pieces_color == board.engine_color() else "PLAYER"
+    names: Dict[int, str] = {
+        PiecesEnum.KING.value: f"{side}_KING", PiecesEnum.PAWN.value: f"{side}_PAWN",
+        PiecesEnum.KNIGHT.value: "KNIGHT", PiecesEnum.BISHOP.value: f"{side}_BISHOP",
+        PiecesEnum.ROOK.value: f"{side}_ROOK", PiecesEnum.QUEEN.value: "QUEEN"
+    }
+    return SquaresEval[names[piece_value]].value[square]
+
+
+def evaluate_pieces_by_loop(board: Board, favor_color: int) -> float:
+    evaluation: float = 0
+
+    for square, piece in enumerate(board.board_array()):
+        if piece == 0:
+            continue
+        pieces_color: int = ColorManager.get_piece_color(piece)
+        piece_value: int = piece - pieces_color
+        points: float = StaticEvalUtil.get_piece_point_value(piece_value)
+        points += get_square_points(piece_value, pieces_color, square, board)
+
+        evaluation += StaticEvalUtil.return_proper_evaluation_sign_value(points, favor_color, pieces_color)
+    return evaluation
+
+
+def walk_moves_and_compare_scores(board: Board, generator: MoveGenerator, depth: int) -> bool:
+    if depth == 0:
+        return True
+    color: int = board.color_to_move()
+    moves: MoveList = generator.generate_legal_moves(color, board)
+
+    for index in range(moves.size()):
+        move: int = moves[index]
+        score_before: int = board.material_score()
+        move_data: MoveData = MoveMaker.make_move(move, color, board)
+
+        expected: int = MaterialEval.calculate_material_score(board.board_array(), board.piece_square_table(),
+                                                              board.engine_color())
+
+        if board.material_score() != expected:
+            return False
+        if not walk_moves_and_compare_scores(board, generator, depth - 1):
+            return False
+        MoveMaker.un_make_move(move, move_data, board)
+
+        if board.material_score() != score_before:
+            return False
+    return True
+
+
+@pytest.mark.parametrize("board_class", [GameBoard, BitBoard])
+@pytest.mark.parametrize("engine_color", [PiecesEnum.BLACK.value, PiecesEnum.WHITE.value])
+def test_running_score_is_equal_to_calculated_one(board_class: Type[Board], engine_color: int) -> None:
+    # given
+    generator: MoveGenerator = MoveGenerator()
+    board: Board = board_class(FenMaker(FenData(PiecesEnum.WHITE.value)), generator)
+    board.load_fen("r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1", engine_color)
+
+    # when
+    result: bool = walk_moves_and_compare_scores(board, generator, 2)
+
+    # then
+    assert result
+
+
+@pytest.mark.parametrize("engine_color", [PiecesEnum.BLACK.value, PiecesEnum.WHITE.value])
+def test_evaluate_material_is_equal_to_board_loop(engine_color: int) -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    board.load_fen("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1", engine_color)
+
+    # when
+    white_eval: int = MaterialEval.evaluate_material(board, PiecesEnum.WHITE.value)
+    black_eval: int = MaterialEval.evaluate_material(board, PiecesEnum.BLACK.value)
+
+    # then
+    assert white_eval == evaluate_pieces_by_loop(board, PiecesEnum.WHITE.value)
+    assert black_eval == evaluate_pieces_by_loop(board, PiecesEnum.BLACK.value)
+    assert white_eval == -black_eval
+
+
+def test_switch_sides_recalculates_score() -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+
+    # when
+    board.switch_sides()
+
+    # then
+    assert board.material_score() == MaterialEval.calculate_material_score(board.board_array(),
+                                                                           board.piece_square_table(),
+                                                                           board.engine_color())
+    assert MaterialEval.evaluate_material(board, PiecesEnum.WHITE.value) == \
+        evaluate_pieces_by_loop(board, PiecesEnum.WHITE.value)
@@ -0,0 +1,75 @@
+from random import Random
+
+import pytest
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from game_window.board.fen.FenData import FenData
+from game_window.board.fen.FenMaker import FenMaker
+from game_window.board.GameBoard import GameBoard
+from game_window.engine.static_eval.PawnEval import PawnEval
+from game_window.engine.static_eval.PawnHashTable import NO_ENTRY
+from game_window.engine.static_eval.PawnHashTable import PawnHashTable
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.moving.generation.data.MoveList import MoveList
+from game_window.moving.generation.MoveGenerator import MoveGenerator
+from game_window.moving.MoveMaker import MoveMaker
+
+
+def test_store_and_probe_entry() -> None:
+    # given
+    table: PawnHashTable = PawnHashTable(1000)
+    key: int = 0xDEAD_BEEF_0000_0001
+
+    # when
+    missed_entry: int = table.probe(key)
+    table.store(key, 12, 7)
+    entry: int = table.probe(key)
+
+    # then
+    assert table.size() == 512
+    assert missed_entry == NO_ENTRY
+    assert table.get_chains(entry, PiecesEnum.WHITE.value) == 12
+    assert table.get_chains(entry, PiecesEnum.BLACK.value) == 7
+    assert table.probe(key + 512) == NO_ENTRY
+    assert (table.probes(), table.hits(), table.hit_rate()) == (3, 1, 1 / 3)
+
+
+def test_clear_removes_entries_and_statistics() -> None:
+    # given
+    table: PawnHashTable = PawnHashTable(16)
+    table.store(0, 0, 0)
+    table.probe(0)
+
+    # when
+    table.clear()
+
+    # then
+    assert table.hit_rate() == 0.0
+    assert table.probe(0) == NO_ENTRY
+    with pytest.raises(IllegalArgumentException):
+        PawnHashTable(0)
+
+
+@pytest.mark.parametrize("engine_color", [PiecesEnum.BLACK.value, PiecesEnum.WHITE.value])
+def test_cached_pawn_chains_are_equal_to_calculated_ones(engine_color: int) -> None:
+    # given
+    generator: MoveGenerator = MoveGenerator()
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), generator)
+    board.load_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", engine_color)
+    table: PawnHashTable = PawnHashTable(64)
+    random: Random = Random(engine_color)
+
+    for _ in range(80):
+        moves: MoveList = generator.generate_legal_moves(board.color_to_move(), board)
+
+        if moves.size() == 0:
+            break
+        MoveMaker.make_move(moves[random.randrange(moves.size())], board.color_to_move(), board)
+
+        for favor_color in (PiecesEnum.WHITE.value, PiecesEnum.BLACK.value):
+            # when
+            result: float = PawnEval.evaluate_pawn_chains(board, favor_color, table)
+
+            # then
+            assert result == PawnEval.evaluate_pawn_chains(board, favor_color)
+    assert table.hits() > 0
@@ -0,0 +1,60 @@
+import pytest
+from numpy import dtype
+from numpy import int16
+from numpy import ndarray
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from game_window.board.fen.FenData import FenData
+from game_window.board.fen.FenMaker import FenMaker
+from game_window.board.GameBoard import GameBoard
+from game_window.engine.static_eval.MaterialEval import PIECES_VALUES_ARRAY
+from game_window.engine.static_eval.PieceSquareTables import PieceSquareTables
+from game_window.engine.static_eval.StaticEvalUtil import StaticEvalUtil
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.enums.SquaresEval import SquaresEval
+from game_window.moving.generation.MoveGenerator import MoveGenerator
+
+
+def test_create_piece_square_table_depends_on_engine_color() -> None:
+    # given
+    white: int = PiecesEnum.WHITE.value
+    black: int = PiecesEnum.BLACK.value
+
+    # when
+    result: ndarray[int, dtype[int16]] = PieceSquareTables.create_piece_square_table(black)
+    inverted: ndarray[int, dtype[int16]] = PieceSquareTables.create_piece_square_table(white)
+
+    # then
+    assert result.dtype == int16
+    assert result.shape == (black + 1, PiecesEnum.QUEEN.value + 1, 64)
+    assert result[black, PiecesEnum.PAWN.value].tolist() == SquaresEval.ENGINE_PAWN.value
+    assert result[white, PiecesEnum.ROOK.value].tolist() == SquaresEval.PLAYER_ROOK.value
+    assert inverted[white, PiecesEnum.KING.value].tolist() == SquaresEval.ENGINE_KING.value
+    assert inverted[black, PiecesEnum.BISHOP.value].tolist() == SquaresEval.PLAYER_BISHOP.value
+    assert not result[PiecesEnum.NONE.value].any()
+    with pytest.raises(IllegalArgumentException):
+        PieceSquareTables.create_piece_square_table(PiecesEnum.KING.value)
+
+
+@pytest.mark.parametrize("engine_color", [PiecesEnum.BLACK.value, PiecesEnum.WHITE.value])
+def test_sum_piece_square_points_is_equal_to_loop(engine_color: int) -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    board.load_fen("rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8", engine_color)
+    expected: int = 0
+
+    for square, piece in enumerate(board.board_array()):
+        if piece == PiecesEnum.NONE.value:
+            continue
+        color: int = int(piece) & (PiecesEnum.WHITE.value | PiecesEnum.BLACK.value)
+        points: int = StaticEvalUtil.get_piece_point_value(piece - color)
+        points += StaticEvalUtil.get_pieces_square_points(piece - color, color, square, board)
+        expected += points if color == engine_color else -points
+
+    # when
+    result: int = PieceSquareTables.sum_piece_square_points(board.board_array(), board.piece_square_table(),
+                                                            PIECES_VALUES_ARRAY, engine_color)
+
+    # then
+    assert result == expected
+    assert result == board.material_score()
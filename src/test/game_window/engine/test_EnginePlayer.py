@@ -0,0 +1,154 @@
+from typing import List
+
+import pytest
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from game_window.board.fen.FenData import FenData
+from game_window.board.fen.FenMaker import FenMaker
+from game_window.board.GameBoard import GameBoard
+from game_window.ColorManager import ColorManager
+from game_window.engine.EnginePlayer import EnginePlayer
+from game_window.engine.Evaluator import Evaluator
+from game_window.engine.TranspositionTable import TranspositionTable
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.enums.SpecialFlags import SpecialFlags
+from game_window.moving.generation.data.MoveList import MoveList
+from game_window.moving.generation.data.MoveUtil import MoveUtil
+from game_window.moving.generation.MoveGenerator import MoveGenerator
+from game_window.moving.MoveMaker import MoveMaker
+
+
+def create_engine_board() -> GameBoard:
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    board.switch_sides()
+
+    return board
+
+
+def test_create_engine_with_wrong_limits() -> None:
+    # given
+    max_depth: int = 0
+
+    # when
+    with pytest.raises(IllegalArgumentException):
+        EnginePlayer(MoveGenerator(), Evaluator(), max_depth=max_depth)
+
+    # then
+    with pytest.raises(IllegalArgumentException):
+        EnginePlayer(MoveGenerator(), Evaluator(), time_limit=0)
+
+
+def test_iterative_deepening_completes_max_depth() -> None:
+    # given
+    board: GameBoard = create_engine_board()
+    engine: EnginePlayer = EnginePlayer(MoveGenerator(), Evaluator(), TranspositionTable(1), max_depth=2)
+    legal_moves: MoveList = MoveGenerator().generate_legal_moves(board.engine_color(), board)
+
+    # when
+    result: int = engine.get_computer_move(board)
+
+    # then
+    assert result in legal_moves
+    assert engine.get_completed_depth() == 2
+
+
+def test_search_without_verbose_prints_nothing(capsys: pytest.CaptureFixture[str]) -> None:
+    # given
+    board: GameBoard = create_engine_board()
+    engine: EnginePlayer = EnginePlayer(MoveGenerator(), Evaluator(), TranspositionTable(1), max_depth=2,
+                                        verbose=False)
+
+    # when
+    engine.get_computer_move(board)
+
+    # then
+    assert capsys.readouterr().out == ""
+
+
+def test_search_respects_node_limit() -> None:
+    # given
+    board: GameBoard = create_engine_board()
+    node_limit: int = 60
+    engine: EnginePlayer = EnginePlayer(MoveGenerator(), Evaluator(), TranspositionTable(1), max_depth=6,
+                                        node_limit=node_limit)
+    legal_moves: MoveList = MoveGenerator().generate_legal_moves(board.engine_color(), board)
+    key_before: int = board.zobrist_key()
+
+    # when
+    result: int = engine.get_computer_move(board)
+
+    # then
+    assert result in legal_moves
+    assert engine.get_searched_nodes() + engine.get_quiescence_nodes() == node_limit
+    assert engine.get_completed_depth() < 6
+    assert board.zobrist_key() == key_before
+
+
+def test_quiescence_search_sees_recapture_behind_horizon() -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+
+    for square in (11, 51, 52):
+        board.delete_piece_from_board_square(square)
+    board.add_piece_to_the_board(PiecesEnum.WHITE.value | PiecesEnum.PAWN.value, 27)
+    board.add_piece_to_the_board(PiecesEnum.WHITE.value | PiecesEnum.PAWN.value, 36)
+    board.set_opposite_move_color()
+    queen_takes_pawn: int = MoveUtil.encode_move(3, 27, PiecesEnum.QUEEN.value, SpecialFlags.NONE.value)
+    horizon_engine: EnginePlayer = EnginePlayer(MoveGenerator(), Evaluator(), TranspositionTable(1), max_depth=1,
+                                                quiescence_depth=0)
+    engine: EnginePlayer = EnginePlayer(MoveGenerator(), Evaluator(), TranspositionTable(1), max_depth=1)
+
+    # when
+    horizon_result: int = horizon_engine.get_computer_move(board)
+    result: int = engine.get_computer_move(board)
+
+    # then
+    assert horizon_result == queen_takes_pawn
+    assert result != queen_takes_pawn
+    assert engine.get_quiescence_nodes() > 0
+
+
+def test_search_reports_legal_principal_variation() -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    board.load_fen("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 2 2", PiecesEnum.BLACK.value)
+    engine: EnginePlayer = EnginePlayer(MoveGenerator(), Evaluator(), TranspositionTable(1), max_depth=3)
+    color: int = board.engine_color()
+
+    # when
+    result: int = engine.get_computer_move(board)
+    principal_variation: List[int] = engine.get_principal_variation()
+
+    # then
+    assert principal_variation[0] == result
+    assert len(principal_variation) <= engine.get_completed_depth()
+
+    for move in principal_variation:
+        assert move in MoveGenerator().generate_legal_moves(color, board)
+        MoveMaker.make_move(move, color, board)
+        color = ColorManager.get_opposite_piece_color(color)
+
+
+def test_selective_search_prunes_and_reduces_nodes() -> None:
+    # given
+    fen: str = "4k3/ppp5/2n5/8/8/2N5/PPP5/4K3 w - - 0 1"
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    board.load_fen(fen, PiecesEnum.WHITE.value)
+    engine: EnginePlayer = EnginePlayer(MoveGenerator(), Evaluator(), TranspositionTable(1), max_depth=4)
+    full_width_engine: EnginePlayer = EnginePlayer(MoveGenerator(), Evaluator(), TranspositionTable(1), max_depth=4,
+                                                   null_move_pruning=False, late_move_reductions=False)
+    key_before: int = board.zobrist_key()
+    fen_before: str = board.fen_string()
+
+    # when
+    engine.get_computer_move(board)
+    full_width_engine.get_computer_move(board)
+
+    # then
+    assert engine.get_null_move_cutoffs() > 0
+    assert engine.get_reduced_moves() > 0
+    assert full_width_engine.get_null_move_cutoffs() == full_width_engine.get_reduced_moves() == 0
+    assert engine.get_searched_nodes() + engine.get_quiescence_nodes() < \
+        full_width_engine.get_searched_nodes() + full_width_engine.get_quiescence_nodes()
+    assert board.zobrist_key() == key_before
+    assert board.fen_string() == fen_before
@@ -0,0 +1,81 @@
+import pytest
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from game_window.board.fen.FenData import FenData
+from game_window.board.fen.FenMaker import FenMaker
+from game_window.board.GameBoard import GameBoard
+from game_window.engine.EvalCache import EvalCache
+from game_window.engine.EvalCache import NO_ENTRY
+from game_window.engine.Evaluator import Evaluator
+from game_window.engine.static_eval.StaticEvaluator import StaticEvaluator
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.moving.generation.MoveGenerator import MoveGenerator
+
+
+def test_store_and_probe_entry_of_each_color() -> None:
+    # given
+    cache: EvalCache = EvalCache(100)
+    key: int = 0x1234_5678_9ABC_DEF0
+
+    # when
+    missed_entry: int = cache.probe(key, PiecesEnum.WHITE.value)
+    cache.store(key, PiecesEnum.WHITE.value, 1.5)
+    cache.store(key, PiecesEnum.BLACK.value, -2.5)
+    white_entry: int = cache.probe(key, PiecesEnum.WHITE.value)
+    black_entry: int = cache.probe(key, PiecesEnum.BLACK.value)
+
+    # then
+    assert cache.size() == 64
+    assert missed_entry == NO_ENTRY
+    assert cache.get_score(white_entry) == 1.5
+    assert cache.get_score(black_entry) == -2.5
+    assert cache.probe(key + 64, PiecesEnum.WHITE.value) == NO_ENTRY
+    assert (cache.hits(), cache.misses()) == (2, 2)
+
+
+def test_clear_removes_entries_and_counters() -> None:
+    # given
+    cache: EvalCache = EvalCache(8)
+    cache.store(7, PiecesEnum.WHITE.value, 3.0)
+
+    # when
+    cache.clear()
+
+    # then
+    assert (cache.hits(), cache.misses()) == (0, 0)
+    assert cache.probe(7, PiecesEnum.WHITE.value) == NO_ENTRY
+    with pytest.raises(IllegalArgumentException):
+        EvalCache(-1)
+
+
+def test_evaluator_reuses_cached_evaluation() -> None:
+    # given
+    evaluator: Evaluator = Evaluator(EvalCache(1024))
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    board.load_fen("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1", PiecesEnum.BLACK.value)
+    expected: float = StaticEvaluator().evaluate_static_position(board, PiecesEnum.WHITE.value)
+
+    # when
+    first_eval: float = evaluator.evaluate_position(board, PiecesEnum.WHITE.value)
+    second_eval: float = evaluator.evaluate_position(board, PiecesEnum.WHITE.value)
+
+    # then
+    assert first_eval == second_eval == expected
+    assert (evaluator.eval_cache().hits(), evaluator.eval_cache().misses()) == (1, 1)
+
+
+def test_evaluator_separates_board_orientations() -> None:
+    # given
+    evaluator: Evaluator = Evaluator(EvalCache(1024))
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    inverted_board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    board.load_fen("4k3/8/8/8/8/8/8/3QK3 w - - 0 1", PiecesEnum.BLACK.value)
+    inverted_board.load_fen("3kq3/8/8/8/8/8/8/4K3 w - - 0 1", PiecesEnum.WHITE.value)
+
+    # when
+    evaluator.evaluate_position(board, PiecesEnum.WHITE.value)
+    result: float = evaluator.evaluate_position(inverted_board, PiecesEnum.WHITE.value)
+
+    # then
+    assert result == StaticEvaluator().evaluate_static_position(inverted_board, PiecesEnum.WHITE.value)
+    assert evaluator.eval_cache().hits() == 0
@@ -0,0 +1,73 @@
+from typing import Tuple
+
+import pytest
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from game_window.engine.MoveHistory import MoveHistory
+from game_window.enums.MoveEnum import MoveEnum
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.enums.SpecialFlags import SpecialFlags
+from game_window.moving.generation.data.MoveUtil import MoveUtil
+from game_window.moving.generation.data.MoveUtil import NO_MOVE
+
+
+def test_create_move_history_with_wrong_size() -> None:
+    # given
+    max_ply: int = 0
+
+    # when
+    with pytest.raises(IllegalArgumentException):
+        MoveHistory(max_ply)
+
+    # then
+
+
+def test_store_cutoff_shifts_killers_of_ply() -> None:
+    # given
+    move_history: MoveHistory = MoveHistory()
+    first_move: int = MoveUtil.encode_move(62, 45, PiecesEnum.KNIGHT.value, SpecialFlags.NONE.value)
+    second_move: int = MoveUtil.encode_move(52, 36, PiecesEnum.PAWN.value, SpecialFlags.NONE.value)
+
+    # when
+    move_history.store_cutoff(first_move, PiecesEnum.WHITE.value, 2, 3)
+    move_history.store_cutoff(second_move, PiecesEnum.WHITE.value, 2, 3)
+    move_history.store_cutoff(second_move, PiecesEnum.WHITE.value, 2, 3)
+
+    # then
+    assert (move_history.get_killer(3, 0), move_history.get_killer(3, 1)) == (second_move, first_move)
+    assert move_history.get_killer(2, 0) == NO_MOVE
+    assert move_history.get_killer(MoveEnum.MAX_SEARCH_PLY.value, 0) == NO_MOVE
+
+
+def test_history_score_is_kept_per_side_and_aged() -> None:
+    # given
+    move_history: MoveHistory = MoveHistory()
+    move: int = MoveUtil.encode_move(52, 36, PiecesEnum.PAWN.value, SpecialFlags.NONE.value)
+    move_history.store_cutoff(move, PiecesEnum.WHITE.value, 4, 1)
+    move_history.store_cutoff(move, PiecesEnum.WHITE.value, 2, 1)
+
+    # when
+    scores: Tuple[int, int] = (move_history.get_history_score(move, PiecesEnum.WHITE.value),
+                     move_history.get_history_score(move, PiecesEnum.BLACK.value))
+    move_history.new_search()
+
+    # then
+    assert scores == (20, 0)
+    assert move_history.get_history_score(move, PiecesEnum.WHITE.value) == 10
+    assert move_history.get_killer(1, 0) == NO_MOVE
+
+
+def test_history_scores_are_halved_over_limit() -> None:
+    # given
+    move_history: MoveHistory = MoveHistory()
+    move: int = MoveUtil.encode_move(52, 36, PiecesEnum.PAWN.value, SpecialFlags.NONE.value)
+    depth: int = 200
+
+    # when
+    move_history.store_cutoff(move, PiecesEnum.BLACK.value, depth, 1)
+    move_history.store_cutoff(move, PiecesEnum.BLACK.value, depth, 1)
+
+    # then
+    assert move_history.get_history_score(move, PiecesEnum.BLACK.value) <= MoveEnum.MAX_HISTORY_SCORE.value
+    move_history.clear()
+    assert move_history.get_history_score(move, PiecesEnum.BLACK.value) == 0
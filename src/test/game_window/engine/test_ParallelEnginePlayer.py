@@ -0,0 +1,47 @@
+import pytest
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from game_window.board.fen.FenData import FenData
+from game_window.board.fen.FenMaker import FenMaker
+from game_window.board.GameBoard import GameBoard
+from game_window.engine.ParallelEnginePlayer import ParallelEnginePlayer
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.moving.generation.data.MoveList import MoveList
+from game_window.moving.generation.MoveGenerator import MoveGenerator
+
+
+def test_create_engine_with_wrong_worker_count() -> None:
+    # given
+    workers: int = 0
+
+    # when
+    with pytest.raises(IllegalArgumentException):
+        ParallelEnginePlayer(MoveGenerator(), workers=workers)
+
+    # then
+    with pytest.raises(IllegalArgumentException):
+        ParallelEnginePlayer(MoveGenerator(), workers=2, time_limit=0)
+
+
+def test_parallel_search_completes_max_depth() -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    board.switch_sides()
+    fen_before: str = board.fen_string()
+    legal_moves: MoveList = MoveGenerator().generate_legal_moves(board.engine_color(), board)
+    engine: ParallelEnginePlayer = ParallelEnginePlayer(MoveGenerator(), workers=2, max_depth=2,
+                                                        transposition_size_mb=1)
+
+    # when
+    try:
+        result: int = engine.get_computer_move(board)
+        second_result: int = engine.get_computer_move(board)
+    finally:
+        engine.shutdown()
+
+    # then
+    assert result in legal_moves
+    assert second_result in legal_moves
+    assert engine.get_completed_depth() == 2
+    assert engine.get_searched_nodes() > 0
+    assert board.fen_string() == fen_before
@@ -0,0 +1,112 @@
+import pytest
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from game_window.engine.TranspositionTable import TranspositionTable
+from game_window.enums.TranspositionEnum import TranspositionEnum
+
+
+def test_create_table_with_wrong_size() -> None:
+    # given
+    size_mb: int = 0
+
+    # when
+    with pytest.raises(IllegalArgumentException):
+        TranspositionTable(size_mb)
+
+    # then
+    assert TranspositionTable(1).size() > 0
+
+
+def test_table_size_is_power_of_two_within_memory_cap() -> None:
+    # given
+    size_mb: int = 2
+
+    # when
+    result: int = TranspositionTable(size_mb).size()
+
+    # then
+    assert result & (result - 1) == 0
+    assert result * TranspositionEnum.ENTRY_SIZE_BYTES.value <= size_mb * (1 << 20)
+
+
+def test_store_and_probe_entry() -> None:
+    # given
+    table: TranspositionTable = TranspositionTable(1)
+    key: int = 0xDEAD_BEEF_1234_5678
+
+    # when
+    table.store(key, 3, TranspositionEnum.LOWER_BOUND.value, 12.5, 1234)
+    entry: int = table.probe(key)
+
+    # then
+    assert entry != TranspositionEnum.NO_ENTRY.value
+    assert table.get_depth(entry) == 3
+    assert table.get_bound(entry) == TranspositionEnum.LOWER_BOUND.value
+    assert table.get_score(entry) == 12.5
+    assert table.get_move(entry) == 1234
+    assert table.probe(key + 1) == TranspositionEnum.NO_ENTRY.value
+    assert (table.probes(), table.hits()) == (2, 1)
+
+
+def test_two_tier_keeps_deeper_entry_and_always_replaces_second_slot() -> None:
+    # given
+    table: TranspositionTable = TranspositionTable(1)
+    deep_key: int = 1 << 40
+    shallow_key: int = 2 << 40
+    newest_key: int = 3 << 40
+
+    # when
+    table.store(deep_key, 5, TranspositionEnum.EXACT_BOUND.value, 1.0, 1)
+    table.store(shallow_key, 1, TranspositionEnum.EXACT_BOUND.value, 2.0, 2)
+    table.store(newest_key, 1, TranspositionEnum.EXACT_BOUND.value, 3.0, 3)
+
+    # then
+    assert table.probe(deep_key) != TranspositionEnum.NO_ENTRY.value
+    assert table.probe(shallow_key) == TranspositionEnum.NO_ENTRY.value
+    assert table.probe(newest_key) != TranspositionEnum.NO_ENTRY.value
+
+
+def test_depth_preferred_replaces_entry_of_previous_search() -> None:
+    # given
+    table: TranspositionTable = TranspositionTable(1, TranspositionEnum.DEPTH_PREFERRED.value)
+    deep_key: int = 1 << 40
+    shallow_key: int = 2 << 40
+
+    # when
+    table.store(deep_key, 5, TranspositionEnum.EXACT_BOUND.value, 1.0, 1)
+    table.store(shallow_key, 1, TranspositionEnum.EXACT_BOUND.value, 2.0, 2)
+    kept_deep_entry: bool = table.probe(deep_key) != TranspositionEnum.NO_ENTRY.value
+    table.new_search()
+    table.store(shallow_key, 1, TranspositionEnum.EXACT_BOUND.value, 2.0, 2)
+
+    # then
+    assert kept_deep_entry
+    assert table.probe(deep_key) == TranspositionEnum.NO_ENTRY.value
+    assert table.probe(shallow_key) != TranspositionEnum.NO_ENTRY.value
+
+
+def test_store_without_move_keeps_previous_best_move() -> None:
+    # given
+    table: TranspositionTable = TranspositionTable(1, TranspositionEnum.ALWAYS_REPLACE.value)
+    key: int = 42
+
+    # when
+    table.store(key, 2, TranspositionEnum.LOWER_BOUND.value, 1.0, 777)
+    table.store(key, 3, TranspositionEnum.UPPER_BOUND.value, -1.0, 0)
+
+    # then
+    assert table.get_move(table.probe(key)) == 777
+
+
+def test_clear_removes_entries() -> None:
+    # given
+    table: TranspositionTable = TranspositionTable(1)
+    key: int = 42
+    table.store(key, 2, TranspositionEnum.EXACT_BOUND.value, 1.0, 777)
+
+    # when
+    table.clear()
+
+    # then
+    assert table.probe(key) == TranspositionEnum.NO_ENTRY.value
+    assert table.hits() == 0
@@ -1,3 +1,5 @@
+from typing import Tuple
+
 import pytest
 from numpy import array
 from numpy import dtype
@@ -11,6 +13,7 @@
 from game_window.board.fen.FenMaker import FenMaker
 from game_window.board.GameBoard import GameBoard
 from game_window.enums.BoardEnum import BoardEnum
+from game_window.enums.MoveEnum import MoveEnum
 from game_window.enums.PiecesEnum import PiecesEnum
 from game_window.enums.SpecialFlags import SpecialFlags
 from game_window.moving.generation.data.Move import Move
@@ -329,3 +332,27 @@ def test_get_rook_position_king_side() -> None:
 
     # then
     assert result == expected
+
+
+def test_calculate_jump_targets_knight_in_corner() -> None:
+    # given
+    expected: Tuple[int, ...] = (10, 17)
+
+    # when
+    targets = KingUtil.calculate_jump_targets(MoveEnum.KNIGHT_DIRECTIONS.value, MoveEnum.MAX_KNIGHT_JUMP.value)
+    result: Tuple[int, ...] = targets[0]
+
+    # then
+    assert result == expected
+
+
+def test_calculate_jump_targets_king_on_edge_does_not_wrap() -> None:
+    # given
+    expected: Tuple[int, ...] = (32, 33, 41, 48, 49)
+
+    # when
+    targets = KingUtil.calculate_jump_targets(MoveEnum.KING_DIRECTIONS.value, MoveEnum.KING_RANGE.value)
+    result: Tuple[int, ...] = tuple(sorted(targets[40]))
+
+    # then
+    assert result == expected
@@ -0,0 +1,73 @@
+from typing import List
+
+import pytest
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from game_window.board.BitBoardUtil import BitBoardUtil
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.moving.generation.sliding_piece.SlidingAttacks import SlidingAttacks
+
+
+def test_rook_attacks_on_empty_board() -> None:
+    # given
+    expected: int = 14
+    square: int = 27
+
+    # when
+    attacks: int = SlidingAttacks.get_sliding_piece_attacks(PiecesEnum.ROOK.value, square, 0)
+    result: int = BitBoardUtil.count_bits(attacks)
+
+    # then
+    assert result == expected
+
+
+def test_bishop_attacks_stop_on_first_blocker() -> None:
+    # given
+    square: int = 63
+    occupancy: int = (1 << 45) | (1 << 36) | (1 << 63)
+    expected: List[int] = [45, 54]
+
+    # when
+    attacks: int = SlidingAttacks.get_sliding_piece_attacks(PiecesEnum.BISHOP.value, square, occupancy)
+    result: List[int] = BitBoardUtil.get_squares(attacks)
+
+    # then
+    assert result == expected
+
+
+def test_queen_attacks_are_rook_and_bishop_attacks() -> None:
+    # given
+    square: int = 35
+    occupancy: int = (1 << 3) | (1 << 33) | (1 << 44) | (1 << 17)
+    expected: int = SlidingAttacks.get_rook_attacks(square, occupancy) | \
+        SlidingAttacks.get_bishop_attacks(square, occupancy)
+
+    # when
+    result: int = SlidingAttacks.get_sliding_piece_attacks(PiecesEnum.QUEEN.value, square, occupancy)
+
+    # then
+    assert result == expected
+
+
+def test_rook_attacks_do_not_wrap_around_board() -> None:
+    # given
+    square: int = 7
+    expected: List[int] = [0, 1, 2, 3, 4, 5, 6, 15]
+
+    # when
+    attacks: int = SlidingAttacks.get_sliding_piece_attacks(PiecesEnum.ROOK.value, square, 1 << 15)
+    result: List[int] = BitBoardUtil.get_squares(attacks)
+
+    # then
+    assert result == expected
+
+
+def test_sliding_piece_attacks_not_sliding_piece() -> None:
+    # given
+    piece: int = PiecesEnum.KNIGHT.value
+
+    # when
+    with pytest.raises(IllegalArgumentException):
+        SlidingAttacks.get_sliding_piece_attacks(piece, 0, 0)
+
+    # then
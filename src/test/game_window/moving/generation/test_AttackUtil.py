@@ -0,0 +1,95 @@
+from typing import Dict
+
+import pytest
+
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.board.Board import Board
+from game_window.board.fen.FenData import FenData
+from game_window.board.fen.FenMaker import FenMaker
+from game_window.board.GameBoard import GameBoard
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.moving.generation.AttackUtil import AttackUtil
+from game_window.moving.generation.data.LegalityData import LegalityData
+from game_window.moving.generation.MoveGenerator import MoveGenerator
+
+
+def test_is_square_attacked_by_pawns() -> None:
+    # given
+    board: Board = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    expected: bool = True
+
+    # when
+    result: bool = AttackUtil.is_square_attacked(board, 44, PiecesEnum.WHITE.value)
+
+    # then
+    assert result == expected
+
+
+def test_is_square_attacked_not_attacked_square() -> None:
+    # given
+    board: Board = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    expected: bool = False
+
+    # when
+    result: bool = AttackUtil.is_square_attacked(board, 28, PiecesEnum.WHITE.value)
+
+    # then
+    assert result == expected
+
+
+def test_calculate_pin_rays_pinned_bishop() -> None:
+    # given
+    board: Board = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    white_bishop: int = board.delete_piece_from_board_square(61)
+    black_rook: int = board.delete_piece_from_board_square(0)
+    board.delete_piece_from_board_square(52)
+
+    board.add_piece_to_the_board(white_bishop, 44)
+    board.add_piece_to_the_board(black_rook, 28)
+    expected: Dict[int, int] = {44: (1 << 52) | (1 << 44) | (1 << 36) | (1 << 28)}
+
+    # when
+    result: Dict[int, int] = AttackUtil.calculate_pin_rays(60, PiecesEnum.BLACK.value, board)
+
+    # then
+    assert result == expected
+
+
+def test_calculate_legality_data_single_check() -> None:
+    # given
+    board: Board = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    black_queen: int = board.delete_piece_from_board_square(3)
+    board.delete_piece_from_board_square(51)
+
+    board.add_piece_to_the_board(black_queen, 33)
+    expected_check_mask: int = (1 << 33) | (1 << 42) | (1 << 51)
+
+    # when
+    result: LegalityData = AttackUtil.calculate_legality_data(PiecesEnum.WHITE.value, board)
+
+    # then
+    assert result.checkers_count == 1
+    assert result.check_mask == expected_check_mask
+
+
+def test_calculate_legality_data_nulls() -> None:
+    # given
+
+    # when
+    with pytest.raises(NullArgumentException):
+        AttackUtil.calculate_legality_data(None, None)
+
+    # then
+
+
+def test_is_king_in_check() -> None:
+    # given
+    board: Board = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    board.load_fen("4k3/8/8/8/8/8/8/R3K2r w - - 0 1", PiecesEnum.BLACK.value)
+
+    # when
+    result: tuple = (AttackUtil.is_king_in_check(board, PiecesEnum.WHITE.value),
+                     AttackUtil.is_king_in_check(board, PiecesEnum.BLACK.value))
+
+    # then
+    assert result == (True, False)
@@ -7,8 +7,9 @@
 from game_window.board.fen.FenMaker import FenMaker
 from game_window.board.GameBoard import GameBoard
 from game_window.enums.PiecesEnum import PiecesEnum
-from game_window.moving.generation.data.Move import Move
+from game_window.enums.SpecialFlags import SpecialFlags
 from game_window.moving.generation.data.MoveList import MoveList
+from game_window.moving.generation.data.MoveUtil import MoveUtil
 from game_window.moving.generation.MoveGenerator import MoveGenerator
 
 
@@ -75,11 +76,72 @@ def test_generate_captures_is_every_move_only_capture_for_sure() -> None:
     result: bool = True
 
     for index in range(move_list.size()):
-        move: Move = move_list[index]
+        move: int = move_list[index]
 
-        if board_array[move.get_end_square()] == 0:
+        if board_array[MoveUtil.get_end_square(move)] == 0:
             result = False
             break
 
     # then
     assert result == expected
+
+
+def test_generate_legal_moves_pinned_piece_cannot_leave_pin_line() -> None:
+    # given
+    generator: MoveGenerator = MoveGenerator()
+    expected: bool = False
+    color: int = PiecesEnum.WHITE.value
+    board: Board = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), generator)
+
+    white_bishop: int = board.delete_piece_from_board_square(61)
+    black_rook: int = board.delete_piece_from_board_square(0)
+    board.delete_piece_from_board_square(52)
+
+    board.add_piece_to_the_board(white_bishop, 44)
+    board.add_piece_to_the_board(black_rook, 28)
+
+    # when
+    move_list: MoveList = generator.generate_legal_moves(color, board)
+    result: bool = any(MoveUtil.get_start_square(move_list[index]) == 44 for index in range(move_list.size()))
+
+    # then
+    assert result == expected
+
+
+def test_generate_legal_moves_no_castling_through_attacked_square() -> None:
+    # given
+    generator: MoveGenerator = MoveGenerator()
+    expected: bool = False
+    color: int = PiecesEnum.WHITE.value
+    board: Board = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), generator)
+
+    board.delete_piece_from_board_square(61)
+    board.delete_piece_from_board_square(62)
+    board.delete_piece_from_board_square(53)
+    black_rook: int = board.delete_piece_from_board_square(7)
+    board.delete_piece_from_board_square(13)
+
+    board.add_piece_to_the_board(black_rook, 21)
+
+    # when
+    move_list: MoveList = generator.generate_legal_moves(color, board)
+    result: bool = any(MoveUtil.get_special_flag(move_list[index]) == SpecialFlags.CASTLING.value
+                       for index in range(move_list.size()))
+
+    # then
+    assert result == expected
+
+
+def test_generate_legal_moves_position_with_most_legal_moves() -> None:
+    # given
+    generator: MoveGenerator = MoveGenerator()
+    expected: int = 218
+    color: int = PiecesEnum.WHITE.value
+    board: Board = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), generator)
+    board.load_fen("R6R/3Q4/1Q4Q1/4Q3/2Q4Q/Q4Q2/pp1Q4/kBNN1KB1 w - - 0 1", PiecesEnum.BLACK.value)
+
+    # when
+    move_list: MoveList = generator.generate_legal_moves(color, board)
+
+    # then
+    assert move_list.size() == expected
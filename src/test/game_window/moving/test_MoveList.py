@@ -1,14 +1,24 @@
+from typing import List
+
 import pytest
-from numpy import full
 
 from exceptions.NullArgumentException import NullArgumentException
-from game_window.enums.MoveEnum import MoveEnum
+from game_window.board.Board import Board
+from game_window.board.fen.FenData import FenData
+from game_window.board.fen.FenMaker import FenMaker
+from game_window.board.GameBoard import GameBoard
+from game_window.engine.MoveHistory import MoveHistory
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.enums.SpecialFlags import SpecialFlags
+from game_window.moving.generation.data.MoveList import MoveList
 from game_window.moving.generation.data.Moves import Moves
+from game_window.moving.generation.data.MoveUtil import MoveUtil
+from game_window.moving.generation.MoveGenerator import MoveGenerator
 
 
 def test_append_null_move() -> None:
     # given
-    move_list: Moves = Moves(full(MoveEnum.MAX_NUM_OF_MOVES.value, None, dtype=object), 0)
+    move_list: Moves = Moves()
 
     # when
     with pytest.raises(NullArgumentException):
@@ -20,10 +30,119 @@ def test_append_null_move() -> None:
 def test_is_empty_list_is_empty() -> None:
     # given
     expected: bool = True
-    move_list: Moves = Moves(full(MoveEnum.MAX_NUM_OF_MOVES.value, None, dtype=object), 0)
+    move_list: Moves = Moves()
 
     # when
     result: bool = move_list.is_empty()
 
     # then
     assert result == expected
+
+
+def test_sort_keeps_only_filled_prefix() -> None:
+    # given
+    board: Board = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    move_list: MoveList = MoveGenerator().generate_legal_moves(PiecesEnum.WHITE.value, board)
+    expected: List[int] = sorted(move_list)
+
+    # when
+    move_list.sort(board)
+    result: List[int] = sorted(move_list)
+
+    # then
+    assert result == expected
+
+
+def test_pick_best_move_gives_the_same_order_as_sort() -> None:
+    # given
+    board: Board = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    white_knight: int = board.delete_piece_from_board_square(62)
+    board.add_piece_to_the_board(white_knight, 18)
+    sorted_list: MoveList = MoveGenerator().generate_legal_moves(PiecesEnum.WHITE.value, board)
+    picked_list: MoveList = MoveGenerator().generate_legal_moves(PiecesEnum.WHITE.value, board)
+    sorted_list.sort(board)
+    expected: List[int] = list(sorted_list)
+
+    # when
+    picked_list.score_moves(board)
+    result: List[int] = [picked_list.pick_best_move(index) for index in range(picked_list.size())]
+
+    # then
+    assert result == expected
+
+
+def test_pick_best_move_picks_capture_first() -> None:
+    # given
+    board: Board = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    white_knight: int = board.delete_piece_from_board_square(62)
+    board.add_piece_to_the_board(white_knight, 18)
+    move_list: MoveList = MoveGenerator().generate_legal_moves(PiecesEnum.WHITE.value, board)
+    expected: int = PiecesEnum.BLACK.value | PiecesEnum.QUEEN.value
+
+    # when
+    move_list.score_moves(board)
+    result: int = board.board_array()[MoveUtil.get_end_square(move_list.pick_best_move(0))]
+
+    # then
+    assert result == expected
+
+
+def test_pick_best_move_picks_hash_move_first() -> None:
+    # given
+    board: Board = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    white_knight: int = board.delete_piece_from_board_square(62)
+    board.add_piece_to_the_board(white_knight, 18)
+    move_list: MoveList = MoveGenerator().generate_legal_moves(PiecesEnum.WHITE.value, board)
+    hash_move: int = move_list[move_list.size() - 1]
+
+    # when
+    move_list.score_moves(board, hash_move)
+    result: int = move_list.pick_best_move(0)
+
+    # then
+    assert result == hash_move
+
+
+def test_score_captures_orders_by_most_valuable_victim() -> None:
+    # given
+    board: Board = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    white_knight: int = board.delete_piece_from_board_square(62)
+    board.add_piece_to_the_board(white_knight, 18)
+    move_list: MoveList = MoveGenerator().generate_legal_moves(PiecesEnum.WHITE.value, board, captures_only=True)
+    expected: List[int] = [PiecesEnum.BLACK.value | PiecesEnum.QUEEN.value,
+                           PiecesEnum.BLACK.value | PiecesEnum.KNIGHT.value,
+                           PiecesEnum.BLACK.value | PiecesEnum.PAWN.value,
+                           PiecesEnum.BLACK.value | PiecesEnum.PAWN.value]
+
+    # when
+    move_list.score_captures(board)
+    result: List[int] = [int(board.board_array()[MoveUtil.get_end_square(move_list.pick_best_move(index))])
+                         for index in range(move_list.size())]
+
+    # then
+    assert result == expected
+
+
+def test_score_moves_with_history_orders_captures_killers_and_history_moves() -> None:
+    # given
+    board: Board = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    white_knight: int = board.delete_piece_from_board_square(62)
+    board.add_piece_to_the_board(white_knight, 18)
+    move_list: MoveList = MoveGenerator().generate_legal_moves(PiecesEnum.WHITE.value, board)
+    move_history: MoveHistory = MoveHistory()
+    killer: int = MoveUtil.encode_move(18, 35, PiecesEnum.KNIGHT.value, SpecialFlags.NONE.value)
+    older_killer: int = MoveUtil.encode_move(18, 33, PiecesEnum.KNIGHT.value, SpecialFlags.NONE.value)
+    history_move: int = MoveUtil.encode_move(52, 36, PiecesEnum.PAWN.value, SpecialFlags.NONE.value)
+    move_history.store_cutoff(older_killer, PiecesEnum.WHITE.value, 1, 2)
+    move_history.store_cutoff(killer, PiecesEnum.WHITE.value, 1, 2)
+    move_history.store_cutoff(history_move, PiecesEnum.WHITE.value, 10, 5)
+
+    # when
+    move_list.score_moves(board, move_history=move_history, ply=2)
+    result: List[int] = [move_list.pick_best_move(index) for index in range(7)]
+
+    # then
+    assert [int(board.board_array()[MoveUtil.get_end_square(move)]) for move in result[:4]] == \
+        [PiecesEnum.BLACK.value | PiecesEnum.QUEEN.value, PiecesEnum.BLACK.value | PiecesEnum.KNIGHT.value,
+         PiecesEnum.BLACK.value | PiecesEnum.PAWN.value, PiecesEnum.BLACK.value | PiecesEnum.PAWN.value]
+    assert result[4:] == [killer, older_killer, history_move]
@@ -0,0 +1,57 @@
+import pytest
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.enums.SpecialFlags import SpecialFlags
+from game_window.moving.generation.data.MoveList import MoveList
+from game_window.moving.generation.data.MoveListPool import MoveListPool
+from game_window.moving.generation.data.MoveUtil import MoveUtil
+
+
+def test_get_move_list_reuses_the_same_list() -> None:
+    # given
+    pool: MoveListPool = MoveListPool(4)
+    expected: MoveList = pool.get_move_list(2)
+
+    # when
+    result: MoveList = pool.get_move_list(2)
+
+    # then
+    assert result is expected
+
+
+def test_get_move_list_returns_cleared_list() -> None:
+    # given
+    pool: MoveListPool = MoveListPool(4)
+    expected: bool = True
+    pool.get_move_list(1).append(MoveUtil.encode_move(52, 36, PiecesEnum.PAWN.value, SpecialFlags.NONE.value))
+
+    # when
+    result: bool = pool.get_move_list(1).is_empty()
+
+    # then
+    assert result == expected
+
+
+def test_get_move_list_grows_pool_above_max_ply() -> None:
+    # given
+    pool: MoveListPool = MoveListPool(2)
+    expected: int = 6
+
+    # when
+    pool.get_move_list(5)
+    result: int = pool.size()
+
+    # then
+    assert result == expected
+
+
+def test_get_move_list_negative_ply() -> None:
+    # given
+    pool: MoveListPool = MoveListPool(2)
+
+    # when
+    with pytest.raises(IllegalArgumentException):
+        pool.get_move_list(-1)
+
+    # then
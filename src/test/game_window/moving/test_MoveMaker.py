@@ -10,8 +10,8 @@
 from game_window.enums.MoveEnum import MoveEnum
 from game_window.enums.PiecesEnum import PiecesEnum
 from game_window.enums.SpecialFlags import SpecialFlags
-from game_window.moving.generation.data.Move import Move
 from game_window.moving.generation.data.MoveData import MoveData
+from game_window.moving.generation.data.MoveUtil import MoveUtil
 from game_window.moving.generation.MoveGenerator import MoveGenerator
 from game_window.moving.MoveMaker import MoveMaker
 
@@ -23,7 +23,7 @@ def test_make_move() -> None:
     color: int = PiecesEnum.WHITE.value
     start_square: int = 63
     end_square: int = 0
-    move: Move = Move(start_square, end_square, PiecesEnum.ROOK.value, SpecialFlags.NONE.value)
+    move: int = MoveUtil.encode_move(start_square, end_square, PiecesEnum.ROOK.value, SpecialFlags.NONE.value)
 
     # when
     result: MoveData = MoveMaker.make_move(move, color, board)
@@ -42,7 +42,7 @@ def test_un_make_move() -> None:
                                       MoveEnum.NONE.value, MoveEnum.NONE.value)
     start_square: int = 63
     end_square: int = 0
-    move: Move = Move(start_square, end_square, PiecesEnum.ROOK.value, SpecialFlags.NONE.value)
+    move: int = MoveUtil.encode_move(start_square, end_square, PiecesEnum.ROOK.value, SpecialFlags.NONE.value)
 
     # when
     MoveMaker.un_make_move(move, deleted_data, board)
@@ -57,7 +57,7 @@ def test_make_castling_move_king_side() -> None:
     board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
     board_array: ndarray[int, dtype[int8]] = board.board_array()
     color: int = PiecesEnum.WHITE.value
-    move: Move = Move(60, 62, PiecesEnum.KING.value, SpecialFlags.CASTLING.value)
+    move: int = MoveUtil.encode_move(60, 62, PiecesEnum.KING.value, SpecialFlags.CASTLING.value)
     rook_pos: int = 61
     king_pos: int = 62
     expected: Tuple[int, int] = (color | PiecesEnum.ROOK.value, color | PiecesEnum.KING.value)
@@ -78,7 +78,7 @@ def test_un_make_castling_move_king_side() -> None:
     board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
     board_array: ndarray[int, dtype[int8]] = board.board_array()
     color: int = PiecesEnum.WHITE.value
-    move: Move = Move(60, 62, PiecesEnum.KING.value, SpecialFlags.CASTLING.value)
+    move: int = MoveUtil.encode_move(60, 62, PiecesEnum.KING.value, SpecialFlags.CASTLING.value)
     rook_pos: int = 61
     king_pos: int = 62
     expected: Tuple[int, int] = (PiecesEnum.NONE.value, PiecesEnum.NONE.value)
@@ -98,7 +98,7 @@ def test_un_make_castling_move_king_side() -> None:
 def test_does_making_move_return_proper_move_data() -> None:
     # given
     board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
-    move: Move = Move(60, 62, PiecesEnum.KING.value, SpecialFlags.CASTLING.value)
+    move: int = MoveUtil.encode_move(60, 62, PiecesEnum.KING.value, SpecialFlags.CASTLING.value)
     expected: MoveData = MoveData(PiecesEnum.WHITE.value | PiecesEnum.KING.value, True, True, True, True,
                                   MoveEnum.NONE.value, MoveEnum.NONE.value, 0, 0)
 
@@ -119,7 +119,7 @@ def test_make_castling_move_queen_side() -> None:
     color: int = PiecesEnum.WHITE.value
     rook_pos: int = 59
     king_pos: int = 58
-    move: Move = Move(60, king_pos, PiecesEnum.KING.value, SpecialFlags.CASTLING.value)
+    move: int = MoveUtil.encode_move(60, king_pos, PiecesEnum.KING.value, SpecialFlags.CASTLING.value)
     expected: Tuple[int, int] = (color | PiecesEnum.ROOK.value, color | PiecesEnum.KING.value)
 
     board.delete_piece_from_board_square(48)
@@ -141,7 +141,7 @@ def test_un_make_castling_move_queen_side() -> None:
     color: int = PiecesEnum.WHITE.value
     rook_pos: int = 59
     king_pos: int = 58
-    move: Move = Move(60, king_pos, PiecesEnum.KING.value, SpecialFlags.CASTLING.value)
+    move: int = MoveUtil.encode_move(60, king_pos, PiecesEnum.KING.value, SpecialFlags.CASTLING.value)
     expected: Tuple[int, int] = (PiecesEnum.NONE.value, PiecesEnum.NONE.value)
 
     board.delete_piece_from_board_square(48)
@@ -166,7 +166,8 @@ def test_make_left_en_passant_move() -> None:
     captured_pawn_pos: int = 27
     capturing_pawn_pos: int = 28
     en_passant_pos: int = 19
-    move: Move = Move(capturing_pawn_pos, en_passant_pos, PiecesEnum.PAWN.value, SpecialFlags.EN_PASSANT.value)
+    move: int = MoveUtil.encode_move(capturing_pawn_pos, en_passant_pos, PiecesEnum.PAWN.value,
+                                     SpecialFlags.EN_PASSANT.value)
 
     board.delete_piece_from_board_square(52)
     board.delete_piece_from_board_square(11)
@@ -200,7 +201,8 @@ def test_un_make_left_en_passant_move() -> None:
     captured_pawn_pos: int = 27
     capturing_pawn_pos: int = 28
     en_passant_pos: int = 19
-    move: Move = Move(capturing_pawn_pos, en_passant_pos, PiecesEnum.PAWN.value, SpecialFlags.EN_PASSANT.value)
+    move: int = MoveUtil.encode_move(capturing_pawn_pos, en_passant_pos, PiecesEnum.PAWN.value,
+                                     SpecialFlags.EN_PASSANT.value)
 
     board.delete_piece_from_board_square(52)
     board.delete_piece_from_board_square(11)
@@ -235,7 +237,8 @@ def test_make_right_en_passant_move() -> None:
     captured_pawn_pos: int = 29
     capturing_pawn_pos: int = 28
     en_passant_pos: int = 21
-    move: Move = Move(capturing_pawn_pos, en_passant_pos, PiecesEnum.PAWN.value, SpecialFlags.EN_PASSANT.value)
+    move: int = MoveUtil.encode_move(capturing_pawn_pos, en_passant_pos, PiecesEnum.PAWN.value,
+                                     SpecialFlags.EN_PASSANT.value)
 
     board.delete_piece_from_board_square(52)
     board.delete_piece_from_board_square(11)
@@ -269,7 +272,8 @@ def test_un_make_right_en_passant_move() -> None:
     captured_pawn_pos: int = 29
     capturing_pawn_pos: int = 28
     en_passant_pos: int = 21
-    move: Move = Move(capturing_pawn_pos, en_passant_pos, PiecesEnum.PAWN.value, SpecialFlags.EN_PASSANT.value)
+    move: int = MoveUtil.encode_move(capturing_pawn_pos, en_passant_pos, PiecesEnum.PAWN.value,
+                                     SpecialFlags.EN_PASSANT.value)
 
     board.delete_piece_from_board_square(52)
     board.delete_piece_from_board_square(11)
@@ -301,8 +305,8 @@ def test_make_promotion_to_queen() -> None:
     board_array: ndarray[int, dtype[int8]] = board.board_array()
     promotion_start_square: int = 8
     promotion_end_square: int = 0
-    move: Move = Move(promotion_start_square, promotion_end_square, PiecesEnum.PAWN.value,
-                      SpecialFlags.PROMOTE_TO_QUEEN.value)
+    move: int = MoveUtil.encode_move(promotion_start_square, promotion_end_square, PiecesEnum.PAWN.value,
+                                     SpecialFlags.PROMOTE_TO_QUEEN.value)
     expected: Tuple[int, int] = (PiecesEnum.NONE.value, PiecesEnum.WHITE.value | PiecesEnum.QUEEN.value)
 
     board.delete_piece_from_board_square(48)
@@ -323,8 +327,8 @@ def test_un_make_promotion_to_queen() -> None:
     board_array: ndarray[int, dtype[int8]] = board.board_array()
     promotion_start_square: int = 8
     promotion_end_square: int = 0
-    move: Move = Move(promotion_start_square, promotion_end_square, PiecesEnum.PAWN.value,
-                      SpecialFlags.PROMOTE_TO_QUEEN.value)
+    move: int = MoveUtil.encode_move(promotion_start_square, promotion_end_square, PiecesEnum.PAWN.value,
+                                     SpecialFlags.PROMOTE_TO_QUEEN.value)
     expected: Tuple[int, int] = (PiecesEnum.WHITE.value | PiecesEnum.PAWN.value, PiecesEnum.NONE.value)
 
     board.delete_piece_from_board_square(48)
@@ -346,8 +350,8 @@ def test_make_promotion_to_rook() -> None:
     board_array: ndarray[int, dtype[int8]] = board.board_array()
     promotion_start_square: int = 8
     promotion_end_square: int = 0
-    move: Move = Move(promotion_start_square, promotion_end_square, PiecesEnum.PAWN.value,
-                      SpecialFlags.PROMOTE_TO_ROOK.value)
+    move: int = MoveUtil.encode_move(promotion_start_square, promotion_end_square, PiecesEnum.PAWN.value,
+                                     SpecialFlags.PROMOTE_TO_ROOK.value)
     expected: Tuple[int, int] = (PiecesEnum.NONE.value, PiecesEnum.WHITE.value | PiecesEnum.ROOK.value)
 
     board.delete_piece_from_board_square(48)
@@ -368,8 +372,8 @@ def test_un_make_promotion_to_rook() -> None:
     board_array: ndarray[int, dtype[int8]] = board.board_array()
     promotion_start_square: int = 8
     promotion_end_square: int = 0
-    move: Move = Move(promotion_start_square, promotion_end_square, PiecesEnum.PAWN.value,
-                      SpecialFlags.PROMOTE_TO_ROOK.value)
+    move: int = MoveUtil.encode_move(promotion_start_square, promotion_end_square, PiecesEnum.PAWN.value,
+                                     SpecialFlags.PROMOTE_TO_ROOK.value)
     expected: Tuple[int, int] = (PiecesEnum.WHITE.value | PiecesEnum.PAWN.value, PiecesEnum.NONE.value)
 
     board.delete_piece_from_board_square(48)
@@ -391,8 +395,8 @@ def test_make_promotion_to_bishop() -> None:
     board_array: ndarray[int, dtype[int8]] = board.board_array()
     promotion_start_square: int = 8
     promotion_end_square: int = 0
-    move: Move = Move(promotion_start_square, promotion_end_square, PiecesEnum.PAWN.value,
-                      SpecialFlags.PROMOTE_TO_BISHOP.value)
+    move: int = MoveUtil.encode_move(promotion_start_square, promotion_end_square, PiecesEnum.PAWN.value,
+                                     SpecialFlags.PROMOTE_TO_BISHOP.value)
     expected: Tuple[int, int] = (PiecesEnum.NONE.value, PiecesEnum.WHITE.value | PiecesEnum.BISHOP.value)
 
     board.delete_piece_from_board_square(48)
@@ -413,8 +417,8 @@ def test_un_make_promotion_to_bishop() -> None:
     board_array: ndarray[int, dtype[int8]] = board.board_array()
     promotion_start_square: int = 8
     promotion_end_square: int = 0
-    move: Move = Move(promotion_start_square, promotion_end_square, PiecesEnum.PAWN.value,
-                      SpecialFlags.PROMOTE_TO_BISHOP.value)
+    move: int = MoveUtil.encode_move(promotion_start_square, promotion_end_square, PiecesEnum.PAWN.value,
+                                     SpecialFlags.PROMOTE_TO_BISHOP.value)
     expected: Tuple[int, int] = (PiecesEnum.WHITE.value | PiecesEnum.PAWN.value, PiecesEnum.NONE.value)
 
     board.delete_piece_from_board_square(48)
@@ -436,8 +440,8 @@ def test_make_promotion_to_knight() -> None:
     board_array: ndarray[int, dtype[int8]] = board.board_array()
     promotion_start_square: int = 8
     promotion_end_square: int = 0
-    move: Move = Move(promotion_start_square, promotion_end_square, PiecesEnum.PAWN.value,
-                      SpecialFlags.PROMOTE_TO_KNIGHT.value)
+    move: int = MoveUtil.encode_move(promotion_start_square, promotion_end_square, PiecesEnum.PAWN.value,
+                                     SpecialFlags.PROMOTE_TO_KNIGHT.value)
     expected: Tuple[int, int] = (PiecesEnum.NONE.value, PiecesEnum.WHITE.value | PiecesEnum.KNIGHT.value)
 
     board.delete_piece_from_board_square(48)
@@ -458,8 +462,8 @@ def test_un_make_promotion_to_knight() -> None:
     board_array: ndarray[int, dtype[int8]] = board.board_array()
     promotion_start_square: int = 8
     promotion_end_square: int = 0
-    move: Move = Move(promotion_start_square, promotion_end_square, PiecesEnum.PAWN.value,
-                      SpecialFlags.PROMOTE_TO_KNIGHT.value)
+    move: int = MoveUtil.encode_move(promotion_start_square, promotion_end_square, PiecesEnum.PAWN.value,
+                                     SpecialFlags.PROMOTE_TO_KNIGHT.value)
     expected: Tuple[int, int] = (PiecesEnum.WHITE.value | PiecesEnum.PAWN.value, PiecesEnum.NONE.value)
 
     board.delete_piece_from_board_square(48)
@@ -480,8 +484,8 @@ def test_make_capture_of_rook() -> None:
     board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
     promotion_start_square: int = 9
     promotion_end_square: int = 0
-    move: Move = Move(promotion_start_square, promotion_end_square, PiecesEnum.PAWN.value,
-                      SpecialFlags.PROMOTE_TO_ROOK.value)
+    move: int = MoveUtil.encode_move(promotion_start_square, promotion_end_square, PiecesEnum.PAWN.value,
+                                     SpecialFlags.PROMOTE_TO_ROOK.value)
     expected: bool = False
 
     board.delete_piece_from_board_square(49)
@@ -501,8 +505,8 @@ def test_un_make_capture_of_rook() -> None:
     board_array: ndarray[int, dtype[int8]] = board.board_array()
     promotion_start_square: int = 9
     promotion_end_square: int = 0
-    move: Move = Move(promotion_start_square, promotion_end_square, PiecesEnum.PAWN.value,
-                      SpecialFlags.PROMOTE_TO_ROOK.value)
+    move: int = MoveUtil.encode_move(promotion_start_square, promotion_end_square, PiecesEnum.PAWN.value,
+                                     SpecialFlags.PROMOTE_TO_ROOK.value)
     expected: Tuple[int, int, bool] = (PiecesEnum.WHITE.value | PiecesEnum.PAWN.value,
                                        PiecesEnum.BLACK.value | PiecesEnum.ROOK.value, True)
 
@@ -522,7 +526,7 @@ def test_un_make_capture_of_rook() -> None:
 def test_make_double_pawn_move() -> None:
     # given
     board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
-    move: Move = Move(48, 32, PiecesEnum.PAWN.value, SpecialFlags.NONE.value)
+    move: int = MoveUtil.encode_move(48, 32, PiecesEnum.PAWN.value, SpecialFlags.NONE.value)
     color: int = PiecesEnum.WHITE.value
     expected: Tuple[int, int, int] = (color | PiecesEnum.PAWN.value, 40, 32)
 
@@ -540,7 +544,7 @@ def test_make_double_pawn_move() -> None:
 def test_un_make_double_pawn_move() -> None:
     # given
     board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
-    move: Move = Move(48, 32, PiecesEnum.PAWN.value, SpecialFlags.NONE.value)
+    move: int = MoveUtil.encode_move(48, 32, PiecesEnum.PAWN.value, SpecialFlags.NONE.value)
     color: int = PiecesEnum.WHITE.value
     expected: Tuple[int, int, int] = (0, -1, -1)
     start_string = board.fen_string()
@@ -8,7 +8,7 @@
 from game_window.board.fen.FenMaker import FenMaker
 from game_window.enums.PiecesEnum import PiecesEnum
 from game_window.enums.SpecialFlags import SpecialFlags
-from game_window.moving.generation.data.Move import Move
+from game_window.moving.generation.data.MoveUtil import MoveUtil
 from game_window.moving.generation.MoveGenerator import MoveGenerator
 from game_window.moving.MoveMakingUtil import MoveMakingUtil
 from game_window.moving.MoveUnMakingUtil import MoveUnMakingUtil
@@ -29,7 +29,7 @@ def test_un_castle_king_not_castling_move() -> None:
     # given
     board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
     color: int = PiecesEnum.WHITE.value
-    castling_move = Move(60, 62, PiecesEnum.KING.value, -1)
+    castling_move = MoveUtil.encode_move(60, 62, PiecesEnum.KING.value, -1)
 
     # when
     with pytest.raises(IllegalArgumentException):
@@ -42,7 +42,7 @@ def test_un_castle_king_not_existing_color() -> None:
     # given
     board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
     color: int = 81
-    castling_move: Move = Move(60, 62, PiecesEnum.KING.value, SpecialFlags.CASTLING.value)
+    castling_move: int = MoveUtil.encode_move(60, 62, PiecesEnum.KING.value, SpecialFlags.CASTLING.value)
 
     # when
     with pytest.raises(IllegalArgumentException):
@@ -55,7 +55,7 @@ def test_un_castle_king_proper_use() -> None:
     # given
     board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
     board_array: ndarray[int] = board.board_array()
-    castling_move: Move = Move(60, 62, PiecesEnum.KING.value, SpecialFlags.CASTLING.value)
+    castling_move: int = MoveUtil.encode_move(60, 62, PiecesEnum.KING.value, SpecialFlags.CASTLING.value)
     expected_rook_pos: int = 63
     expected_king_pos: int = 60
     rook: int = PiecesEnum.WHITE.value | PiecesEnum.ROOK.value
@@ -0,0 +1,90 @@
+import pytest
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from exceptions.NullArgumentException import NullArgumentException
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.enums.SpecialFlags import SpecialFlags
+from game_window.moving.generation.data.Move import Move
+from game_window.moving.generation.data.MoveUtil import MoveUtil
+
+
+def test_encode_move_decodes_to_the_same_values() -> None:
+    # given
+    expected: tuple = (52, 60, PiecesEnum.PAWN.value, SpecialFlags.PROMOTE_TO_KNIGHT.value)
+
+    # when
+    move: int = MoveUtil.encode_move(*expected)
+    result: tuple = (MoveUtil.get_start_square(move), MoveUtil.get_end_square(move),
+                     MoveUtil.get_moving_piece(move), MoveUtil.get_special_flag(move))
+
+    # then
+    assert result == expected
+
+
+def test_encode_move_fits_in_16_bits() -> None:
+    # given
+    expected: bool = True
+
+    # when
+    move: int = MoveUtil.encode_move(63, 63, PiecesEnum.PAWN.value, SpecialFlags.PROMOTE_TO_BISHOP.value)
+    result: bool = 0 < move < 1 << 16
+
+    # then
+    assert result == expected
+
+
+def test_encode_move_not_possible_special_flag() -> None:
+    # given
+
+    # when
+    with pytest.raises(IllegalArgumentException):
+        MoveUtil.encode_move(60, 62, PiecesEnum.ROOK.value, SpecialFlags.CASTLING.value)
+
+    # then
+
+
+def test_encode_move_nulls() -> None:
+    # given
+
+    # when
+    with pytest.raises(NullArgumentException):
+        MoveUtil.encode_move(None, 62, PiecesEnum.KING.value, SpecialFlags.CASTLING.value)
+
+    # then
+
+
+def test_create_move() -> None:
+    # given
+    expected: Move = Move(60, 62, PiecesEnum.KING.value, SpecialFlags.CASTLING.value)
+    move: int = MoveUtil.encode_move(60, 62, PiecesEnum.KING.value, SpecialFlags.CASTLING.value)
+
+    # when
+    result: Move = MoveUtil.create_move(move)
+
+    # then
+    assert result == expected
+    assert result.get_special_flag() == expected.get_special_flag()
+
+
+def test_is_the_same_move_ignores_special_flag() -> None:
+    # given
+    expected: bool = True
+    move_instance: Move = Move(60, 62, PiecesEnum.KING.value, SpecialFlags.NONE.value)
+    move: int = MoveUtil.encode_move(60, 62, PiecesEnum.KING.value, SpecialFlags.CASTLING.value)
+
+    # when
+    result: bool = MoveUtil.is_the_same_move(move, move_instance)
+
+    # then
+    assert result == expected
+
+
+def test_to_short_string_gives_squares() -> None:
+    # given
+    move: int = MoveUtil.encode_move(52, 36, PiecesEnum.PAWN.value, SpecialFlags.NONE.value)
+
+    # when
+    result: str = MoveUtil.to_short_string(move)
+
+    # then
+    assert result == "52-36"
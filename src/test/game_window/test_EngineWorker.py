@@ -0,0 +1,83 @@
+from time import perf_counter
+
+from game_window.board.Board import Board
+from game_window.board.fen.FenData import FenData
+from game_window.board.fen.FenMaker import FenMaker
+from game_window.board.GameBoard import GameBoard
+from game_window.engine.Engine import Engine
+from game_window.engine.EnginePlayer import EnginePlayer
+from game_window.engine.Evaluator import Evaluator
+from game_window.engine.TranspositionTable import TranspositionTable
+from game_window.EngineWorker import EngineWorker
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.moving.generation.MoveGenerator import MoveGenerator
+from game_window.moving.MoveMaker import MoveMaker
+
+
+class MovingEngine(Engine):
+    """
+    Engine playing the first legal move on the board it gets
+    """
+
+    __slots__ = ()
+
+    def get_computer_move(self, board: Board) -> int:
+        move: int = board.legal_moves()[0]
+        MoveMaker.make_move(move, board.color_to_move(), board)
+
+        return move
+
+    def stop_search(self) -> None:
+        pass
+
+
+def create_board() -> GameBoard:
+    return GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+
+
+def create_long_search_engine() -> EnginePlayer:
+    return EnginePlayer(MoveGenerator(), Evaluator(), TranspositionTable(1), max_depth=64, time_limit=600)
+
+
+def test_cancel_stops_running_search() -> None:
+    # given
+    worker: EngineWorker = EngineWorker(create_long_search_engine())
+    worker.start_search(create_board())
+    start_time: float = perf_counter()
+
+    # when
+    worker.cancel()
+
+    # then
+    assert not worker.is_searching()
+    assert perf_counter() - start_time < 60
+
+
+def test_is_current_search_rejects_cancelled_search() -> None:
+    # given
+    worker: EngineWorker = EngineWorker(create_long_search_engine())
+    search_id: int = worker.start_search(create_board())
+    was_current: bool = worker.is_current_search(search_id)
+
+    # when
+    worker.cancel()
+
+    # then
+    assert was_current
+    assert not worker.is_current_search(search_id)
+
+
+def test_start_search_does_not_change_given_board() -> None:
+    # given
+    board: GameBoard = create_board()
+    fen_before: str = board.fen_string()
+    zobrist_key_before: int = board.zobrist_key()
+    worker: EngineWorker = EngineWorker(MovingEngine())
+
+    # when
+    worker.start_search(board)
+    worker.wait()
+
+    # then
+    assert board.fen_string() == fen_before
+    assert board.zobrist_key() == zobrist_key_before
@@ -0,0 +1,110 @@
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import pytest
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from game_window.board.Board import Board
+from game_window.board.fen.FenData import FenData
+from game_window.board.fen.FenMaker import FenMaker
+from game_window.board.GameBoard import GameBoard
+from game_window.enums.PerftEnum import PerftEnum
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.moving.generation.data.MoveUtil import NO_MOVE
+from game_window.moving.generation.MoveGenerator import MoveGenerator
+from game_window.moving.MoveMaker import MoveMaker
+from perft.Perft import Perft
+from uci.UciUtil import UciUtil
+
+SUITE: Tuple[Tuple[str, str, Tuple[int, ...]], ...] = PerftEnum.SUITE.value
+START_FEN: str = SUITE[0][1]
+POSITION_4_FEN: str = SUITE[3][1]
+
+
+def create_board(fen: str, engine_color: int, generator: MoveGenerator) -> Board:
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), generator)
+    board.load_fen(fen, engine_color)
+
+    return board
+
+
+@pytest.mark.parametrize("engine_color", [PiecesEnum.BLACK.value, PiecesEnum.WHITE.value])
+@pytest.mark.parametrize("name, fen, expected_counts", SUITE)
+def test_count_nodes_of_suite_positions(name: str, fen: str, expected_counts: Tuple[int, ...],
+                                        engine_color: int) -> None:
+    # given
+    generator: MoveGenerator = MoveGenerator()
+    board: Board = create_board(fen, engine_color, generator)
+    board_before: List[int] = board.board_array().tolist()
+
+    # when
+    result: int = Perft(generator).count_nodes(board, 2)
+
+    # then
+    assert result == expected_counts[1], name
+    assert board.board_array().tolist() == board_before
+
+
+@pytest.mark.parametrize("engine_color", [PiecesEnum.BLACK.value, PiecesEnum.WHITE.value])
+@pytest.mark.parametrize("fen, expected", [(START_FEN, 8902), (POSITION_4_FEN, 9467)])
+def test_count_nodes_on_depth_three(fen: str, expected: int, engine_color: int) -> None:
+    # given
+    generator: MoveGenerator = MoveGenerator()
+    board: Board = create_board(fen, engine_color, generator)
+
+    # when
+    result: int = Perft(generator).count_nodes(board, 3)
+
+    # then
+    assert result == expected
+
+
+@pytest.mark.parametrize("engine_color", [PiecesEnum.BLACK.value, PiecesEnum.WHITE.value])
+def test_en_passant_expires_after_one_move(engine_color: int) -> None:
+    # given
+    generator: MoveGenerator = MoveGenerator()
+    board: Board = create_board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/Pp2P3/2N2Q1p/1PPBBPPP/R3K2R b KQkq a3 0 1",
+                                engine_color, generator)
+
+    for uci_move in ("c7c6", "a4a5"):
+        MoveMaker.make_move(UciUtil.find_legal_move(uci_move, board, generator), board.color_to_move(), board)
+
+    # when
+    result: int = Perft(generator).count_nodes(board, 1)
+
+    # then
+    assert result == 43
+    assert UciUtil.find_legal_move("b4a3", board, generator) == NO_MOVE
+
+
+def test_divide_sums_up_to_count_nodes() -> None:
+    # given
+    generator: MoveGenerator = MoveGenerator()
+    board: Board = create_board(SUITE[1][1], PiecesEnum.BLACK.value, generator)
+    perft: Perft = Perft(generator)
+
+    # when
+    result: Dict[str, int] = perft.divide(board, 2)
+
+    # then
+    assert len(result) == 48
+    assert result["e1g1"] == 43
+    assert sum(result.values()) == perft.count_nodes(board, 2)
+
+
+def test_count_nodes_on_depth_zero_and_below() -> None:
+    # given
+    generator: MoveGenerator = MoveGenerator()
+    board: Board = create_board(START_FEN, PiecesEnum.BLACK.value, generator)
+    perft: Perft = Perft(generator)
+
+    # when
+    result: int = perft.count_nodes(board, 0)
+
+    # then
+    assert result == 1
+    with pytest.raises(IllegalArgumentException):
+        perft.count_nodes(board, -1)
+    with pytest.raises(IllegalArgumentException):
+        perft.divide(board, 0)
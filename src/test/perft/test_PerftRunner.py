@@ -0,0 +1,35 @@
+from io import StringIO
+from typing import List
+
+from perft.PerftRunner import PerftRunner
+
+
+def test_run_position_with_divide() -> None:
+    # given
+    output: StringIO = StringIO()
+
+    # when
+    result: int = PerftRunner(output).run_position("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", 2,
+                                                   divide=True)
+
+    # then
+    lines: List[str] = output.getvalue().splitlines()
+    assert result == 400
+    assert len(lines) == 21
+    assert "e2e4: 20" in lines
+    assert lines[-1].startswith("Nodes: 400 ")
+
+
+def test_run_suite_on_depth_one() -> None:
+    # given
+    output: StringIO = StringIO()
+
+    # when
+    result: bool = PerftRunner(output).run_suite(1)
+
+    # then
+    lines: List[str] = output.getvalue().splitlines()
+    assert result
+    assert all(" OK " in line for line in lines[:-1])
+    assert lines[-1].startswith("Total: ")
+    assert " 0 failed " in lines[-1]
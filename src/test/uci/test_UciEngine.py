@@ -0,0 +1,111 @@
+import subprocess
+import sys
+from io import StringIO
+from typing import List
+
+from uci.UciEngine import UciEngine
+
+
+def run_session(commands: str) -> List[str]:
+    output: StringIO = StringIO()
+    UciEngine(StringIO(commands), output).run()
+
+    return output.getvalue().splitlines()
+
+
+def test_uci_handshake() -> None:
+    # given
+    commands: str = "uci\nisready\n"
+
+    # when
+    result: List[str] = run_session(commands)
+
+    # then
+    assert result[-2:] == ["uciok", "readyok"]
+    assert result[0].startswith("id name")
+
+
+def test_go_depth_after_moves_with_castling() -> None:
+    # given
+    commands: str = "position startpos moves e2e4 e7e5 g1f3 b8c6 f1c4 g8f6 e1g1\ngo depth 1\n"
+
+    # when
+    result: List[str] = run_session(commands)
+
+    # then
+    assert result[0].startswith("info depth 1 ")
+    assert result[1].startswith("bestmove ")
+    assert result[1] != "bestmove 0000"
+    assert result[0].endswith(f" pv {result[1].split()[1]}")
+
+
+def test_go_nodes_limit_from_white_side() -> None:
+    # given
+    commands: str = "position startpos\ngo nodes 50\n"
+
+    # when
+    result: List[str] = run_session(commands)
+
+    # then
+    assert " nodes 50 " in result[0]
+    assert result[1].split()[1][:2] in ("a2", "b2", "c2", "d2", "e2", "f2", "g2", "h2", "b1", "g1")
+
+
+def test_stop_right_after_go_infinite_posts_best_move() -> None:
+    # given
+    commands: str = "position startpos\ngo infinite\nstop\n" * 5
+
+    # when
+    result: List[str] = run_session(commands)
+
+    # then
+    assert len([line for line in result if line.startswith("bestmove ")]) == 5
+
+
+def test_illegal_move_clears_position() -> None:
+    # given
+    commands: str = "position startpos moves e2e5\ngo movetime 100\nquit\n"
+
+    # when
+    result: List[str] = run_session(commands)
+
+    # then
+    assert result == ["info string illegal move e2e5", "bestmove 0000"]
+
+
+def test_front_end_does_not_import_qt() -> None:
+    # given
+    script: str = f"import sys; sys.path[:0] = {sys.path!r}; import uci.UciEngine; print('PyQt5' in sys.modules)"
+
+    # when
+    result: str = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True).stdout
+
+    # then
+    assert result.strip() == "False"
+
+
+def test_position_fen_with_moves() -> None:
+    # given
+    fen: str = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+    commands: str = f"position fen 8/8 w - - 0 1\nposition fen {fen} moves e1g1 e8c8\ngo depth 1\n"
+
+    # when
+    result: List[str] = run_session(commands)
+
+    # then
+    assert result[0] == "info string wrong fen 8/8 w - - 0 1"
+    assert result[1].startswith("info depth 1 ")
+    assert result[2].startswith("bestmove ")
+
+
+def test_go_perft_divides_nodes() -> None:
+    # given
+    commands: str = "position startpos moves e2e4\ngo perft 2\n"
+
+    # when
+    result: List[str] = run_session(commands)
+
+    # then
+    assert len([line for line in result if line[:4].isalnum() and line[4:6] == ": "]) == 20
+    assert "Nodes searched: 600" in result
+    assert not any(line.startswith("bestmove") for line in result)
@@ -0,0 +1,70 @@
+from typing import Tuple
+
+import pytest
+
+from exceptions.IllegalArgumentException import IllegalArgumentException
+from game_window.board.fen.FenData import FenData
+from game_window.board.fen.FenMaker import FenMaker
+from game_window.board.GameBoard import GameBoard
+from game_window.enums.PiecesEnum import PiecesEnum
+from game_window.enums.SpecialFlags import SpecialFlags
+from game_window.moving.generation.data.MoveUtil import MoveUtil
+from game_window.moving.generation.data.MoveUtil import NO_MOVE
+from game_window.moving.generation.MoveGenerator import MoveGenerator
+from uci.UciUtil import UciUtil
+
+
+def test_convert_squares_in_both_orientations() -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    inverted_board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    inverted_board.switch_sides()
+
+    # when
+    result: Tuple[int, int] = (UciUtil.convert_uci_to_square("e1", board), UciUtil.convert_uci_to_square("e1", inverted_board))
+
+    # then
+    assert result == (60, 3)
+    assert board.board_array()[60] == inverted_board.board_array()[3] == PiecesEnum.WHITE.value | PiecesEnum.KING.value
+    assert UciUtil.convert_square_to_uci(0, board) == "a8"
+    assert UciUtil.convert_square_to_uci(0, inverted_board) == "h1"
+
+
+def test_convert_wrong_square() -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+
+    # when
+    with pytest.raises(IllegalArgumentException):
+        UciUtil.convert_uci_to_square("i9", board)
+
+    # then
+    with pytest.raises(IllegalArgumentException):
+        UciUtil.convert_square_to_uci(64, board)
+
+
+def test_convert_promotion_move() -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    move: int = MoveUtil.encode_move(12, 4, PiecesEnum.PAWN.value, SpecialFlags.PROMOTE_TO_KNIGHT.value)
+
+    # when
+    result: str = UciUtil.convert_move_to_uci(move, board)
+
+    # then
+    assert result == "e7e8n"
+    assert UciUtil.convert_move_to_uci(NO_MOVE, board) == "0000"
+
+
+def test_find_legal_move() -> None:
+    # given
+    board: GameBoard = GameBoard(FenMaker(FenData(PiecesEnum.WHITE.value)), MoveGenerator())
+    board.switch_sides()
+
+    # when
+    result: int = UciUtil.find_legal_move("g1f3", board, MoveGenerator())
+
+    # then
+    assert MoveUtil.get_moving_piece(result) == PiecesEnum.KNIGHT.value
+    assert UciUtil.convert_move_to_uci(result, board) == "g1f3"
+    assert UciUtil.find_legal_move("e2e5", board, MoveGenerator()) == NO_MOVE